@@ -1,56 +1,54 @@
-"""Entry-point."""
+"""Entry-point.
+
+Only the standard library is imported at module level. Qt, the style
+package and the window module are imported inside :func:`main` once the
+command line has been parsed, and the sidebar panels load on first use.
+"""
 
 from __future__ import annotations
 
 import argparse
+import os
 import sys
-from dataclasses import replace
+import time
 from importlib import import_module
 from pathlib import Path
 from typing import Any, Sequence
 
+# Reference point for the window's time-to-first-frame measurement.
+STARTUP_STARTED_NS = time.perf_counter_ns()
+
 # Ensure the local "src" directory is importable when running from the repo root.
 PROJECT_ROOT = Path(__file__).resolve().parent
 SRC_DIR = PROJECT_ROOT / "src"
 if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from src.ui import NotebookSidebarWidget, SettingsSidebarWidget
-from PySide6.QtCore import qInstallMessageHandler
-from theme.metrics import Metrics
-from theme.preferences import StylePreferences
-from utils.font_loader import load_bundled_fonts
-
-
-def qt_handler(mode, context, message):  # pragma: no cover - debug helper
-    print("QT:", message)
-
-def _load_qt_widgets():  # pragma: no cover - import helper
+PROFILE_IMPORTS_FLAG = "--profile-imports"
+TRACE_FLAG = "--trace"
+DIAGNOSTICS_FLAG = "--diagnostics"
+SINGLE_INSTANCE_FLAG = "--single-instance"
+CELL_RENDERER_FLAG = "--cell-renderer"
+SINGLE_INSTANCE_ENV_VAR = "LUNAQT_SINGLE_INSTANCE"
+# Launches using these flags want their own process and are never forwarded.
+FRESH_PROCESS_FLAGS = (
+    "-h",
+    "--help",
+    PROFILE_IMPORTS_FLAG,
+    TRACE_FLAG,
+    DIAGNOSTICS_FLAG,
+    CELL_RENDERER_FLAG,
+)
+
+
+def _load_qt_application():  # pragma: no cover - import helper
     try:
         widgets = import_module("PySide6.QtWidgets")
-        gui = import_module("PySide6.QtGui")
         core = import_module("PySide6.QtCore")
     except ModuleNotFoundError as exc:
         raise SystemExit("PySide6 must be installed to run LunaQt2.") from exc
 
-    return (
-        gui.QAction,
-        gui.QActionGroup,
-        widgets.QApplication,
-        widgets.QDockWidget,
-        widgets.QFrame,
-        widgets.QHBoxLayout,
-        widgets.QLabel,
-        widgets.QMainWindow,
-        widgets.QPushButton,
-        widgets.QSizePolicy,
-        widgets.QStatusBar,
-        widgets.QToolBar,
-        widgets.QVBoxLayout,
-        widgets.QWidget,
-        core.QEvent,
-        core.Qt,
-    )
+    return widgets.QApplication, core.QTimer, core.qInstallMessageHandler
 
 
 def _load_style_package():  # pragma: no cover - import helper
@@ -62,7 +60,18 @@ def _load_style_package():  # pragma: no cover - import helper
             "Unable to import 'style_loader' or 'theme'. Ensure the repo's 'src' directory is on PYTHONPATH."
         ) from exc
 
-    return styling.apply_global_style, theme_mod.ThemeMode
+    return styling, theme_mod
+
+
+def _load_theme_mode():  # pragma: no cover - import helper
+    try:
+        mode_mod = import_module("theme.mode")
+    except ModuleNotFoundError as exc:
+        raise SystemExit(
+            "Unable to import 'theme'. Ensure the repo's 'src' directory is on PYTHONPATH."
+        ) from exc
+
+    return mode_mod.ThemeMode
 
 
 def _load_constants():  # pragma: no cover - import helper
@@ -76,503 +85,303 @@ def _load_constants():  # pragma: no cover - import helper
     return constants
 
 
-(
-    QAction,
-    QActionGroup,
-    QApplication,
-    QDockWidget,
-    QFrame,
-    QHBoxLayout,
-    QLabel,
-    QMainWindow,
-    QPushButton,
-    QSizePolicy,
-    QStatusBar,
-    QToolBar,
-    QVBoxLayout,
-    QWidget,
-    QEvent,
-    Qt,
-) = _load_qt_widgets()
-QDockWidgetType = Any
-QPushButtonType = Any
-apply_global_style, ThemeMode = _load_style_package()
-constants_mod = _load_constants()
-DEFAULT_THEME_MODE = constants_mod.DEFAULT_THEME_MODE
-DEFAULT_SIDEBAR_WIDTH = constants_mod.DEFAULT_SIDEBAR_WIDTH
-MIN_SIDEBAR_WIDTH = constants_mod.MIN_SIDEBAR_WIDTH
-MAX_SIDEBAR_WIDTH = constants_mod.MAX_SIDEBAR_WIDTH
-DEFAULT_UI_FONT_POINT_SIZE = constants_mod.DEFAULT_UI_FONT_POINT_SIZE
-MIN_UI_FONT_POINT_SIZE = constants_mod.MIN_UI_FONT_POINT_SIZE
-MAX_UI_FONT_POINT_SIZE = constants_mod.MAX_UI_FONT_POINT_SIZE
-UI_FONT_SIZE_STEP = constants_mod.FONT_SIZE_STEP
-clamp_ui_font_point_size = constants_mod.clamp_ui_font_point_size
-AVAILABLE_UI_FONT_FAMILIES: Sequence[str] = tuple(constants_mod.BUNDLED_FONTS)
-if not AVAILABLE_UI_FONT_FAMILIES:
-    raise SystemExit("No bundled UI fonts configured. Add entries to assets.fonts.font_lists.BUNDLED_FONTS.")
-
-
-class CellRow(QWidget):
-    """Row that combines the gutter and the styled cell content."""
-
-    def __init__(
-        self,
-        index: int,
-        header_text: str,
-        body_text: str,
-        select_callback,
-        gutter_callback,
-    ) -> None:
-        super().__init__()
-        self._select_callback = select_callback
-        self._gutter_callback = gutter_callback
-        self._selected = False
-
-        row_layout = QHBoxLayout(self)
-        row_layout.setContentsMargins(0, 0, 0, 0)  # Margin between cells Left Top Right Bottom
-        row_layout.setSpacing(5)
-
-        self._gutter = QWidget()
-        self._gutter.setProperty("cellType", "gutter")
-        gutter_layout = QVBoxLayout(self._gutter)
-        gutter_layout.setContentsMargins(5, 0, 5, 0)  # Gutter margins Left Top Right Bottom
-        gutter_layout.setSpacing(0)
-
-        gutter_label = QLabel(f"{index:02d}")
-        gutter_label.setProperty("cellRole", "line-number")
-        gutter_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        gutter_layout.addStretch()
-        gutter_layout.addWidget(gutter_label)
-        gutter_layout.addStretch()
-
-        self._cell_frame = QFrame()
-        self._cell_frame.setProperty("cellType", "container")
-        cell_layout = QVBoxLayout(self._cell_frame)
-        cell_layout.setContentsMargins(0, 0, 0, 0)  # Cell content margins Left Top Right Bottom
-        cell_layout.setSpacing(5)
-
-        header = QLabel(header_text)
-        header.setProperty("cellPart", "header")
-        header.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        cell_layout.addWidget(header)
-
-        body = QLabel(body_text)
-        body.setProperty("cellPart", "body")
-        body.setWordWrap(True)
-        body.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        cell_layout.addWidget(body)
-
-        row_layout.addWidget(self._gutter)
-        row_layout.addWidget(self._cell_frame, 1)
-
-        self._gutter.installEventFilter(self)
-        self._cell_frame.installEventFilter(self)
-
-    def eventFilter(self, watched, event):  # pragma: no cover - UI behavior
-        if event.type() == QEvent.MouseButtonPress and event.button() == Qt.LeftButton:
-            if watched is self._cell_frame:
-                self._select_callback(self)
-                return True
-            if watched is self._gutter:
-                self._gutter_callback(self)
-                return True
-        return super().eventFilter(watched, event)
-
-    def set_selected(self, selected: bool) -> None:
-        if self._selected == selected:
-            return
-        self._selected = selected
-        state_value = "selected" if selected else ""
-        self._apply_state(self._cell_frame, state_value)
-        self._apply_state(self._gutter, state_value)
+def _load_window_class():  # pragma: no cover - import helper
+    return import_module("ui.main_window").LunaQtWindow
 
-    def is_selected(self) -> bool:
-        return self._selected
 
-    @staticmethod
-    def _apply_state(widget, state):
-        widget.setProperty("state", state)
-        widget.style().unpolish(widget)
-        widget.style().polish(widget)
+def _available_ui_font_families(constants_mod) -> Sequence[str]:
+    families: Sequence[str] = tuple(constants_mod.BUNDLED_FONTS)
+    if not families:
+        raise SystemExit("No bundled UI fonts configured. Add entries to assets.fonts.font_lists.BUNDLED_FONTS.")
+    return families
 
 
-class LunaQtWindow(QMainWindow):
-    """Main LunaQt2 window that lights up the different style modules."""
+def _start_import_profiler(argv: Sequence[str]) -> Any:
+    """Install the import profiler before anything heavy is imported."""
 
-    def __init__(
-        self,
-        app: Any,
-        mode,
-        *,
-        ui_font_choices: Sequence[str],
-        style_preferences: StylePreferences | None = None,
-    ) -> None:
-        super().__init__()
-        self._app = app
-        self._mode = mode
-        self._available_ui_fonts = list(ui_font_choices)
-        if not self._available_ui_fonts:
-            raise ValueError("At least one UI font choice must be provided.")
-        base_preferences = style_preferences or StylePreferences()
-        normalized_size = clamp_ui_font_point_size(base_preferences.ui_font_size)
-        if base_preferences.ui_font_size != normalized_size:
-            base_preferences = replace(base_preferences, ui_font_size=normalized_size)
-        if base_preferences.ui_font_family not in self._available_ui_fonts:
-            base_preferences = replace(base_preferences, ui_font_family=self._available_ui_fonts[0])
-        self._style_preferences = base_preferences
-        self._theme_group = QActionGroup(self)
-        self._theme_group.setExclusive(True)
-        self._theme_actions: dict[str, Any] = {}
-        self._cell_rows: list[CellRow] = []
-        self._notebooks_panel: NotebookSidebarWidget | None = None
-        self._settings_panel: SettingsSidebarWidget | None = None
-        self._notebooks_dock: QDockWidgetType | None = None
-        self._settings_dock: QDockWidgetType | None = None
-        self._notebooks_button: QPushButtonType | None = None
-        self._settings_button: QPushButtonType | None = None
-        self._move_up_button: QPushButtonType | None = None
-        self._move_down_button: QPushButtonType | None = None
-
-        self.setWindowTitle("LunaQt2")
-        self.resize(900, 600)
-
-        self._build_menubar()
-        self._build_toolbar()
-        self._build_central()
-        self._build_statusbar()
-        self._build_sidebars()
-        self._apply_current_style()
-
-    def _build_menubar(self) -> None:
-        menu_bar = self.menuBar()
-        menu_bar.setObjectName("MainMenuBar")
-
-        file_menu = menu_bar.addMenu("File")
-        file_menu.setProperty("menuRole", "primary")
-        file_menu.addAction("New")
-        file_menu.addAction("Save")
-        file_menu.addAction("Save As…")
-
-        edit_menu = menu_bar.addMenu("Edit")
-        edit_menu.setProperty("menuRole", "primary")
-        edit_menu.addAction("Move Cell Up")
-        edit_menu.addAction("Move Cell Down")
-        edit_menu.addSeparator()
-        edit_menu.addAction("Delete Cell")
-        edit_menu.addAction("Delete Notebook")
-
-        view_menu = menu_bar.addMenu("View")
-        view_menu.setProperty("menuRole", "primary")
-
-        for label, mode_value in (("Light Mode", ThemeMode.LIGHT), ("Dark Mode", ThemeMode.DARK)):
-            action = QAction(label, self)
-            action.setCheckable(True)
-            action.triggered.connect(lambda checked, m=mode_value: self._switch_theme(m) if checked else None)
-            view_menu.addAction(action)
-            self._theme_group.addAction(action)
-            self._theme_actions[mode_value.value] = action
-
-        # Ensure the action that matches the current theme is checked.
-        self._theme_actions[self._mode.value].setChecked(True)
-
-        self._install_cell_action_buttons(menu_bar)
-        self._install_sidebar_corner_buttons(menu_bar)
-
-    def _install_cell_action_buttons(self, menu_bar) -> None:
-        """Store button references to be added to corner widget."""
-        move_up_btn = QPushButton("Move cell up ↑")
-        move_up_btn.setProperty("btnType", "menubar")
-        move_up_btn.setToolTip("Move Cell Up")
-        #move_up_btn.setFixedWidth(32)
-        move_up_btn.clicked.connect(self._on_move_cell_up_clicked)
-        
-        move_down_btn = QPushButton("Move cell down ↓")
-        move_down_btn.setProperty("btnType", "menubar")
-        move_down_btn.setToolTip("Move Cell Down")
-        #move_down_btn.setFixedWidth(32)
-        move_down_btn.clicked.connect(self._on_move_cell_down_clicked)
-        
-        self._move_up_button = move_up_btn
-        self._move_down_button = move_down_btn
-
-    def _install_sidebar_corner_buttons(self, menu_bar) -> None: # The buttons Settings, Notebooks and so on
-        corner = QWidget(menu_bar)
-        corner.setProperty("widgetRole", "menubar-corner")
-        layout = QHBoxLayout(corner)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(10)
-
-        # Add cell action buttons first
-        if hasattr(self, '_move_up_button') and hasattr(self, '_move_down_button'):
-            layout.addWidget(self._move_up_button)
-            layout.addWidget(self._move_down_button)
-
-        notebooks_button = QPushButton("Notebooks", corner)
-        notebooks_button.setCheckable(True)
-        notebooks_button.setProperty("btnType", "menubar")
-        notebooks_button.toggled.connect(lambda checked: (self._toggle_notebooks_sidebar(checked), self._refresh_button_style(notebooks_button)))
-        layout.addWidget(notebooks_button)
-
-        settings_button = QPushButton("Settings", corner)
-        settings_button.setCheckable(True)
-        settings_button.setProperty("btnType", "menubar")
-        settings_button.toggled.connect(lambda checked: (self._toggle_settings_sidebar(checked), self._refresh_button_style(settings_button)))
-        layout.addWidget(settings_button)
-
-        layout.addStretch(1)
-        menu_bar.setCornerWidget(corner, Qt.Corner.TopRightCorner)
-
-        self._notebooks_button = notebooks_button
-        self._settings_button = settings_button
-
-    def _build_toolbar(self) -> None:
-        toolbar = QToolBar("Main Toolbar")
-        toolbar.setObjectName("PrimaryToolBar")
-        toolbar.setMovable(False)
-        primary_btn = QPushButton("Primary")
-        primary_btn.setProperty("btnType", "primary")
-
-        toolbar_btn = QPushButton("Toolbar")
-        toolbar_btn.setProperty("btnType", "toolbar")
-
-        warn_btn = QPushButton("Warn")
-        warn_btn.setProperty("btnType", "warning")
-
-        toolbar.addWidget(primary_btn)
-        toolbar.addWidget(toolbar_btn)
-        toolbar.addWidget(warn_btn)
-
-        self.addToolBar(toolbar)
-
-    def _build_central(self) -> None:
-        central = QWidget()
-        layout = QVBoxLayout(central)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
-        cell_list = QWidget()
-        cell_list.setProperty("cellType", "list")
-        list_layout = QVBoxLayout(cell_list)
-        list_layout.setContentsMargins(5, 5, 5, 5)
-        list_layout.setSpacing(0)
-
-        sample_cells = [
-            (
-                "Notebook Cell",
-                "Cells use the container styling, letting you compose editors, tables, or any widget inside.",
-            ),
-            (
-                "Selection Support",
-                "Click the body to focus a cell. Click the gutter again to clear selection and reset the border.",
-            ),
-            (
-                "Custom Content",
-                "Swap these labels for your own widgets; LunaQt2 just showcases layout and styling hooks.",
-            ),
-        ]
-
-        for index, (header_text, body_text) in enumerate(sample_cells, start=1):
-            row = CellRow(
-                index=index,
-                header_text=header_text,
-                body_text=body_text,
-                select_callback=self._handle_cell_selected,
-                gutter_callback=self._handle_gutter_clicked,
-            )
-            self._cell_rows.append(row)
-            list_layout.addWidget(row)
-
-        list_layout.addStretch()
-        layout.addWidget(cell_list)
-        layout.addStretch()
-
-        self.setCentralWidget(central)
-
-    def _build_statusbar(self) -> None:
-        status = QStatusBar()
-        status.setObjectName("MainStatusBar")
-        status.showMessage("Ready")
-
-        warning_label = QLabel("Unsaved changes")
-        warning_label.setProperty("statusRole", "warning")
-        status.addPermanentWidget(warning_label)
-
-        self.setStatusBar(status)
-
-    def _build_sidebars(self) -> None:
-        notebooks_dock = self._create_sidebar_dock("NotebooksDock", "Notebooks")
-        notebooks_panel = NotebookSidebarWidget(self)
-        notebooks_dock.setWidget(notebooks_panel)
-        notebooks_dock.hide()
-
-        settings_dock = self._create_sidebar_dock("SettingsDock", "Settings")
-        settings_panel = SettingsSidebarWidget(
-            self,
-            ui_font_size=self._style_preferences.ui_font_size,
-            ui_font_family=self._style_preferences.ui_font_family,
-            ui_font_choices=list(self._available_ui_fonts),
-            min_font_size=MIN_UI_FONT_POINT_SIZE,
-            max_font_size=MAX_UI_FONT_POINT_SIZE,
-            step=UI_FONT_SIZE_STEP,
-        )
-        settings_panel.ui_font_size_changed.connect(self._handle_ui_font_size_changed)
-        settings_panel.ui_font_family_changed.connect(self._handle_ui_font_family_changed)
-        settings_dock.setWidget(settings_panel)
-        settings_dock.hide()
-
-        self._notebooks_dock = notebooks_dock
-        self._settings_dock = settings_dock
-        self._notebooks_panel = notebooks_panel
-        self._settings_panel = settings_panel
-
-    def _create_sidebar_dock(self, object_name: str, title: str) -> QDockWidgetType:
-        dock = QDockWidget(title, self)
-        dock.setObjectName(object_name)
-        dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-        dock.setFeatures(QDockWidget.DockWidgetFeature.NoDockWidgetFeatures)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, dock)
-        return dock
-
-    def _normalize_sidebar_width(self, desired: int | None) -> int:
-        width = desired or DEFAULT_SIDEBAR_WIDTH
-        width = max(width, MIN_SIDEBAR_WIDTH)
-        if MAX_SIDEBAR_WIDTH:
-            width = min(width, MAX_SIDEBAR_WIDTH)
-        return width
-
-    def _apply_sidebar_width(self, dock: QDockWidgetType) -> None:
-        width = self._normalize_sidebar_width(DEFAULT_SIDEBAR_WIDTH)
-        try:
-            self.resizeDocks([dock], [width], Qt.Orientation.Horizontal)
-        except Exception:
-            pass
-
-    def _refresh_button_style(self, button: QPushButtonType) -> None:
-        """Force Qt to reapply button styling after state change."""
-        button.style().unpolish(button)
-        button.style().polish(button)
-        button.update()
-
-    def _toggle_notebooks_sidebar(self, checked: bool) -> None:
-        if not self._notebooks_dock:
-            return
-        if checked:
-            if self._settings_button:
-                self._settings_button.setChecked(False)
-            self._notebooks_dock.show()
-            self._apply_sidebar_width(self._notebooks_dock)
-        else:
-            self._notebooks_dock.hide()
-
-    def _toggle_settings_sidebar(self, checked: bool) -> None:
-        if not self._settings_dock:
-            return
-        if checked:
-            if self._notebooks_button:
-                self._notebooks_button.setChecked(False)
-            self._settings_dock.show()
-            self._apply_sidebar_width(self._settings_dock)
-        else:
-            self._settings_dock.hide()
-
-    def _current_metrics(self) -> Metrics:
-        return self._style_preferences.build_metrics()
-
-    def _apply_current_style(self) -> None:
-        apply_global_style(self._app, mode=self._mode, metrics=self._current_metrics())
-        for row in self._cell_rows:
-            row.set_selected(row.is_selected())
-
-    def _switch_theme(self, mode) -> None:
-        if mode == self._mode:
-            return
-        self._mode = mode
-        self._apply_current_style()
-
-    def _handle_cell_selected(self, row: CellRow) -> None:
-        for candidate in self._cell_rows:
-            candidate.set_selected(candidate is row)
-
-    def _handle_gutter_clicked(self, row: CellRow) -> None:
-        if row.is_selected():
-            row.set_selected(False)
-        else:
-            self._handle_cell_selected(row)
-
-    def _handle_ui_font_size_changed(self, point_size: int) -> None:
-        clamped_size = clamp_ui_font_point_size(point_size)
-        if clamped_size == self._style_preferences.ui_font_size:
-            return
-        self._style_preferences = replace(self._style_preferences, ui_font_size=clamped_size)
-        self._apply_current_style()
+    if PROFILE_IMPORTS_FLAG not in argv:
+        return None
+    profiler = import_module("utils.import_profiler").ImportProfiler()
+    profiler.install()
+    return profiler
 
-    def _handle_ui_font_family_changed(self, font_family: str) -> None:
-        normalized_family = font_family.strip()
-        if not normalized_family:
-            return
-        if normalized_family not in self._available_ui_fonts:
-            return
-        if normalized_family == self._style_preferences.ui_font_family:
-            return
-        self._style_preferences = replace(
-            self._style_preferences,
-            ui_font_family=normalized_family,
-        )
-        self._apply_current_style()
 
-    def _on_move_cell_up_clicked(self) -> None:
-        """Placeholder: Move the selected cell up in the list."""
-        pass  # TODO: Implement cell reordering logic
+def _single_instance_requested(args: argparse.Namespace) -> bool:
+    """Single-instance mode is opt-in, by flag or ``LUNAQT_SINGLE_INSTANCE=1``."""
 
-    def _on_move_cell_down_clicked(self) -> None:
-        """Placeholder: Move the selected cell down in the list."""
-        pass  # TODO: Implement cell reordering logic
+    if args.single_instance:
+        return True
+    return os.environ.get(SINGLE_INSTANCE_ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
 
 
-def parse_args() -> argparse.Namespace:
+def _forward_launch(argv: Sequence[str]) -> bool:
+    """Hand ``argv`` to an already running instance; True means this process can exit."""
+
+    if any(arg.split("=", 1)[0] in FRESH_PROCESS_FLAGS for arg in argv):
+        return False
+    return import_module("utils.single_instance").forward_to_running_instance(argv)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    ThemeMode = _load_theme_mode()
+    constants_mod = _load_constants()
     parser = argparse.ArgumentParser(description="Run the LunaQt2 window")
+    parser.add_argument("paths", nargs="*", metavar="FILE", help="Notebook files to open")
     parser.add_argument(
         "--mode",
         choices=[mode.value for mode in ThemeMode],
-        default=DEFAULT_THEME_MODE.value,
-        help="Theme mode to use when applying the stylesheet",
+        default=None,
+        help=f"Theme mode to use when applying the stylesheet "
+        f"(default: last session, else {constants_mod.DEFAULT_THEME_MODE.value})",
+    )
+    parser.add_argument(
+        PROFILE_IMPORTS_FLAG,
+        action="store_true",
+        help="Print per-module import times after the first frame and on exit",
+    )
+    parser.add_argument(
+        DIAGNOSTICS_FLAG,
+        metavar="DIR",
+        nargs="?",
+        const="diagnostics",
+        default=None,
+        help="Write rendered QSS, metrics, font registry and Qt messages to DIR "
+        "(default ./diagnostics; also enabled by LUNAQT_DIAGNOSTICS=DIR)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        TRACE_FLAG,
+        metavar="OUT_JSON",
+        default=None,
+        help="Record startup/restyle spans and write them as Chrome trace (Perfetto) JSON on exit",
+    )
+    parser.add_argument(
+        CELL_RENDERER_FLAG,
+        choices=constants_mod.CELL_RENDERERS,
+        default=constants_mod.DEFAULT_CELL_RENDERER,
+        help="Paint cells with the item delegate or build a widget per visible cell "
+        f"(default: {constants_mod.DEFAULT_CELL_RENDERER})",
+    )
+    parser.add_argument(
+        "--new-window",
+        action="store_true",
+        help="When LunaQt2 is already running, open another window instead of raising the existing one",
+    )
+    parser.add_argument(
+        SINGLE_INSTANCE_FLAG,
+        action="store_true",
+        help="Hand this launch to an already running LunaQt2 and serve later launches "
+        f"(also {SINGLE_INSTANCE_ENV_VAR}=1)",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
-    mode = ThemeMode(args.mode)
-    ui_font_point_size = clamp_ui_font_point_size(DEFAULT_UI_FONT_POINT_SIZE)
-    default_ui_family = AVAILABLE_UI_FONT_FAMILIES[0]
-    style_preferences = StylePreferences(
+def _load_tracing():  # pragma: no cover - import helper
+    return import_module("utils.tracing")
+
+
+def _start_diagnostics(args: argparse.Namespace) -> Any:
+    """Return the diagnostics module when enabled by flag or environment, else None."""
+
+    diagnostics = import_module("utils.diagnostics")
+    out_dir = args.diagnostics or diagnostics.diagnostics_dir_from_env()
+    if out_dir is None:
+        return None
+    diagnostics.enable_diagnostics(out_dir)
+    return diagnostics
+
+
+def _load_session_module():  # pragma: no cover - import helper
+    return import_module("utils.session")
+
+
+def _theme_mode_or_none(ThemeMode, value: str | None) -> Any:
+    if value is None:
+        return None
+    try:
+        return ThemeMode(value)
+    except ValueError:
+        return None
+
+
+def _launch(
+    args: argparse.Namespace,
+    tracing,
+    diagnostics,
+    *,
+    instance_argv: Sequence[str] | None = None,
+) -> tuple[Any, Any, Any]:
+    """Create the application and show the main window.
+
+    Returns ``(app, window, make_window)``; ``make_window(mode)`` builds
+    further windows that share the first one's preferences. With
+    ``instance_argv`` the instance server is claimed as soon as the
+    application exists.
+    """
+
+    ThemeMode = _load_theme_mode()
+    constants_mod = _load_constants()
+    available_ui_font_families = _available_ui_font_families(constants_mod)
+
+    # The previous session decides the first stylesheet, so it is read before any style work.
+    session_mod = _load_session_module()
+    session_path = session_mod.default_session_path()
+    with tracing.span("load session"):
+        session = session_mod.load_session(session_path) or session_mod.SessionSnapshot()
+
+    mode = (
+        _theme_mode_or_none(ThemeMode, args.mode)
+        or _theme_mode_or_none(ThemeMode, session.mode)
+        or constants_mod.DEFAULT_THEME_MODE
+    )
+    with tracing.span("import style package"):
+        styling, theme_mod = _load_style_package()
+    ui_font_point_size = constants_mod.clamp_ui_font_point_size(
+        session.ui_font_size or constants_mod.DEFAULT_UI_FONT_POINT_SIZE
+    )
+    ui_font_family = (
+        session.ui_font_family
+        if session.ui_font_family in available_ui_font_families
+        else available_ui_font_families[0]
+    )
+    style_preferences = theme_mod.StylePreferences(
         ui_font_size=ui_font_point_size,
-        ui_font_family=default_ui_family,
+        ui_font_family=ui_font_family,
     )
+    notebook_theme = theme_mod.NotebookTheme(mode=_theme_mode_or_none(ThemeMode, session.notebook_mode))
     initial_metrics = style_preferences.build_metrics()
 
-    app = QApplication(sys.argv)
-    load_bundled_fonts()
-    qInstallMessageHandler(qt_handler)
-    # Debug: dump the exact stylesheet string Qt will parse
-    try:
-        from style_loader import build_application_qss  # type: ignore
-
-        qss_dump = build_application_qss(mode=mode, metrics=initial_metrics)
-        with open("qss_runtime_dump.txt", "w", encoding="utf-8") as f:
-            f.write(qss_dump)
-    except Exception as e:  # pragma: no cover - debug only
-        print("Error while dumping runtime QSS:", e)
-
-    apply_global_style(app, mode=mode, metrics=initial_metrics)
+    with tracing.span("QApplication"):
+        QApplication, _, qInstallMessageHandler = _load_qt_application()
+        app = QApplication(sys.argv)
+    attach_instance_server = None
+    if instance_argv is not None:
+        with tracing.span("claim instance server"):
+            attach_instance_server = _claim_instance_server(app, instance_argv)
+    font_registry = import_module("utils.font_loader").get_font_registry()
+    font_registry.ensure_family(style_preferences.ui_font_family)
+    if diagnostics is not None:
+        diagnostics.install_qt_message_handler(qInstallMessageHandler)
+
+    styling.apply_global_style(app, mode=mode, metrics=initial_metrics)
+
+    with tracing.span("import window"):
+        LunaQtWindow = _load_window_class()
+
+    def make_window(window_mode, **kwargs: Any) -> Any:
+        return LunaQtWindow(
+            app,
+            window_mode,
+            ui_font_choices=available_ui_font_families,
+            style_preferences=style_preferences,
+            notebook_theme=notebook_theme,
+            font_registry=font_registry,
+            cell_renderer=args.cell_renderer,
+            **kwargs,
+        )
 
-    window = LunaQtWindow(
-        app,
+    window = make_window(
         mode,
-        ui_font_choices=AVAILABLE_UI_FONT_FAMILIES,
-        style_preferences=style_preferences,
+        startup_started_ns=STARTUP_STARTED_NS,
+        session=session,
+        session_path=session_path,
+    )
+    with tracing.span("LunaQtWindow.show"):
+        window.show()
+    window.start_idle_font_preload()
+    if args.paths:
+        window.open_paths([str(Path(path).resolve()) for path in args.paths])
+    if diagnostics is not None:
+        diagnostics.record_font_registry(font_registry)
+    if attach_instance_server is not None:
+        attach_instance_server(window, make_window)
+    return app, window, make_window
+
+
+def _claim_instance_server(app, argv: Sequence[str]) -> Any:
+    """Serve launches forwarded by later ``main.py`` invocations.
+
+    Returns ``attach(window, make_window)``, or None when this process runs
+    on its own. Launches forwarded before ``attach`` is called are queued and
+    served once the first window exists. If another instance claimed the
+    server since this launch tried to forward, ``argv`` is handed to it and
+    this process exits.
+    """
+
+    single_instance = import_module("utils.single_instance")
+    ThemeMode = _load_theme_mode()
+    windows: list[Any] = []
+    pending: list[tuple[list[str], str]] = []
+    make_window = None
+
+    def handle(argv: list[str], cwd: str) -> None:
+        if make_window is None:
+            pending.append((argv, cwd))
+            return
+        try:
+            request = parse_args(argv)
+        except SystemExit:
+            return
+        target = next((candidate for candidate in reversed(windows) if candidate.isVisible()), None)
+        mode = ThemeMode(request.mode) if request.mode else None
+        if request.new_window or target is None:
+            target = make_window(mode or windows[0].theme_mode)
+            windows.append(target)
+            target.show()
+        elif mode is not None:
+            target.set_theme_mode(mode)
+        if request.paths:
+            target.open_paths([str((Path(cwd) / path).resolve()) for path in request.paths])
+        target.bring_to_front()
+
+    def attach(window, window_factory) -> None:
+        nonlocal make_window
+        windows.append(window)
+        make_window = window_factory
+        queued = pending[:]
+        pending.clear()
+        for queued_argv, cwd in queued:
+            handle(queued_argv, cwd)
+
+    if single_instance.start_instance_server(handle, app) is not None:
+        return attach
+    if single_instance.forward_to_running_instance(argv):
+        raise SystemExit(0)
+    print(
+        f"LunaQt2: {single_instance.instance_server_name()} is taken by an instance that does not answer; "
+        "running without single-instance mode.",
+        file=sys.stderr,
     )
-    window.show()
+    return None
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    import_profiler = _start_import_profiler(argv)
+    # Parsed before forwarding, so a bad command line fails in this process with argparse's exit status.
+    args = parse_args(argv)
+    single_instance = _single_instance_requested(args)
+    if single_instance and _forward_launch(argv):
+        return
+    tracing = _load_tracing()
+    if args.trace:
+        tracing.enable_tracing()
+    diagnostics = _start_diagnostics(args)
+    with tracing.span("startup"):
+        app, window, make_window = _launch(
+            args,
+            tracing,
+            diagnostics,
+            instance_argv=argv if single_instance else None,
+        )
+
+    if import_profiler is not None:
+        window.first_frame_shown.connect(lambda _ms: import_profiler.report("Imports before first frame"))
+        app.aboutToQuit.connect(lambda: import_profiler.report("Imports after first frame"))
+    if args.trace:
+        app.aboutToQuit.connect(lambda: tracing.export_chrome_trace(args.trace))
+    if diagnostics is not None:
+        window.first_frame_shown.connect(diagnostics.record_first_frame)
+        app.aboutToQuit.connect(diagnostics.disable_diagnostics)
 
     sys.exit(app.exec())
 
@@ -1,7 +1,8 @@
 """Font lists configuration.
 
 This module defines lists of fonts used in the application.
-All fonts listed here are bundled with the application and loaded at startup.
+All fonts listed here are bundled with the application. Only the active UI
+family is registered at startup; the others register on first use.
 This ensures consistent typography across all platforms (Windows, macOS, Linux).
 
 Font categories:
@@ -29,6 +30,43 @@ BUNDLED_CODE_FONTS = [
     "OpenDyslexic",  # Accessible font for dyslexic readers
 ]
 
+# Folder under assets/fonts holding each bundled family's font files
+BUNDLED_FONT_DIRECTORIES = {
+    "Inter": "Inter",
+    "Figtree": "Figtree",
+    "Fira Code": "FiraCode",
+    "Comic Neue": "ComicNeue",
+    "OpenDyslexic": "OpenDyslexic",
+}
+
+# Unicode ranges used by src/tools/subset_fonts.py (fontTools syntax)
+FONT_SUBSET_UNICODE_RANGES = {
+    "latin": "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,"
+    "U+2000-206F,U+2074,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD",
+    "latin-ext": "U+0100-024F,U+0259,U+1E00-1EFF,U+2020,U+20A0-20AB,U+20AD-20CF,"
+    "U+2113,U+2C60-2C7F,U+A720-A7FF",
+    "greek": "U+0370-03FF",
+    "cyrillic": "U+0400-045F,U+0490-0491,U+04B0-04B1,U+2116",
+    "math": "U+00B1,U+00D7,U+00F7,U+2070-209F,U+2190-21FF,U+2200-22FF",
+}
+
+# Ranges kept per locale when subsetting; the union is used for several locales
+FONT_SUBSET_LOCALES = {
+    "en": ("latin", "greek", "math"),
+    "de": ("latin", "latin-ext", "greek", "math"),
+    "fr": ("latin", "latin-ext", "greek", "math"),
+    "es": ("latin", "latin-ext", "greek", "math"),
+    "pl": ("latin", "latin-ext", "greek", "math"),
+    "ru": ("latin", "cyrillic", "greek", "math"),
+}
+DEFAULT_FONT_SUBSET_LOCALE = "en"
+
+# Weights always kept in subsets, on top of those referenced by the QSS
+FONT_SUBSET_BASE_WEIGHTS = (400, 700)
+
+# Register fonts from assets/fonts/subsets/ when the subset tool has been run
+PREFER_SUBSET_FONTS = True
+
 # Default font selections
 DEFAULT_UI_FONT = "Inter"
 DEFAULT_CODE_FONT = "Fira Code"
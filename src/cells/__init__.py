@@ -0,0 +1,48 @@
+"""Notebook cells: the document model, cell types and the registry that loads them on demand."""
+
+from .data import CellBodyStyle, CellData
+from .document import (
+    CHANGE_INSERT,
+    CHANGE_MOVE,
+    CHANGE_REMOVE,
+    CHANGE_RESET,
+    CHANGE_UPDATE,
+    CellRecord,
+    DocumentChange,
+    DocumentListener,
+    NotebookDocument,
+    as_records,
+)
+from .registry import (
+    CellTypeSpec,
+    find_cell_type,
+    is_loaded,
+    known_cell_types,
+    load_cell_type,
+    load_cell_types,
+    loaded_cell_modules,
+    register_cell_type,
+)
+
+__all__ = [
+    "CHANGE_INSERT",
+    "CHANGE_MOVE",
+    "CHANGE_REMOVE",
+    "CHANGE_RESET",
+    "CHANGE_UPDATE",
+    "CellBodyStyle",
+    "CellData",
+    "CellRecord",
+    "CellTypeSpec",
+    "DocumentChange",
+    "DocumentListener",
+    "NotebookDocument",
+    "as_records",
+    "find_cell_type",
+    "is_loaded",
+    "known_cell_types",
+    "load_cell_type",
+    "load_cell_types",
+    "loaded_cell_modules",
+    "register_cell_type",
+]
@@ -0,0 +1,28 @@
+"""Plain data describing a notebook cell."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CellData:
+    """One cell: its registered type plus the text it displays."""
+
+    cell_type: str
+    header: str
+    body: str
+
+
+@dataclass(frozen=True, slots=True)
+class CellBodyStyle:
+    """How the cell delegate paints a body; plugins return one from ``body_style``."""
+
+    font_family: str | None = None  # None uses the theme's UI font
+    background: str | None = None  # None leaves the container background
+    padding: int = 0
+    radius: int = 0
+    wrap: bool = True
+
+
+__all__ = ["CellBodyStyle", "CellData"]
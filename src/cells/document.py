@@ -0,0 +1,350 @@
+"""Notebook document: ordered cell records, independent of any widget.
+
+Cells are compact :class:`CellRecord` values kept in insertion order. The
+``id -> position`` index splits the ids into blocks of up to
+``INDEX_BLOCK_SIZE``, like the view's height index: each id maps to its block
+and its offset in that block, and the blocks keep their start positions. A
+lookup is one dict lookup plus an addition. An insert, removal or move
+rewrites the offsets in the blocks it touches and the O(n / block) block
+starts behind them, never the ids of untouched blocks. Listeners receive one
+:class:`DocumentChange` per edit, describing a contiguous range, before and
+after it is applied.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Protocol
+
+from utils.id_generator import generate_cell_id, generate_cell_ids, generate_notebook_id
+
+from .data import CellData
+
+CHANGE_INSERT = "insert"
+CHANGE_REMOVE = "remove"
+CHANGE_MOVE = "move"
+CHANGE_UPDATE = "update"
+CHANGE_RESET = "reset"
+
+# Shared by every record without metadata, so plain cells cost no extra dict.
+NO_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+INDEX_BLOCK_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class CellRecord:
+    """One stored cell. Carries the :class:`CellData` fields, so cell plugins accept it as is."""
+
+    id: str
+    cell_type: str
+    header: str
+    body: str
+    metadata: Mapping[str, Any] = field(default_factory=lambda: NO_METADATA)
+
+    @classmethod
+    def new(cls, cell_type: str, header: str = "", body: str = "", metadata: Mapping[str, Any] | None = None) -> "CellRecord":
+        return cls(generate_cell_id(), cell_type, header, body, _frozen_metadata(metadata))
+
+
+def _frozen_metadata(metadata: Mapping[str, Any] | None) -> Mapping[str, Any]:
+    return MappingProxyType(dict(metadata)) if metadata else NO_METADATA
+
+
+def as_records(cells: Iterable[CellRecord | CellData]) -> list[CellRecord]:
+    """Return records for ``cells``; plain :class:`CellData` gets fresh ids, drawn in one batch."""
+    cells = list(cells)
+    new_ids = iter(generate_cell_ids(sum(1 for cell in cells if not isinstance(cell, CellRecord))))
+    return [
+        cell if isinstance(cell, CellRecord) else CellRecord(next(new_ids), cell.cell_type, cell.header, cell.body, NO_METADATA)
+        for cell in cells
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentChange:
+    """A contiguous edit: ``count`` rows starting at ``first``.
+
+    For moves, ``destination`` is the position the rows are moved in front
+    of, counted before the move (Qt's ``beginMoveRows`` convention).
+    """
+
+    kind: str
+    first: int = 0
+    count: int = 0
+    destination: int | None = None
+
+
+@dataclass(slots=True, eq=False)
+class _IdBlock:
+    """Consecutive cell ids; ``index`` is the block's position in the index."""
+
+    ids: list[str]
+    index: int = 0
+
+
+class DocumentListener(Protocol):
+    def document_changing(self, change: DocumentChange) -> None: ...
+
+    def document_changed(self, change: DocumentChange) -> None: ...
+
+
+class NotebookDocument:
+    """Ordered cells of one notebook with an ``id -> position`` index."""
+
+    def __init__(self, records: Iterable[CellRecord | CellData] = (), *, notebook_id: str | None = None) -> None:
+        self.notebook_id = notebook_id or generate_notebook_id()
+        self._records: list[CellRecord] = as_records(records)
+        self._locations: dict[str, tuple[_IdBlock, int]] = {}
+        self._blocks: list[_IdBlock] = []
+        self._block_starts: list[int] = [0]
+        self._listeners: list[DocumentListener] = []
+        self._reindex()
+        if len(self._locations) != len(self._records):
+            raise ValueError("Cell ids must be unique within a notebook.")
+
+    def add_listener(self, listener: DocumentListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: DocumentListener) -> None:
+        self._listeners.remove(listener)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[CellRecord]:
+        return iter(self._records)
+
+    def __getitem__(self, position: int) -> CellRecord:
+        return self._records[position]
+
+    def __contains__(self, cell_id: object) -> bool:
+        return cell_id in self._locations
+
+    def records(self, first: int = 0, count: int | None = None) -> list[CellRecord]:
+        end = len(self._records) if count is None else first + count
+        return self._records[first:end]
+
+    def record(self, cell_id: str) -> CellRecord:
+        return self._records[self.index_of(cell_id)]
+
+    def index_of(self, cell_id: str) -> int:
+        """Return the position of ``cell_id`` in O(1); raises ``KeyError`` if absent."""
+        block, offset = self._locations[cell_id]
+        return self._block_starts[block.index] + offset
+
+    def insert(self, position: int, records: Iterable[CellRecord | CellData]) -> list[str]:
+        """Insert cells before ``position``; returns their ids."""
+        new_records = as_records(records)
+        if not new_records:
+            return []
+        position = max(0, min(position, len(self._records)))
+        new_ids = [record.id for record in new_records]
+        if len(set(new_ids)) != len(new_ids) or any(cell_id in self._locations for cell_id in new_ids):
+            raise ValueError("Cell ids must be unique within a notebook.")
+        change = DocumentChange(CHANGE_INSERT, position, len(new_records))
+        self._notify_changing(change)
+        self._records[position:position] = new_records
+        self._index_insert(position, new_ids)
+        self._notify_changed(change)
+        return new_ids
+
+    def append(self, records: Iterable[CellRecord | CellData]) -> list[str]:
+        return self.insert(len(self._records), records)
+
+    def remove(self, first: int, count: int = 1) -> list[CellRecord]:
+        """Remove ``count`` cells starting at ``first``; returns the removed records."""
+        if count <= 0:
+            return []
+        if first < 0 or first + count > len(self._records):
+            raise IndexError(first)
+        change = DocumentChange(CHANGE_REMOVE, first, count)
+        self._notify_changing(change)
+        removed = self._records[first:first + count]
+        del self._records[first:first + count]
+        self._index_remove(first, count)
+        self._notify_changed(change)
+        return removed
+
+    def move(self, first: int, count: int, destination: int) -> bool:
+        """Move ``count`` cells starting at ``first`` in front of ``destination``.
+
+        ``destination`` is counted before the move; moving onto the block
+        itself (``first <= destination <= first + count``) is a no-op and
+        returns False.
+        """
+        end = first + count
+        if count <= 0 or first < 0 or end > len(self._records):
+            raise IndexError(first)
+        if not 0 <= destination <= len(self._records):
+            raise IndexError(destination)
+        if first <= destination <= end:
+            return False
+        change = DocumentChange(CHANGE_MOVE, first, count, destination)
+        self._notify_changing(change)
+        block = self._records[first:end]
+        if destination < first:
+            self._records[destination + count:end] = self._records[destination:first]
+            self._records[destination:destination + count] = block
+            target = destination
+        else:
+            self._records[first:destination - count] = self._records[end:destination]
+            self._records[destination - count:destination] = block
+            target = destination - count
+        # In the index a move is a removal and an insert; the span in between only shifts block starts.
+        self._index_remove(first, count)
+        self._index_insert(target, [record.id for record in block])
+        self._notify_changed(change)
+        return True
+
+    def move_by(self, first: int, count: int, offset: int) -> int:
+        """Move ``count`` cells starting at ``first`` by ``offset`` rows (negative is up).
+
+        The offset is clamped to the notebook; returns the block's new first row.
+        """
+        target = max(0, min(first + offset, len(self._records) - count))
+        if target < first:
+            self.move(first, count, target)
+        elif target > first:
+            self.move(first, count, target + count)
+        return target
+
+    def move_ranges(self, ranges: Iterable[range], offset: int) -> list[range]:
+        """Move every block in ``ranges`` by ``offset`` rows; returns where the blocks ended up.
+
+        Each block is one :meth:`move`. A block stopped by the notebook edge
+        stops the blocks behind it, which then close up against it, so the
+        blocks keep their order.
+        """
+        blocks: list[list[int]] = []
+        for block in sorted((block.start, block.stop) for block in ranges if len(block)):
+            if blocks and block[0] <= blocks[-1][1]:
+                blocks[-1][1] = max(blocks[-1][1], block[1])
+            else:
+                blocks.append(list(block))
+        moved: list[range] = []
+        if offset <= 0:
+            # Top-down: moving a block up never shifts the blocks below it.
+            limit = 0
+            for start, stop in blocks:
+                count = stop - start
+                target = max(start + offset, limit)
+                if target < start:
+                    self.move(start, count, target)
+                limit = target + count
+                moved.append(range(target, limit))
+        else:
+            # Bottom-up, for the same reason.
+            limit = len(self._records)
+            for start, stop in reversed(blocks):
+                count = stop - start
+                target_stop = min(stop + offset, limit)
+                if target_stop > stop:
+                    self.move(start, count, target_stop)
+                limit = target_stop - count
+                moved.append(range(limit, target_stop))
+            moved.reverse()
+        return moved
+
+    def update(self, position: int, **changes: Any) -> CellRecord:
+        """Replace fields of the cell at ``position`` (its id is kept)."""
+        changes.pop("id", None)
+        if "metadata" in changes:
+            changes["metadata"] = _frozen_metadata(changes["metadata"])
+        record = replace(self._records[position], **changes)
+        change = DocumentChange(CHANGE_UPDATE, position, 1)
+        self._notify_changing(change)
+        self._records[position] = record
+        self._notify_changed(change)
+        return record
+
+    def reset(self, records: Iterable[CellRecord | CellData]) -> None:
+        new_records = as_records(records)
+        change = DocumentChange(CHANGE_RESET, 0, len(new_records))
+        self._notify_changing(change)
+        self._records = new_records
+        self._reindex()
+        self._notify_changed(change)
+
+    def _reindex(self) -> None:
+        self._locations = {}
+        self._blocks = []
+        self._splice_blocks(0, 0, [record.id for record in self._records])
+
+    def _locate_block(self, position: int) -> int:
+        return min(bisect_right(self._block_starts, position) - 1, len(self._blocks) - 1)
+
+    def _index_insert(self, position: int, new_ids: list[str]) -> None:
+        if not self._blocks:
+            self._splice_blocks(0, 0, new_ids)
+            return
+        block_index = self._locate_block(position)
+        ids = self._blocks[block_index].ids
+        offset = position - self._block_starts[block_index]
+        self._splice_blocks(block_index, 1, ids[:offset] + new_ids + ids[offset:])
+
+    def _index_remove(self, first: int, count: int) -> None:
+        first_block = self._locate_block(first)
+        last_block = self._locate_block(first + count - 1)
+        head = self._blocks[first_block].ids[:first - self._block_starts[first_block]]
+        tail = self._blocks[last_block].ids[first + count - self._block_starts[last_block]:]
+        for block in self._blocks[first_block:last_block + 1]:
+            for cell_id in block.ids:
+                del self._locations[cell_id]
+        remaining = head + tail
+        block_count = last_block + 1 - first_block
+        # Fold a small remainder into a neighbour so repeated edits do not leave a trail of tiny blocks.
+        if len(remaining) < INDEX_BLOCK_SIZE // 2:
+            if last_block + 1 < len(self._blocks):
+                remaining += self._blocks[last_block + 1].ids
+                block_count += 1
+            elif first_block > 0:
+                first_block -= 1
+                remaining = self._blocks[first_block].ids + remaining
+                block_count += 1
+        self._splice_blocks(first_block, block_count, remaining)
+
+    def _splice_blocks(self, block_index: int, block_count: int, ids: list[str]) -> None:
+        """Replace ``block_count`` blocks with ``ids`` split into near-equal blocks."""
+        parts = -(-len(ids) // INDEX_BLOCK_SIZE)
+        size = -(-len(ids) // parts) if parts else 0
+        blocks = [_IdBlock(ids[start:start + size]) for start in range(0, len(ids), size or 1)]
+        locations = self._locations
+        for block in blocks:
+            for offset, cell_id in enumerate(block.ids):
+                locations[cell_id] = (block, offset)
+        self._blocks[block_index:block_index + block_count] = blocks
+        following = self._blocks[block_index:]
+        for index, block in enumerate(following, block_index):
+            block.index = index
+        starts = self._block_starts
+        start = starts[block_index]
+        del starts[block_index:]
+        starts.extend(accumulate((len(block.ids) for block in following), initial=start))
+
+    def _notify_changing(self, change: DocumentChange) -> None:
+        for listener in self._listeners:
+            listener.document_changing(change)
+
+    def _notify_changed(self, change: DocumentChange) -> None:
+        for listener in self._listeners:
+            listener.document_changed(change)
+
+
+__all__ = [
+    "CHANGE_INSERT",
+    "CHANGE_MOVE",
+    "CHANGE_REMOVE",
+    "CHANGE_RESET",
+    "CHANGE_UPDATE",
+    "INDEX_BLOCK_SIZE",
+    "NO_METADATA",
+    "CellRecord",
+    "DocumentChange",
+    "DocumentListener",
+    "NotebookDocument",
+    "as_records",
+]
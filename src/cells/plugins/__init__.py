@@ -0,0 +1 @@
+"""Built-in cell types; each module is imported only when a notebook uses it."""
@@ -0,0 +1,65 @@
+"""Code cell: header plus a monospace, non-wrapping body."""
+
+from __future__ import annotations
+
+from textwrap import dedent
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QFrame, QLabel
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use notebook cells.") from exc
+
+from assets.fonts.font_lists import DEFAULT_CODE_FONT
+from cells.data import CellBodyStyle, CellData
+from cells.plugins.text import add_header, bind_cell
+from theme import Theme, ThemeMode, get_theme
+from utils.font_loader import get_font_registry
+from widgets.cell_container import CELL_BODY_SELECTOR, CELL_SELECTOR
+
+CELL_TYPE = "code"
+LABEL = "Code"
+CODE_CELL_SELECTOR = f'{CELL_SELECTOR}[cellKind="{CELL_TYPE}"]'
+
+
+def get_qss(mode: ThemeMode = ThemeMode.DARK, theme: Theme | None = None) -> str:
+    theme = theme or get_theme(mode)
+    metrics = theme.metrics
+    return dedent(
+        f"""
+        {CODE_CELL_SELECTOR} > {CELL_BODY_SELECTOR} {{
+            background-color: {theme.viewport.base};
+            color: {theme.text.primary};
+            font-family: "{DEFAULT_CODE_FONT}", monospace;
+            padding: {metrics.padding_small}px;
+            border-radius: {metrics.radius_small}px;
+        }}
+        """
+    ).strip()
+
+
+def body_style(theme: Theme) -> CellBodyStyle:
+    """Delegate painting: the same monospace panel the QSS gives the body label."""
+
+    get_font_registry().ensure_family(DEFAULT_CODE_FONT)
+    metrics = theme.metrics
+    return CellBodyStyle(
+        font_family=DEFAULT_CODE_FONT,
+        background=theme.viewport.base,
+        padding=metrics.padding_small,
+        radius=metrics.radius_small,
+        wrap=False,
+    )
+
+
+def populate_cell(frame: QFrame, cell: CellData) -> None:
+    get_font_registry().ensure_family(DEFAULT_CODE_FONT)
+    add_header(frame, cell.header)
+    body = QLabel(cell.body, frame)
+    body.setProperty("cellPart", "body")
+    body.setTextFormat(Qt.PlainText)
+    body.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+    frame.layout().addWidget(body)
+
+
+__all__ = ["CELL_TYPE", "LABEL", "bind_cell", "body_style", "get_qss", "populate_cell"]
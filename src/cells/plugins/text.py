@@ -0,0 +1,54 @@
+"""Plain text cell: an uppercase header above a wrapped body."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QFrame, QLabel
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use notebook cells.") from exc
+
+from cells.data import CellBodyStyle, CellData
+from theme import Theme, ThemeMode
+
+CELL_TYPE = "text"
+LABEL = "Text"
+
+
+def get_qss(mode: ThemeMode = ThemeMode.DARK, theme: Theme | None = None) -> str:
+    """Text cells use the shared container rules from ``widgets.cell_container``."""
+
+    return ""
+
+
+def body_style(theme: Theme) -> CellBodyStyle:
+    """Delegate painting: wrapped body in the UI font."""
+
+    return CellBodyStyle()
+
+
+def add_header(frame: QFrame, text: str) -> QLabel:
+    header = QLabel(text, frame)
+    header.setProperty("cellPart", "header")
+    header.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+    frame.layout().addWidget(header)
+    return header
+
+
+def populate_cell(frame: QFrame, cell: CellData) -> None:
+    add_header(frame, cell.header)
+    body = QLabel(cell.body, frame)
+    body.setProperty("cellPart", "body")
+    body.setWordWrap(True)
+    body.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+    frame.layout().addWidget(body)
+
+
+def bind_cell(frame: QFrame, cell: CellData) -> None:
+    """Show ``cell`` in a frame :func:`populate_cell` filled for another cell."""
+    layout = frame.layout()
+    layout.itemAt(0).widget().setText(cell.header)
+    layout.itemAt(1).widget().setText(cell.body)
+
+
+__all__ = ["CELL_TYPE", "LABEL", "add_header", "bind_cell", "body_style", "get_qss", "populate_cell"]
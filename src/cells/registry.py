@@ -0,0 +1,168 @@
+"""Registry of cell types whose implementations are imported on first use.
+
+A cell type is a module that provides::
+
+    CELL_TYPE = "code"                      # id stored in notebooks
+    LABEL = "Code"
+    def get_qss(mode, theme) -> str         # style fragment, like widgets.*
+    def populate_cell(frame, cell) -> None  # fills the cell's QFrame layout
+    def body_style(theme) -> CellBodyStyle  # optional, used by the cell delegate
+    def bind_cell(frame, cell) -> None      # optional, refills a populated frame
+                                            # so cell rows can be recycled
+
+Only module *names* are collected up front. Built-in types live in
+``cells.plugins``; more are found as ``<cell_type>.py`` files in the plugin
+directories (``LUNAQT_CELL_PLUGIN_PATH``, ``os.pathsep`` separated) or as
+entry points in the ``lunaqt.cell_types`` group, and these sources are only
+consulted for types that are not already known. Nothing is imported until a
+notebook contains a cell of that type.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable
+
+ENTRY_POINT_GROUP = "lunaqt.cell_types"
+PLUGIN_PATH_ENV_VAR = "LUNAQT_CELL_PLUGIN_PATH"
+FALLBACK_CELL_TYPE = "text"
+
+
+@dataclass(frozen=True, slots=True)
+class CellTypeSpec:
+    """Where to find a cell type; ``location`` is a module name or a ``.py`` path."""
+
+    cell_type: str
+    location: str
+
+
+_BUILTIN_CELL_TYPES = {
+    "text": "cells.plugins.text",
+    "code": "cells.plugins.code",
+}
+
+_specs: dict[str, CellTypeSpec] = {
+    cell_type: CellTypeSpec(cell_type, module_name) for cell_type, module_name in _BUILTIN_CELL_TYPES.items()
+}
+_loaded: dict[str, ModuleType] = {}
+_entry_points: dict[str, str] | None = None
+
+
+def register_cell_type(cell_type: str, location: str) -> CellTypeSpec:
+    """Register (or replace) a cell type by module name or file path without importing it."""
+
+    if cell_type in _loaded:
+        raise ValueError(f"Cell type {cell_type!r} is already loaded and cannot be replaced.")
+    spec = CellTypeSpec(cell_type, location)
+    _specs[cell_type] = spec
+    return spec
+
+
+def plugin_directories() -> tuple[Path, ...]:
+    raw = os.environ.get(PLUGIN_PATH_ENV_VAR, "")
+    return tuple(Path(entry) for entry in raw.split(os.pathsep) if entry)
+
+
+def _find_in_plugin_directories(cell_type: str) -> CellTypeSpec | None:
+    for directory in plugin_directories():
+        candidate = directory / f"{cell_type}.py"
+        if candidate.is_file():
+            return CellTypeSpec(cell_type, str(candidate))
+    return None
+
+
+def _find_entry_point(cell_type: str) -> CellTypeSpec | None:
+    global _entry_points
+    if _entry_points is None:
+        from importlib.metadata import entry_points
+
+        _entry_points = {entry.name: entry.value for entry in entry_points(group=ENTRY_POINT_GROUP)}
+    module_name = _entry_points.get(cell_type)
+    return CellTypeSpec(cell_type, module_name) if module_name else None
+
+
+def find_cell_type(cell_type: str) -> CellTypeSpec | None:
+    """Return the spec for ``cell_type``, searching plugin sources if needed."""
+
+    spec = _specs.get(cell_type)
+    if spec is None:
+        spec = _find_in_plugin_directories(cell_type) or _find_entry_point(cell_type)
+        if spec is not None:
+            _specs[cell_type] = spec
+    return spec
+
+
+def _import_location(spec: CellTypeSpec) -> ModuleType:
+    if not spec.location.endswith(".py"):
+        return importlib.import_module(spec.location)
+    module_name = f"cells.plugins._external_{spec.cell_type.replace('-', '_')}"
+    file_spec = importlib.util.spec_from_file_location(module_name, spec.location)
+    if file_spec is None or file_spec.loader is None:
+        raise ImportError(f"Cannot load cell plugin from {spec.location}")
+    module = importlib.util.module_from_spec(file_spec)
+    sys.modules[module_name] = module
+    file_spec.loader.exec_module(module)
+    return module
+
+
+def load_cell_type(cell_type: str) -> ModuleType:
+    """Import and return the module for ``cell_type``; unknown types render as text."""
+
+    module = _loaded.get(cell_type)
+    if module is not None:
+        return module
+    spec = find_cell_type(cell_type)
+    if spec is None:
+        if cell_type == FALLBACK_CELL_TYPE:
+            raise LookupError(f"No implementation registered for cell type {cell_type!r}.")
+        module = load_cell_type(FALLBACK_CELL_TYPE)
+    else:
+        module = _import_location(spec)
+    _loaded[cell_type] = module
+    return module
+
+
+def load_cell_types(cell_types: Iterable[str]) -> tuple[ModuleType, ...]:
+    """Load every distinct type in ``cell_types``; returns the newly imported modules."""
+
+    before = set(map(id, _loaded.values()))
+    for cell_type in dict.fromkeys(cell_types):
+        load_cell_type(cell_type)
+    return tuple(module for module in loaded_cell_modules() if id(module) not in before)
+
+
+def loaded_cell_modules() -> tuple[ModuleType, ...]:
+    """Distinct cell modules imported so far, in load order (for style assembly)."""
+
+    return tuple({id(module): module for module in _loaded.values()}.values())
+
+
+def is_loaded(cell_type: str) -> bool:
+    return cell_type in _loaded
+
+
+def known_cell_types() -> tuple[str, ...]:
+    """Types registered so far (does not scan plugin sources)."""
+
+    return tuple(_specs)
+
+
+__all__ = [
+    "CellTypeSpec",
+    "ENTRY_POINT_GROUP",
+    "PLUGIN_PATH_ENV_VAR",
+    "find_cell_type",
+    "is_loaded",
+    "known_cell_types",
+    "load_cell_type",
+    "load_cell_types",
+    "loaded_cell_modules",
+    "plugin_directories",
+    "register_cell_type",
+]
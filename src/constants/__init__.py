@@ -1,11 +1,27 @@
 """Central location for small configuration constants."""
 
+from .notebook_view import (
+	CELL_LIST_MARGIN,
+	CELL_RENDERERS,
+	DEFAULT_CELL_RENDERER,
+	CELL_LIST_OVERSCAN_PX,
+	CELL_LIST_SCROLL_STEP,
+	CELL_ROW_POOL_SIZE,
+	CELL_INSERT_CHUNK_SIZE,
+	ESTIMATED_CELL_ROW_HEIGHT,
+	TEXT_LAYOUT_CACHE_SIZE,
+	TEXT_LAYOUT_WIDTH_BUCKET,
+)
+from .sidebars import SIDEBAR_EVICT_AFTER_MS
+from .startup import DEFERRED_BUILD_SLICE_MS, SESSION_SAVE_DELAY_MS
 from .theme_startup_mode import DEFAULT_THEME_MODE
 from .typography import (
 	DEFAULT_UI_FONT_POINT_SIZE,
+	FONT_PRELOAD_INTERVAL_MS,
 	FONT_SIZE_STEP,
 	MAX_UI_FONT_POINT_SIZE,
 	MIN_UI_FONT_POINT_SIZE,
+	PRELOAD_FONTS_WHEN_IDLE,
 	clamp_ui_font_point_size,
 )
 from assets.fonts.font_lists import BUNDLED_FONTS, DEFAULT_UI_FONT
@@ -22,10 +38,25 @@ __all__ = [
 	"DEFAULT_SIDEBAR_WIDTH",
 	"MIN_SIDEBAR_WIDTH",
 	"MAX_SIDEBAR_WIDTH",
+	"SIDEBAR_EVICT_AFTER_MS",
 	"DEFAULT_UI_FONT_POINT_SIZE",
 	"MIN_UI_FONT_POINT_SIZE",
 	"MAX_UI_FONT_POINT_SIZE",
 	"FONT_SIZE_STEP",
+	"PRELOAD_FONTS_WHEN_IDLE",
+	"FONT_PRELOAD_INTERVAL_MS",
+	"DEFERRED_BUILD_SLICE_MS",
+	"SESSION_SAVE_DELAY_MS",
+	"CELL_RENDERERS",
+	"DEFAULT_CELL_RENDERER",
+	"ESTIMATED_CELL_ROW_HEIGHT",
+	"CELL_LIST_OVERSCAN_PX",
+	"CELL_LIST_MARGIN",
+	"CELL_LIST_SCROLL_STEP",
+	"CELL_ROW_POOL_SIZE",
+	"CELL_INSERT_CHUNK_SIZE",
+	"TEXT_LAYOUT_CACHE_SIZE",
+	"TEXT_LAYOUT_WIDTH_BUCKET",
 	"clamp_ui_font_point_size",
 	"BUNDLED_FONTS",
 	"DEFAULT_UI_FONT",
@@ -0,0 +1,42 @@
+"""Virtualized notebook view settings."""
+
+from __future__ import annotations
+
+# How cells are rendered: "delegate" paints them, "widgets" builds a CellRow per visible cell.
+CELL_RENDERERS = ("delegate", "widgets")
+DEFAULT_CELL_RENDERER = "delegate"
+
+# Height assumed for cells that have not been on screen yet.
+ESTIMATED_CELL_ROW_HEIGHT = 64
+
+# Rows within this many pixels above/below the viewport are kept materialised.
+CELL_LIST_OVERSCAN_PX = 120
+
+# Padding around the rows inside the cell list viewport.
+CELL_LIST_MARGIN = 5
+
+# Pixels scrolled per wheel/arrow step.
+CELL_LIST_SCROLL_STEP = 24
+
+# Detached CellRow widgets kept for reuse (all cell types together).
+CELL_ROW_POOL_SIZE = 64
+
+# Cells added per step when a large batch is inserted in idle slices.
+CELL_INSERT_CHUNK_SIZE = 1000
+
+# Laid-out cell bodies kept by the delegate, and the width step they are laid out at.
+TEXT_LAYOUT_CACHE_SIZE = 4096
+TEXT_LAYOUT_WIDTH_BUCKET = 8
+
+__all__ = [
+    "CELL_RENDERERS",
+    "DEFAULT_CELL_RENDERER",
+    "ESTIMATED_CELL_ROW_HEIGHT",
+    "CELL_LIST_OVERSCAN_PX",
+    "CELL_LIST_MARGIN",
+    "CELL_LIST_SCROLL_STEP",
+    "CELL_ROW_POOL_SIZE",
+    "CELL_INSERT_CHUNK_SIZE",
+    "TEXT_LAYOUT_CACHE_SIZE",
+    "TEXT_LAYOUT_WIDTH_BUCKET",
+]
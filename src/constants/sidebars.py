@@ -0,0 +1,8 @@
+"""Sidebar panel lifecycle settings."""
+
+from __future__ import annotations
+
+# Hidden sidebar panels are torn down after this long (None keeps them alive).
+SIDEBAR_EVICT_AFTER_MS: int | None = 5 * 60 * 1000
+
+__all__ = ["SIDEBAR_EVICT_AFTER_MS"]
@@ -0,0 +1,11 @@
+"""Staged window construction settings."""
+
+from __future__ import annotations
+
+# Upper bound for each idle slice of deferred construction work.
+DEFERRED_BUILD_SLICE_MS = 8
+
+# Session snapshot writes are coalesced over this delay after each change.
+SESSION_SAVE_DELAY_MS = 500
+
+__all__ = ["DEFERRED_BUILD_SLICE_MS", "SESSION_SAVE_DELAY_MS"]
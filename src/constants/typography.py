@@ -7,6 +7,10 @@ MIN_UI_FONT_POINT_SIZE = 10
 MAX_UI_FONT_POINT_SIZE = 18
 FONT_SIZE_STEP = 1
 
+# Register the remaining bundled font families one per idle tick after startup.
+PRELOAD_FONTS_WHEN_IDLE = True
+FONT_PRELOAD_INTERVAL_MS = 250
+
 
 def clamp_ui_font_point_size(value: int) -> int:
     """Clamp the provided UI font size to the supported bounds."""
@@ -19,5 +23,7 @@ __all__ = [
     "MIN_UI_FONT_POINT_SIZE",
     "MAX_UI_FONT_POINT_SIZE",
     "FONT_SIZE_STEP",
+    "PRELOAD_FONTS_WHEN_IDLE",
+    "FONT_PRELOAD_INTERVAL_MS",
     "clamp_ui_font_point_size",
 ]
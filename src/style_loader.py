@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from types import ModuleType
 from typing import Iterable, Protocol
 
-from theme import Metrics, Theme, ThemeMode, get_theme
+from theme import Metrics, NotebookTheme, Theme, ThemeMode, get_theme
+from utils.tracing import span, traced
 from widgets import buttons, cell_container, cell_gutter, main_menubar, statusbar
 from widgets import sidebars
 
@@ -17,6 +20,12 @@ STYLE_MODULES = (
     statusbar,
 )
 
+# Fragments that are re-rendered inside a notebook's scoped stylesheet.
+NOTEBOOK_STYLE_MODULES = (
+    cell_container,
+    cell_gutter,
+)
+
 
 def _base_style(theme: Theme) -> str:
     metrics = theme.metrics
@@ -59,15 +68,90 @@ def _base_style(theme: Theme) -> str:
     """.strip()
 
 
+@lru_cache(maxsize=64)
+def render_fragment(module: ModuleType, theme: Theme) -> str:
+    """Return the QSS fragment of ``module`` for ``theme``.
+
+    Fragments are cached on the immutable theme, so the application chrome and
+    every notebook that resolve to the same theme share one rendered string.
+    """
+
+    return module.get_qss(mode=theme.mode, theme=theme)
+
+
 def _collect_qss(modules: Iterable, theme: Theme) -> str:
     """Return concatenated QSS from all provided modules."""
 
     blocks = [_base_style(theme)]
     for module in modules:
-        blocks.append(module.get_qss(mode=theme.mode, theme=theme))
+        fragment = render_fragment(module, theme)
+        if fragment:
+            blocks.append(fragment)
+    return "\n\n".join(blocks)
+
+
+def _notebook_scope_style(theme: Theme) -> str:
+    """Root rules for a notebook whose theme differs from the chrome."""
+
+    metrics = theme.metrics
+    return f"""
+    QWidget {{
+        background-color: {theme.bg.app};
+        color: {theme.text.primary};
+        font-family: {metrics.font_family};
+        font-size: {metrics.font_size_medium}pt;
+    }}
+    """.strip()
+
+
+def _notebook_root_style(theme: Theme) -> str:
+    # Appended after the cell fragments so it wins over the transparent list rule.
+    return f"""
+    {cell_container.CELL_LIST_SELECTOR} {{
+        background-color: {theme.bg.app};
+    }}
+    """.strip()
+
+
+@lru_cache(maxsize=16)
+def _build_scoped_qss(theme: Theme, cell_modules: tuple[ModuleType, ...] = ()) -> str:
+    blocks = [_notebook_scope_style(theme)]
+    for module in NOTEBOOK_STYLE_MODULES + cell_modules:
+        fragment = render_fragment(module, theme)
+        if fragment:
+            blocks.append(fragment)
+    blocks.append(_notebook_root_style(theme))
     return "\n\n".join(blocks)
 
 
+@lru_cache(maxsize=16)
+def _build_cell_type_qss(theme: Theme, cell_modules: tuple[ModuleType, ...]) -> str:
+    return "\n\n".join(filter(None, (render_fragment(module, theme) for module in cell_modules)))
+
+
+def build_notebook_qss(
+    notebook_theme: NotebookTheme,
+    chrome_mode: ThemeMode = ThemeMode.DARK,
+    *,
+    metrics: Metrics | None = None,
+    cell_modules: tuple[ModuleType, ...] = (),
+) -> str:
+    """Return the stylesheet to set on a notebook's cell list root.
+
+    ``cell_modules`` are the cell-type plugins the notebook uses; their
+    fragments are scoped to the cell list so loading a new cell type never
+    re-polishes the application chrome. When the notebook follows the chrome
+    theme and uses no such fragments the result is empty. Notebooks that
+    resolve to the same theme receive the same cached string.
+    """
+
+    if notebook_theme.follows_chrome():
+        if not cell_modules:
+            return ""
+        return _build_cell_type_qss(get_theme(chrome_mode, metrics=metrics), cell_modules)
+    return _build_scoped_qss(notebook_theme.resolve(chrome_mode, metrics=metrics), cell_modules)
+
+
 def build_application_qss(
     mode: ThemeMode = ThemeMode.DARK,
     theme: Theme | None = None,
@@ -80,20 +164,44 @@ def build_application_qss(
     return _collect_qss(STYLE_MODULES, theme)
 
 
+# (application id, mode, metrics, stylesheet) of the last apply_global_style call.
+_applied_style: tuple[int, ThemeMode, Metrics | None, str] | None = None
+
+
 class _HasStyleSheet(Protocol):
+    def styleSheet(self) -> str:  # pragma: no cover - runtime provided by Qt
+        ...
+
     def setStyleSheet(self, style: str, /) -> None:  # pragma: no cover - runtime provided by Qt
         ...
 
 
+@traced("apply_global_style")
 def apply_global_style(
     app: _HasStyleSheet,
     mode: ThemeMode = ThemeMode.DARK,
     *,
     metrics: Metrics | None = None,
 ) -> None:
-    """Apply the assembled QSS onto the provided QApplication instance."""
-
-    app.setStyleSheet(build_application_qss(mode=mode, metrics=metrics))
-
-
-__all__ = ["build_application_qss", "apply_global_style"]
+    """Apply the assembled QSS onto the provided QApplication instance.
+
+    Re-applying the stylesheet that is already set is skipped, since Qt
+    re-polishes every widget on each ``setStyleSheet`` call. When ``mode``
+    and ``metrics`` match the previous call for ``app`` and its stylesheet
+    is unchanged, the QSS is not assembled again either.
+    """
+
+    global _applied_style
+    applied = _applied_style
+    if applied is not None and applied[:3] == (id(app), mode, metrics) and app.styleSheet() == applied[3]:
+        return
+    with span("build_application_qss", mode=mode.value):
+        qss = build_application_qss(mode=mode, metrics=metrics)
+    _applied_style = (id(app), mode, metrics, qss)
+    if app.styleSheet() == qss:
+        return
+    with span("QApplication.setStyleSheet"):
+        app.setStyleSheet(qss)
+
+
+__all__ = ["build_application_qss", "build_notebook_qss", "apply_global_style", "render_fragment"]
@@ -15,7 +15,8 @@ from .colors import (
 )
 from .metrics import Metrics
 from .preferences import StylePreferences
-from .mode import ThemeMode
+from .scope import NotebookTheme
+from .mode import ThemeMode, ThemeModeSpec, register_theme_mode, registered_theme_modes
 from .widget_tokens import (
     ButtonTokens,
     CellContainerTokens,
@@ -42,9 +43,13 @@ __all__ = [
     "ViewportPalette",
     "Metrics",
     "ModeAwareColor",
+    "NotebookTheme",
     "Theme",
     "ThemeMode",
+    "ThemeModeSpec",
     "get_theme",
+    "register_theme_mode",
+    "registered_theme_modes",
     "ButtonTokens",
     "CellContainerTokens",
     "CellGutterTokens",
@@ -3,59 +3,243 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from theme.metrics import Metrics
-from theme.mode import ThemeMode
+from theme.mode import ThemeMode, registered_theme_modes
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class ModeAwareColor:
-    """Represents a color that supports both light and dark variants."""
+    """Represents a color vector with one entry per registered theme mode.
 
-    light: str
-    dark: str
+    ``light`` and ``dark`` are required; any other registered mode can be
+    given explicitly by its value (e.g. ``sepia="#f4ecd8"``) and otherwise
+    inherits the colour of its fallback mode. Lookups index straight into
+    the vector, so resolution cost does not depend on the number of modes.
+    """
+
+    values: tuple[str, ...]
+
+    def __init__(self, light: str, dark: str, **overrides: str) -> None:
+        object.__setattr__(self, "values", _build_mode_vector(light, dark, overrides))
 
     def value_for(self, mode: ThemeMode) -> str:
-        return self.light if mode == ThemeMode.LIGHT else self.dark
+        return self.values[mode.index]
 
     def __str__(self) -> str:  # pragma: no cover - convenience for debugging
-        return self.dark
+        return self.value_for(ThemeMode.DARK)
+
+
+def _build_mode_vector(light: str, dark: str, overrides: dict[str, str]) -> tuple[str, ...]:
+    explicit = {ThemeMode.LIGHT.value: light, ThemeMode.DARK.value: dark, **overrides}
+    values: list[str] = []
+    for spec in registered_theme_modes():
+        color = explicit.pop(spec.mode.value, None)
+        if color is None:
+            if spec.fallback is None:
+                raise ValueError(f"Theme mode '{spec.mode.value}' needs an explicit color.")
+            color = values[spec.fallback.index]
+        values.append(color)
+    if explicit:
+        raise ValueError(f"Unknown theme modes in color definition: {', '.join(sorted(explicit))}")
+    return tuple(values)
 
 
 # --- Mode-aware tokens ----------------------------------------------------
 # THE COLOR VALUES HERE ARE ALL OVER THE PLACE SINCE WE ARE TESTING IF THIS STRUCTURE WORKS
 class _BGTokens:
-    app = ModeAwareColor(light="#00950a", dark="#1e1e1e")
-    menubar = ModeAwareColor(light="#b20e0e", dark="#2b2b2b")
-    statusbar = ModeAwareColor(light="#002fff", dark="#252525")
-    dropdown = ModeAwareColor(light="#0138ff", dark="#333333") 
-    cell = ModeAwareColor(light="#b5b5b5", dark="#1f1f1f") 
-    cell_gutter = ModeAwareColor(light="#f700ff", dark="#181818") 
-    toolbar = ModeAwareColor(light="#008E9B", dark="#2a2a2a")  
-    sidebar_header = ModeAwareColor(light="#C266FF", dark="#2a2a2a") 
-    sidebar_content = ModeAwareColor(light="#F5FF66", dark="#2a2a2a") 
-    sidebar_toolbar = ModeAwareColor(light="#A70707", dark="#333333") 
+    app = ModeAwareColor(
+        light="#00950a",
+        dark="#1e1e1e",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#f4ecd8",
+        projector="#ffffff",
+    )
+    menubar = ModeAwareColor(
+        light="#b20e0e",
+        dark="#2b2b2b",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#e9dcc0",
+        projector="#f2f2f2",
+    )
+    statusbar = ModeAwareColor(
+        light="#002fff",
+        dark="#252525",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#e9dcc0",
+        projector="#f2f2f2",
+    )
+    dropdown = ModeAwareColor(
+        light="#0138ff",
+        dark="#333333",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#f4ecd8",
+        projector="#ffffff",
+    )
+    cell = ModeAwareColor(
+        light="#b5b5b5",
+        dark="#1f1f1f",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#fbf5e6",
+        projector="#ffffff",
+    )
+    cell_gutter = ModeAwareColor(
+        light="#f700ff",
+        dark="#181818",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#efe3c8",
+        projector="#f2f2f2",
+    )
+    toolbar = ModeAwareColor(
+        light="#008E9B",
+        dark="#2a2a2a",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#e9dcc0",
+        projector="#f2f2f2",
+    )
+    sidebar_header = ModeAwareColor(
+        light="#C266FF",
+        dark="#2a2a2a",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#e9dcc0",
+        projector="#e6e6e6",
+    )
+    sidebar_content = ModeAwareColor(
+        light="#F5FF66",
+        dark="#2a2a2a",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#f4ecd8",
+        projector="#ffffff",
+    )
+    sidebar_toolbar = ModeAwareColor(
+        light="#A70707",
+        dark="#333333",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#e9dcc0",
+        projector="#f2f2f2",
+    )
 
 class _BorderTokens:
-    subtle = ModeAwareColor(light="#8a0d0d", dark="#2d2d2d")
-    strong = ModeAwareColor(light="#bcbcbc", dark="#3a3a3a")
-    highlight = ModeAwareColor(light="#4a90e2", dark="#5a5a5a")
-    cell = ModeAwareColor(light="#cfcfcf", dark="#3a3a3a")
-    cell_gutter = ModeAwareColor(light="#d5d5d5", dark="#2a2a2a")
-    cell_in_focus = ModeAwareColor(light="#ff0000", dark="#5ea2ff")
+    subtle = ModeAwareColor(
+        light="#8a0d0d",
+        dark="#2d2d2d",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#d9c8a9",
+        projector="#808080",
+    )
+    strong = ModeAwareColor(
+        light="#bcbcbc",
+        dark="#3a3a3a",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#b9a27c",
+        projector="#404040",
+    )
+    highlight = ModeAwareColor(
+        light="#4a90e2",
+        dark="#5a5a5a",
+        high_contrast_light="#0000ee",
+        high_contrast_dark="#ffff00",
+        sepia="#9c6b30",
+        projector="#0050c8",
+    )
+    cell = ModeAwareColor(
+        light="#cfcfcf",
+        dark="#3a3a3a",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#d9c8a9",
+        projector="#808080",
+    )
+    cell_gutter = ModeAwareColor(
+        light="#d5d5d5",
+        dark="#2a2a2a",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#d9c8a9",
+        projector="#808080",
+    )
+    cell_in_focus = ModeAwareColor(
+        light="#ff0000",
+        dark="#5ea2ff",
+        high_contrast_light="#0000ee",
+        high_contrast_dark="#ffff00",
+        sepia="#9c6b30",
+        projector="#0050c8",
+    )
 
 class _TextTokens:
-    primary = ModeAwareColor(light="#111111", dark="#fafafa")
-    secondary = ModeAwareColor(light="#333333", dark="#c0c0c0")
-    muted = ModeAwareColor(light="#666666", dark="#8a8a8a")
-    warning = ModeAwareColor(light="#b05a00", dark="#f5d17a")
+    primary = ModeAwareColor(
+        light="#111111",
+        dark="#fafafa",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#433422",
+        projector="#000000",
+    )
+    secondary = ModeAwareColor(
+        light="#333333",
+        dark="#c0c0c0",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#5b4636",
+        projector="#1a1a1a",
+    )
+    muted = ModeAwareColor(
+        light="#666666",
+        dark="#8a8a8a",
+        high_contrast_light="#000000",
+        high_contrast_dark="#ffffff",
+        sepia="#7a6650",
+        projector="#333333",
+    )
+    warning = ModeAwareColor(
+        light="#b05a00",
+        dark="#f5d17a",
+        high_contrast_light="#a00000",
+        high_contrast_dark="#ffff00",
+        sepia="#a0522d",
+        projector="#b00000",
+    )
 
 class _ViewportTokens:
     base = _BGTokens.cell
-    alternate = ModeAwareColor(light="#f6f6f6", dark="#232323")
-    selection = ModeAwareColor(light="#cfe1ff", dark="#2e4a70")
-    selection_text = _TextTokens.primary
+    alternate = ModeAwareColor(
+        light="#f6f6f6",
+        dark="#232323",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#f4ecd8",
+    )
+    selection = ModeAwareColor(
+        light="#cfe1ff",
+        dark="#2e4a70",
+        high_contrast_light="#0000ee",
+        high_contrast_dark="#ffff00",
+        sepia="#e6d3a8",
+    )
+    # High-contrast selections invert the text colour instead of reusing primary text.
+    selection_text = ModeAwareColor(
+        light="#111111",
+        dark="#fafafa",
+        high_contrast_light="#ffffff",
+        high_contrast_dark="#000000",
+        sepia="#433422",
+        projector="#000000",
+    )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonPaletteTokens:
     normal: ModeAwareColor
     hover: ModeAwareColor
@@ -129,7 +313,7 @@ class _StatusBarTokens:
 
 
 # --- Resolved palette structures -----------------------------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackgroundPalette:
     app: str
     menubar: str
@@ -143,7 +327,7 @@ class BackgroundPalette:
     sidebar_content: str
     
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BorderPalette:
     subtle: str
     strong: str
@@ -152,21 +336,21 @@ class BorderPalette:
     cell_gutter: str
     cell_in_focus: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextPalette:
     primary: str
     secondary: str
     muted: str
     warning: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ViewportPalette:
     base: str
     alternate: str
     selection: str
     selection_text: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonPalette:
     normal: str
     hover: str
@@ -176,28 +360,28 @@ class ButtonPalette:
     text: str
     focus: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonPalettes:
     primary: ButtonPalette
     toolbar: ButtonPalette
     menubar: ButtonPalette
     warning: ButtonPalette
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuPalette:
     background: str
     text: str
     item_hover: str
     separator: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusBarPalette:
     background: str
     text: str
     border_top: str
     warning: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     mode: ThemeMode
     bg: BackgroundPalette
@@ -288,12 +472,22 @@ def _resolve_statusbar(mode: ThemeMode) -> StatusBarPalette:
     )
 
 
-def get_theme(mode: ThemeMode = ThemeMode.DARK, metrics: Metrics | None = None) -> Theme:
-    """Return a fully resolved palette for the requested theme mode."""
+@dataclass(frozen=True, slots=True)
+class _ModePalettes:
+    bg: BackgroundPalette
+    border: BorderPalette
+    text: TextPalette
+    viewport: ViewportPalette
+    buttons: ButtonPalettes
+    menu: MenuPalette
+    statusbar: StatusBarPalette
 
-    metrics = metrics or Metrics()
-    return Theme(
-        mode=mode,
+
+@lru_cache(maxsize=None)
+def _resolve_palettes(mode: ThemeMode) -> _ModePalettes:
+    """Resolve every palette for ``mode`` once; the cache holds one entry per registered mode."""
+
+    return _ModePalettes(
         bg=_resolve_bg(mode),
         border=_resolve_border(mode),
         text=_resolve_text(mode),
@@ -301,6 +495,23 @@ def get_theme(mode: ThemeMode = ThemeMode.DARK, metrics: Metrics | None = None)
         buttons=_resolve_buttons(mode),
         menu=_resolve_menu(mode),
         statusbar=_resolve_statusbar(mode),
+    )
+
+
+def get_theme(mode: ThemeMode = ThemeMode.DARK, metrics: Metrics | None = None) -> Theme:
+    """Return a fully resolved palette for the requested theme mode."""
+
+    metrics = metrics or Metrics()
+    palettes = _resolve_palettes(mode)
+    return Theme(
+        mode=mode,
+        bg=palettes.bg,
+        border=palettes.border,
+        text=palettes.text,
+        viewport=palettes.viewport,
+        buttons=palettes.buttons,
+        menu=palettes.menu,
+        statusbar=palettes.statusbar,
         metrics=metrics,
     )
 
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metrics:
     """Spacing, sizing, and typography metrics shared by all styles."""
 
@@ -51,6 +52,7 @@ class Metrics:
 def build_metrics_for_ui_font(
     ui_point_size: int,
     *,
+    font_family: str | None = None,
     template: "Metrics" | None = None,
     small_offset: int = 2,
     large_offset: int = 2,
@@ -58,19 +60,42 @@ def build_metrics_for_ui_font(
     """Return a Metrics instance adjusted to the requested UI font size.
 
     The helper keeps the provided template immutable by returning a new instance
-    with updated small/medium/large font sizes while leaving the dedicated cell
-    body size untouched.
+    with updated small/medium/large font sizes (and optionally the font family)
+    while leaving the dedicated cell body size untouched. All overrides are
+    applied in a single construction step; without a template the result is
+    cached, since ``Metrics`` is immutable and safe to share.
     """
 
-    base = template or Metrics()
-    adjusted_small = max(ui_point_size - small_offset, 6)
-    adjusted_large = ui_point_size + large_offset
-    return replace(
-        base,
-        font_size_small=adjusted_small,
-        font_size_medium=ui_point_size,
-        font_size_large=adjusted_large,
-    )
+    if template is None:
+        return _default_metrics_for_ui_font(ui_point_size, font_family, small_offset, large_offset)
+    overrides = _font_overrides(ui_point_size, font_family, small_offset, large_offset)
+    return replace(template, **overrides)
+
+
+def _font_overrides(
+    ui_point_size: int,
+    font_family: str | None,
+    small_offset: int,
+    large_offset: int,
+) -> dict[str, int | str]:
+    overrides: dict[str, int | str] = {
+        "font_size_small": max(ui_point_size - small_offset, 6),
+        "font_size_medium": ui_point_size,
+        "font_size_large": ui_point_size + large_offset,
+    }
+    if font_family is not None:
+        overrides["font_family"] = font_family
+    return overrides
+
+
+@lru_cache(maxsize=32)
+def _default_metrics_for_ui_font(
+    ui_point_size: int,
+    font_family: str | None,
+    small_offset: int,
+    large_offset: int,
+) -> Metrics:
+    return Metrics(**_font_overrides(ui_point_size, font_family, small_offset, large_offset))
 
 
 __all__ = ["Metrics", "build_metrics_for_ui_font"]
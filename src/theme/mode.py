@@ -1,7 +1,8 @@
-"""Shared enum that defines the supported theme modes."""
+"""Shared enum and registry that define the supported theme modes."""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -10,6 +11,64 @@ class ThemeMode(str, Enum):
 
     LIGHT = "light"
     DARK = "dark"
+    HIGH_CONTRAST_LIGHT = "high_contrast_light"
+    HIGH_CONTRAST_DARK = "high_contrast_dark"
+    SEPIA = "sepia"
+    PROJECTOR = "projector"
 
+    @property
+    def index(self) -> int:
+        """Slot of this mode inside every mode-indexed colour vector."""
 
-__all__ = ["ThemeMode"]
+        return _MODE_SPECS[self].index
+
+
+@dataclass(frozen=True, slots=True)
+class ThemeModeSpec:
+    """Registry entry describing how a theme mode is presented and resolved.
+
+    ``fallback`` names the mode whose colour is reused for any token that does
+    not define an explicit value for this mode.
+    """
+
+    mode: ThemeMode
+    label: str
+    index: int
+    fallback: ThemeMode | None = None
+
+
+_MODE_SPECS: dict[ThemeMode, ThemeModeSpec] = {}
+
+
+def register_theme_mode(mode: ThemeMode, label: str, *, fallback: ThemeMode | None = None) -> ThemeModeSpec:
+    """Register ``mode`` and assign it the next colour-vector slot.
+
+    Modes must be registered before any ``ModeAwareColor`` is built, and a
+    fallback must already be registered so colour vectors can be filled in
+    registration order.
+    """
+
+    if mode in _MODE_SPECS:
+        raise ValueError(f"Theme mode '{mode.value}' is already registered.")
+    if fallback is not None and fallback not in _MODE_SPECS:
+        raise ValueError(f"Fallback mode '{fallback.value}' must be registered before '{mode.value}'.")
+    spec = ThemeModeSpec(mode=mode, label=label, index=len(_MODE_SPECS), fallback=fallback)
+    _MODE_SPECS[mode] = spec
+    return spec
+
+
+def registered_theme_modes() -> tuple[ThemeModeSpec, ...]:
+    """Return all registered modes ordered by their colour-vector slot."""
+
+    return tuple(_MODE_SPECS.values())
+
+
+register_theme_mode(ThemeMode.LIGHT, "Light Mode")
+register_theme_mode(ThemeMode.DARK, "Dark Mode")
+register_theme_mode(ThemeMode.HIGH_CONTRAST_LIGHT, "High Contrast Light", fallback=ThemeMode.LIGHT)
+register_theme_mode(ThemeMode.HIGH_CONTRAST_DARK, "High Contrast Dark", fallback=ThemeMode.DARK)
+register_theme_mode(ThemeMode.SEPIA, "Sepia", fallback=ThemeMode.LIGHT)
+register_theme_mode(ThemeMode.PROJECTOR, "Projector", fallback=ThemeMode.LIGHT)
+
+
+__all__ = ["ThemeMode", "ThemeModeSpec", "register_theme_mode", "registered_theme_modes"]
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 
 from assets.fonts.font_lists import DEFAULT_UI_FONT
 from theme.metrics import Metrics, build_metrics_for_ui_font
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StylePreferences:
     """User-facing knobs that influence the generated QSS."""
 
@@ -18,8 +18,11 @@ class StylePreferences:
     def build_metrics(self, template: Metrics | None = None) -> Metrics:
         """Return metrics adjusted to the current UI font settings."""
 
-        metrics = build_metrics_for_ui_font(self.ui_font_size, template=template)
-        return replace(metrics, font_family=self.ui_font_family)
+        return build_metrics_for_ui_font(
+            self.ui_font_size,
+            font_family=self.ui_font_family,
+            template=template,
+        )
 
 
 __all__ = ["StylePreferences"]
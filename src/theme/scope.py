@@ -0,0 +1,36 @@
+"""Theme overrides scoped to a single notebook (cell list)."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from theme.colors import Theme, get_theme
+from theme.metrics import Metrics
+from theme.mode import ThemeMode
+
+
+@dataclass(frozen=True, slots=True)
+class NotebookTheme:
+    """Theme a notebook uses instead of the application chrome theme.
+
+    ``mode`` ``None`` follows the chrome mode; ``accent`` replaces the focus
+    and highlight border colours of the notebook's cells.
+    """
+
+    mode: ThemeMode | None = None
+    accent: str | None = None
+
+    def follows_chrome(self) -> bool:
+        return self.mode is None and self.accent is None
+
+    def resolve(self, chrome_mode: ThemeMode, metrics: Metrics | None = None) -> Theme:
+        """Return the resolved theme for this notebook."""
+
+        theme = get_theme(self.mode or chrome_mode, metrics=metrics)
+        if self.accent is None:
+            return theme
+        border = replace(theme.border, highlight=self.accent, cell_in_focus=self.accent)
+        return replace(theme, border=border)
+
+
+__all__ = ["NotebookTheme"]
@@ -3,17 +3,19 @@
 Each helper exposes a typed dataclass so individual widget spacing can
 be adjusted without affecting other widgets. All defaults are derived
 from :class:`theme.metrics.Metrics` to keep global sizing coherent while
-still allowing targeted overrides.
+still allowing targeted overrides. Token sets are cached per ``Metrics``
+instance because both sides are immutable.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonTokens:
     border_width: int
     radius: int
@@ -31,6 +33,7 @@ class ButtonTokens:
     menubar_border_width: int
 
 
+@lru_cache(maxsize=8)
 def button_tokens(metrics: Metrics) -> ButtonTokens:
     return ButtonTokens(
         border_width=metrics.border_width_small,
@@ -50,7 +53,7 @@ def button_tokens(metrics: Metrics) -> ButtonTokens:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellContainerTokens:
     border_width: int
     border_radius: int
@@ -58,6 +61,7 @@ class CellContainerTokens:
     header_margin_bottom: int
 
 
+@lru_cache(maxsize=8)
 def cell_container_tokens(metrics: Metrics) -> CellContainerTokens:
     return CellContainerTokens(
         border_width=metrics.border_width,
@@ -67,7 +71,7 @@ def cell_container_tokens(metrics: Metrics) -> CellContainerTokens:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CellGutterTokens:
     border_width: int
     border_radius: int
@@ -75,6 +79,7 @@ class CellGutterTokens:
     label_min_width: int
 
 
+@lru_cache(maxsize=8)
 def cell_gutter_tokens(metrics: Metrics) -> CellGutterTokens:
     return CellGutterTokens(
         border_width=metrics.border_width,
@@ -84,7 +89,7 @@ def cell_gutter_tokens(metrics: Metrics) -> CellGutterTokens:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MenuBarTokens:
     border_width: int
     spacing: int
@@ -99,6 +104,7 @@ class MenuBarTokens:
     separator_margin_x: int
 
 
+@lru_cache(maxsize=8)
 def menubar_tokens(metrics: Metrics) -> MenuBarTokens:
     return MenuBarTokens(
         border_width=metrics.border_width_zero,
@@ -120,7 +126,7 @@ def menubar_tokens(metrics: Metrics) -> MenuBarTokens:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SidebarTokens:
     dock_border_width: int
     header_padding: int
@@ -133,6 +139,7 @@ class SidebarTokens:
     input_padding: int
 
 
+@lru_cache(maxsize=8)
 def sidebar_tokens(metrics: Metrics) -> SidebarTokens:
     return SidebarTokens(
         dock_border_width=metrics.border_width,
@@ -147,13 +154,14 @@ def sidebar_tokens(metrics: Metrics) -> SidebarTokens:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusBarTokens:
     border_width: int
     padding_horizontal: int
     min_height: int
 
 
+@lru_cache(maxsize=8)
 def statusbar_tokens(metrics: Metrics) -> StatusBarTokens:
     return StatusBarTokens(
         border_width=metrics.border_width,
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Benchmark notebook cell rendering strategies at growing notebook sizes.
+COMMAND: python src/tools/benchmark_cell_rendering.py --cells 1000 10000 100000
+- layout:   one CellRow per cell in a QVBoxLayout inside a QScrollArea (the
+            original approach; skipped above --max-layout-cells)
+- widgets:  NotebookView materialising CellRow widgets for visible rows only,
+            next to one shared CellGutter
+- pooled:   the same, with rows that scroll away recycled through RowPool
+- delegate: NotebookView painting every cell with CellDelegate
+- Reports build + first paint time, average scroll step (layout + repaint),
+  RSS growth, the number of QObjects under the list and, for pooled, the
+  share of rows that were recycled rather than built. Every run happens in
+  its own process so RSS numbers do not leak between strategies.
+- Runs offscreen unless QT_QPA_PLATFORM is already set.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+STRATEGIES = ("layout", "widgets", "pooled", "delegate")
+SCROLL_STEPS = 200
+
+
+def _rss_mb() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage / 1024 / 1024 if sys.platform == "darwin" else usage / 1024
+
+
+def _sample_cells(count: int):
+    from cells import CellData
+
+    return [
+        CellData(
+            "code" if index % 5 == 4 else "text",
+            f"Cell {index + 1}",
+            f"Body of cell {index + 1}; enough words to wrap once the window gets narrow enough.",
+        )
+        for index in range(count)
+    ]
+
+
+def _build(strategy: str, cells, theme):
+    from PySide6.QtWidgets import QScrollArea, QVBoxLayout, QWidget
+
+    from cells import NotebookDocument, load_cell_type
+    from ui.notebook.cell_delegate import CellDelegate
+    from ui.notebook.cell_gutter import CellGutter
+    from ui.notebook.cell_model import NotebookCellModel
+    from ui.notebook.cell_row import CellRow
+    from ui.notebook.cell_state import CellStatePalette
+    from ui.notebook.cell_view import NotebookView
+    from ui.notebook.row_pool import RowPool
+
+    state_palette = CellStatePalette.from_theme(theme)
+
+    def make_row(row: int, cell) -> CellRow:
+        return CellRow(cell, load_cell_type(cell.cell_type), state_palette=state_palette)
+
+    if strategy == "layout":
+        area = QScrollArea()
+        area.setWidgetResizable(True)
+        cell_list = QWidget()
+        cell_list.setProperty("cellType", "list")
+        layout = QVBoxLayout(cell_list)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(0)
+        for row, cell in enumerate(cells):
+            layout.addWidget(make_row(row, cell))
+        layout.addStretch()
+        area.setWidget(cell_list)
+        return area, area, None
+    pool = None
+    if strategy == "widgets":
+        view = NotebookView(row_factory=make_row, gutter=CellGutter(theme))
+    elif strategy == "pooled":
+        pool = RowPool(make_row)
+        view = NotebookView(row_factory=pool.acquire, row_release=pool.release, gutter=CellGutter(theme))
+    else:
+        view = NotebookView(delegate=CellDelegate(theme))
+    view.setProperty("cellType", "list")
+    view.set_model(NotebookCellModel(NotebookDocument(cells), view))
+    return view, view, pool
+
+
+def _count_objects(widget) -> int:
+    from PySide6.QtCore import QObject
+
+    return len(widget.findChildren(QObject))
+
+
+def run_child(strategy: str, count: int) -> dict:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from PySide6.QtWidgets import QApplication
+
+    from style_loader import apply_global_style
+    from theme import StylePreferences, ThemeMode, get_theme
+
+    app = QApplication([])
+    metrics = StylePreferences().build_metrics()
+    apply_global_style(app, mode=ThemeMode.DARK, metrics=metrics)
+    theme = get_theme(ThemeMode.DARK, metrics=metrics)
+    cells = _sample_cells(count)
+
+    def flush() -> None:
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    flush()
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    root, scroller, pool = _build(strategy, cells, theme)
+    root.resize(900, 600)
+    root.show()
+    flush()
+    root.repaint()
+    first_paint_ms = (time.perf_counter() - started) * 1000
+
+    scroll_bar = scroller.verticalScrollBar()
+    step = max(scroll_bar.pageStep() // 3, 1)
+    started = time.perf_counter()
+    for _ in range(SCROLL_STEPS):
+        scroll_bar.setValue(min(scroll_bar.value() + step, scroll_bar.maximum()))
+        flush()
+        root.repaint()
+    scroll_ms = (time.perf_counter() - started) * 1000 / SCROLL_STEPS
+
+    return {
+        "strategy": strategy,
+        "cells": count,
+        "first_paint_ms": round(first_paint_ms, 1),
+        "scroll_step_ms": round(scroll_ms, 2),
+        "rss_growth_mb": round(_rss_mb() - rss_before, 1),
+        "qobjects": _count_objects(root),
+        "reuse_rate": pool.stats().reuse_rate if pool is not None else None,
+    }
+
+
+def run(counts: list[int], strategies: list[str], max_layout_cells: int) -> None:
+    print(
+        f"{'strategy':<10}{'cells':>9}{'first paint':>14}{'scroll step':>14}{'RSS growth':>13}{'QObjects':>10}"
+        f"{'reused':>9}"
+    )
+    for count in counts:
+        for strategy in strategies:
+            if strategy == "layout" and count > max_layout_cells:
+                print(f"{strategy:<10}{count:>9}    skipped (> --max-layout-cells {max_layout_cells})")
+                continue
+            completed = subprocess.run(
+                [sys.executable, __file__, "--child", strategy, str(count)],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if completed.returncode != 0:
+                print(f"{strategy:<10}{count:>9}    failed: {completed.stderr.strip().splitlines()[-1:]}")
+                continue
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            reuse_rate = result["reuse_rate"]
+            print(
+                f"{strategy:<10}{count:>9}"
+                f"{result['first_paint_ms']:>11.1f} ms"
+                f"{result['scroll_step_ms']:>11.2f} ms"
+                f"{result['rss_growth_mb']:>10.1f} MB"
+                f"{result['qobjects']:>10}"
+                f"{'' if reuse_rate is None else f'{reuse_rate:.0%}':>9}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare CellRow widgets with the virtualized/delegate views")
+    parser.add_argument("--cells", type=int, nargs="+", default=[1000, 10000, 100000], help="Notebook sizes")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument(
+        "--max-layout-cells",
+        type=int,
+        default=10000,
+        help="Skip the all-widgets layout above this many cells (default: 10000)",
+    )
+    parser.add_argument("--child", nargs=2, metavar=("STRATEGY", "CELLS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(run_child(args.child[0], int(args.child[1]))))
+    else:
+        run(args.cells, args.strategies, args.max_layout_cells)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark cell selection toggles with each state rendering strategy.
+COMMAND: python src/tools/benchmark_cell_state.py --toggles 10000
+- polish:   CellRow widgets switching state the old way, through a dynamic
+            ``state`` property plus style unpolish/polish (the former
+            ``[state="selected"]`` QSS rules are restored for this run)
+- paint:    CellRow widgets painting state from a cached CellStatePalette
+- delegate: NotebookView painting every cell with CellDelegate
+- Every toggle goes through CellSelection and is followed by one event loop
+  pass. The state change (everything up to the repaint request, including
+  any style re-polish) and the repaint pass are timed separately. Toggles
+  cycle over the rows on screen.
+- Runs offscreen unless QT_QPA_PLATFORM is already set.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+STRATEGIES = ("polish", "paint", "delegate")
+NOTEBOOK_CELLS = 1000
+
+
+def _legacy_state_qss(theme) -> str:
+    focus = theme.border.cell_in_focus
+    return f'QFrame[cellType="container"][state="selected"] {{ border-color: {focus}; }}\n'
+
+
+def _run_strategy(app, strategy: str, toggles: int, theme) -> tuple[float, float]:
+    """Return seconds spent changing state and seconds spent repainting."""
+    from PySide6.QtCore import QCoreApplication, QEvent
+
+    from cells import CellData, NotebookDocument, load_cell_type
+    from ui.notebook.cell_delegate import CellDelegate
+    from ui.notebook.cell_gutter import CellGutter
+    from ui.notebook.cell_model import NotebookCellModel
+    from ui.notebook.cell_row import CellRow
+    from ui.notebook.cell_state import CellStatePalette
+    from ui.notebook.cell_view import NotebookView
+    from ui.notebook.selection import CellSelection
+
+    class PolishedCellRow(CellRow):
+        """CellRow switching state the way it did before state painting."""
+
+        def set_selected(self, selected: bool) -> None:
+            value = "selected" if selected else ""
+            widget = self._cell_frame
+            if widget.property("state") != value:
+                widget.setProperty("state", value)
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+
+        def set_focused(self, focused: bool) -> None:
+            pass
+
+    state_palette = CellStatePalette.from_theme(theme)
+    row_class = PolishedCellRow if strategy == "polish" else CellRow
+
+    def make_row(row: int, cell) -> CellRow:
+        module = load_cell_type(cell.cell_type)
+        return row_class(cell, module, state_palette=state_palette)
+
+    document = NotebookDocument(
+        CellData("code" if index % 5 == 4 else "text", f"Cell {index + 1}", f"Body of cell {index + 1}.")
+        for index in range(NOTEBOOK_CELLS)
+    )
+    if strategy == "delegate":
+        view = NotebookView(delegate=CellDelegate(theme))
+    else:
+        view = NotebookView(row_factory=make_row, gutter=CellGutter(theme))
+    view.setProperty("cellType", "list")
+    view.set_model(NotebookCellModel(document, view))
+    selection = CellSelection(document)
+    view.set_selection(selection)
+    view.resize(900, 600)
+    view.show()
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+    rows = list(view.visible_rows())
+    change_seconds = repaint_seconds = 0.0
+    for toggle in range(toggles):
+        started = time.perf_counter()
+        selection.toggle(rows[toggle % len(rows)])
+        changed = time.perf_counter()
+        app.processEvents()
+        change_seconds += changed - started
+        repaint_seconds += time.perf_counter() - changed
+    view.close()
+    view.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    return change_seconds, repaint_seconds
+
+
+def run(toggles: int, strategies: list[str]) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from style_loader import apply_global_style
+    from theme import StylePreferences, ThemeMode, get_theme
+
+    app = QApplication([])
+    metrics = StylePreferences().build_metrics()
+    apply_global_style(app, mode=ThemeMode.DARK, metrics=metrics)
+    theme = get_theme(ThemeMode.DARK, metrics=metrics)
+    base_qss = app.styleSheet()
+
+    print(f"Toggles: {toggles} (times per toggle)")
+    print(f"{'strategy':<10}{'state change':>15}{'repaint':>12}{'total':>12}")
+    for strategy in strategies:
+        app.setStyleSheet(base_qss + (_legacy_state_qss(theme) if strategy == "polish" else ""))
+        change_seconds, repaint_seconds = _run_strategy(app, strategy, toggles, theme)
+        print(
+            f"{strategy:<10}"
+            f"{change_seconds / toggles * 1e6:>12.1f} us"
+            f"{repaint_seconds / toggles * 1e6:>9.1f} us"
+            f"{(change_seconds + repaint_seconds) / toggles * 1e6:>9.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare cell state re-polish with state painting")
+    parser.add_argument("--toggles", type=int, default=10000, help="Selection toggles per strategy (default: 10000)")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    args = parser.parse_args()
+    run(args.toggles, args.strategies)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark the restyle path (metrics derivation + QSS assembly) without Qt.
+COMMAND: python src/tools/benchmark_restyle.py --iterations 2000
+- Reports time per restyle, time per Metrics derivation, traced memory
+  allocated per restyle and the in-memory size of the theme value types.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from style_loader import build_application_qss  # noqa: E402
+from theme import Metrics, StylePreferences, ThemeMode, get_theme  # noqa: E402
+
+
+def _instance_size(instance: object) -> int:
+    """Return the shallow size of an instance including its ``__dict__``."""
+
+    size = sys.getsizeof(instance)
+    instance_dict = getattr(instance, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def _restyle(preferences: StylePreferences, mode: ThemeMode) -> str:
+    metrics = preferences.build_metrics()
+    return build_application_qss(mode=mode, metrics=metrics)
+
+
+def _peak_allocation(preferences: StylePreferences, mode: ThemeMode, iterations: int) -> int:
+    """Return the average transient memory peak (bytes) of a single restyle."""
+
+    _restyle(preferences, mode)  # warm caches so only steady-state work is traced
+    tracemalloc.start()
+    total_peak = 0
+    for _ in range(iterations):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        _restyle(preferences, mode)
+        _, peak = tracemalloc.get_traced_memory()
+        total_peak += peak - baseline
+    tracemalloc.stop()
+    return total_peak // iterations
+
+
+def run(iterations: int, mode: ThemeMode) -> None:
+    preferences = StylePreferences(ui_font_size=13)
+
+    metrics_seconds = timeit.timeit(preferences.build_metrics, number=iterations)
+    restyle_seconds = timeit.timeit(lambda: _restyle(preferences, mode), number=iterations)
+    peak_bytes = _peak_allocation(preferences, mode, min(iterations, 200))
+
+    theme = get_theme(mode, metrics=preferences.build_metrics())
+    print(f"Iterations:                 {iterations}")
+    print(f"Metrics derivation:         {metrics_seconds / iterations * 1e6:8.2f} us/call")
+    print(f"Full restyle (QSS build):   {restyle_seconds / iterations * 1e6:8.2f} us/call")
+    print(f"Peak allocation/restyle:    {peak_bytes:8d} bytes")
+    print(f"Metrics instance size:      {_instance_size(Metrics()):8d} bytes")
+    print(f"BackgroundPalette size:     {_instance_size(theme.bg):8d} bytes")
+    print(f"ButtonPalette size:         {_instance_size(theme.buttons.primary):8d} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark metrics derivation and QSS assembly")
+    parser.add_argument("--iterations", type=int, default=2000, help="Number of restyles to time (default: 2000)")
+    parser.add_argument(
+        "--mode",
+        choices=[mode.value for mode in ThemeMode],
+        default=ThemeMode.DARK.value,
+        help="Theme mode to resolve while benchmarking",
+    )
+    args = parser.parse_args()
+    run(args.iterations, ThemeMode(args.mode))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark window resizes of the delegate cell list with and without the text layout cache.
+COMMAND: python src/tools/benchmark_text_layout.py --toggles 50
+- uncached: CellDelegate with a TextLayoutCache that keeps nothing, so every
+            measure and paint lays the body text out again
+- cached:   CellDelegate with the default TextLayoutCache
+- Each toggle narrows the list as a docked sidebar would and widens it
+  again; both resizes are laid out and repainted. The first toggle lays out
+  both widths and is reported on its own.
+- Runs offscreen unless QT_QPA_PLATFORM is already set.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+STRATEGIES = ("uncached", "cached")
+NOTEBOOK_CELLS = 2000
+WIDE, NARROW = 1200, 880
+
+
+def _run_strategy(app, strategy: str, toggles: int, theme) -> tuple[float, float, str]:
+    """Return ms for the first toggle, ms per later toggle and the cache statistics."""
+    from cells import CellData, NotebookDocument
+    from ui.notebook.cell_delegate import CellDelegate
+    from ui.notebook.cell_model import NotebookCellModel
+    from ui.notebook.cell_view import NotebookView
+    from ui.notebook.text_layout import TextLayoutCache
+
+    text_layouts = TextLayoutCache(max_size=0) if strategy == "uncached" else TextLayoutCache()
+    document = NotebookDocument(
+        CellData(
+            "code" if index % 5 == 4 else "text",
+            f"Cell {index + 1}",
+            f"Body of cell {index + 1}. " + "Enough words to wrap over several lines at either width. " * (1 + index % 4),
+        )
+        for index in range(NOTEBOOK_CELLS)
+    )
+    view = NotebookView(delegate=CellDelegate(theme, text_layouts=text_layouts))
+    view.setProperty("cellType", "list")
+    view.set_model(NotebookCellModel(document, view))
+    view.resize(WIDE, 900)
+    view.show()
+    app.processEvents()
+
+    def toggle() -> float:
+        started = time.perf_counter()
+        for width in (NARROW, WIDE):
+            view.resize(width, 900)
+            app.processEvents()
+            view.viewport().repaint()
+        return (time.perf_counter() - started) * 1000
+
+    first_ms = toggle()
+    later_ms = sum(toggle() for _ in range(toggles)) / toggles
+    stats = text_layouts.stats()
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return first_ms, later_ms, f"{stats.hit_rate:.0%}"
+
+
+def run(toggles: int, strategies: list[str]) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from style_loader import apply_global_style
+    from theme import StylePreferences, ThemeMode, get_theme
+
+    app = QApplication([])
+    metrics = StylePreferences().build_metrics()
+    apply_global_style(app, mode=ThemeMode.DARK, metrics=metrics)
+    theme = get_theme(ThemeMode.DARK, metrics=metrics)
+
+    print(f"Toggles: {toggles} ({WIDE} -> {NARROW} -> {WIDE} px, times per toggle)")
+    print(f"{'strategy':<10}{'first':>12}{'later':>12}{'hits':>8}")
+    for strategy in strategies:
+        first_ms, later_ms, hit_rate = _run_strategy(app, strategy, toggles, theme)
+        print(f"{strategy:<10}{first_ms:>9.2f} ms{later_ms:>9.2f} ms{hit_rate:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare delegate resizes with and without the text layout cache")
+    parser.add_argument("--toggles", type=int, default=50, help="Narrow/widen cycles per strategy (default: 50)")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    args = parser.parse_args()
+    run(args.toggles, args.strategies)
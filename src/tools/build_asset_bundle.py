@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Pack the bundled fonts and icons into one memory-mappable archive.
+COMMAND: python src/tools/build_asset_bundle.py
+- Output: src/assets/assets.bundle (read by utils.asset_bundle at runtime)
+- Fonts are taken from font_manifest.json (subsets when built), icons from src/icons/*.png|*.ico
+- Rebuild after changing any font or icon; without the archive the app
+  falls back to reading the individual files.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from utils.asset_bundle import DEFAULT_BUNDLE_PATH, write_asset_bundle  # noqa: E402
+from utils.font_loader import default_font_root, font_bundle_prefix, load_font_manifest  # noqa: E402
+
+ICON_DIR = SRC_DIR / "icons"
+ICON_EXTENSIONS = (".png", ".ico")
+
+
+def collect_entries() -> List[Tuple[str, Path]]:
+    entries: List[Tuple[str, Path]] = []
+    font_root = default_font_root()
+    prefix = font_bundle_prefix(font_root)
+    for files in load_font_manifest(font_root).values():
+        for relative in files:
+            entries.append((prefix + relative, font_root / relative))
+    for icon in sorted(ICON_DIR.iterdir()):
+        if icon.is_file() and icon.suffix.lower() in ICON_EXTENSIONS:
+            entries.append((f"icons/{icon.name}", icon))
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pack bundled fonts and icons into one archive")
+    parser.add_argument("--out", type=Path, default=DEFAULT_BUNDLE_PATH, help="Output archive path")
+    args = parser.parse_args()
+
+    entries = collect_entries()
+    index = write_asset_bundle(args.out, entries)
+    payload = sum(length for _offset, length in index.values())
+    print(f"Packed {len(index)} assets ({payload / 1024:.0f} KiB) into {args.out} ({args.out.stat().st_size / 1024:.0f} KiB)")
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Regenerate src/assets/fonts/font_manifest.json (bundled family -> font files).
+COMMAND: python src/tools/build_font_manifest.py
+- Run after adding, removing or renaming files under src/assets/fonts/<Family>/.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from utils.font_loader import build_font_manifest, write_font_manifest  # noqa: E402
+
+
+if __name__ == "__main__":
+    manifest_path = write_font_manifest()
+    for family, files in build_font_manifest().items():
+        print(f"  {family}: {len(files)} files")
+    print(f"Wrote {manifest_path}")
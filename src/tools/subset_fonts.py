@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Build glyph/weight subsets of the bundled UI fonts.
+COMMAND: python src/tools/subset_fonts.py --locale en
+- Requires fontTools: pip install fonttools
+- Output: src/assets/fonts/subsets/<Family>/... plus its own font_manifest.json;
+  utils.font_loader registers these instead of the full files once they exist.
+- Keeps the Unicode ranges of the chosen locale(s) (FONT_SUBSET_LOCALES in
+  assets/fonts/font_lists.py) and only the upright weights in
+  FONT_SUBSET_BASE_WEIGHTS plus those referenced by the rendered QSS.
+- Reports size and Qt registration time of the original vs subset files.
+- Rebuild the asset bundle afterwards: python src/tools/build_asset_bundle.py
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+try:
+    from fontTools import subset
+except ImportError:
+    raise SystemExit("fontTools is required. Install with: pip install fonttools")
+
+from assets.fonts.font_lists import (  # noqa: E402
+    BUNDLED_FONTS,
+    DEFAULT_FONT_SUBSET_LOCALE,
+    FONT_SUBSET_BASE_WEIGHTS,
+    FONT_SUBSET_LOCALES,
+    FONT_SUBSET_UNICODE_RANGES,
+)
+from utils.font_loader import (  # noqa: E402
+    DEFAULT_FONT_ROOT,
+    SUBSET_FONT_ROOT,
+    build_font_manifest,
+    write_font_manifest,
+)
+
+STYLE_WEIGHTS = {
+    "thin": 100,
+    "extralight": 200,
+    "light": 300,
+    "regular": 400,
+    "medium": 500,
+    "semibold": 600,
+    "bold": 700,
+    "extrabold": 800,
+    "black": 900,
+}
+FONT_WEIGHT_PATTERN = re.compile(r"font-weight\s*:\s*(\d+|bold|normal)", re.IGNORECASE)
+
+
+def parse_style(relative: str) -> Tuple[int, bool]:
+    """Return (weight, italic) from a ``Family-Style.ext`` file name."""
+
+    stem = Path(relative).stem
+    style = stem.split("-", 1)[1] if "-" in stem else "Regular"
+    style = style.replace("-", "").lower()
+    italic = style.endswith("italic")
+    weight_name = style[: -len("italic")] if italic else style
+    return STYLE_WEIGHTS.get(weight_name or "regular", 400), italic
+
+
+def qss_font_weights() -> Set[int]:
+    """Collect the numeric font weights referenced by the rendered QSS in every mode."""
+
+    from style_loader import build_application_qss
+    from theme import StylePreferences, registered_theme_modes
+
+    metrics = StylePreferences().build_metrics()
+    weights: Set[int] = set()
+    for spec in registered_theme_modes():
+        for value in FONT_WEIGHT_PATTERN.findall(build_application_qss(mode=spec.mode, metrics=metrics)):
+            lowered = value.lower()
+            weights.add(700 if lowered == "bold" else 400 if lowered == "normal" else int(lowered))
+    return weights
+
+
+def select_files(files: Iterable[str], wanted_weights: Set[int]) -> List[str]:
+    """Keep the upright file closest to each wanted weight (ties go to the heavier)."""
+
+    upright = {}
+    for relative in files:
+        weight, italic = parse_style(relative)
+        if not italic:
+            upright[weight] = relative
+    if not upright:
+        return []
+    keep: Set[str] = set()
+    for wanted in wanted_weights:
+        nearest = min(upright, key=lambda weight: (abs(weight - wanted), -weight))
+        keep.add(upright[nearest])
+    return sorted(keep)
+
+
+def subset_font(source: Path, target: Path, unicodes: List[int]) -> None:
+    options = subset.Options()
+    options.layout_features = ["*"]  # keep ligatures (Fira Code) and kerning
+    options.notdef_outline = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes)
+    subsetter.subset(font)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    subset.save_font(font, str(target), options)
+    font.close()
+
+
+def time_registration(paths: Iterable[Path]) -> Dict[Path, float]:
+    """Return seconds spent in ``QFontDatabase.addApplicationFont`` per file."""
+
+    try:
+        from PySide6.QtGui import QFontDatabase, QGuiApplication
+    except ModuleNotFoundError:
+        return {}
+
+    if QGuiApplication.instance() is None:
+        time_registration.app = QGuiApplication(["subset_fonts", "-platform", "offscreen"])
+    timings: Dict[Path, float] = {}
+    for path in paths:
+        started = time.perf_counter()
+        font_id = QFontDatabase.addApplicationFont(str(path))
+        timings[path] = time.perf_counter() - started
+        if font_id != -1:
+            QFontDatabase.removeApplicationFont(font_id)
+    return timings
+
+
+def _unicodes_for_locales(locales: Iterable[str]) -> List[int]:
+    ranges: List[str] = []
+    for locale in locales:
+        if locale not in FONT_SUBSET_LOCALES:
+            raise SystemExit(f"Unknown locale {locale!r}; choose from {', '.join(FONT_SUBSET_LOCALES)}")
+        ranges.extend(FONT_SUBSET_UNICODE_RANGES[name] for name in FONT_SUBSET_LOCALES[locale])
+    return sorted(set(subset.parse_unicodes(",".join(ranges))))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Subset the bundled UI fonts by locale and used weights")
+    parser.add_argument(
+        "--locale",
+        action="append",
+        choices=sorted(FONT_SUBSET_LOCALES),
+        help=f"Locale whose glyph ranges to keep (repeatable, default {DEFAULT_FONT_SUBSET_LOCALE})",
+    )
+    parser.add_argument("--weight", type=int, action="append", default=[], help="Extra weight to keep (repeatable)")
+    parser.add_argument("--no-timing", action="store_true", help="Skip measuring Qt registration time")
+    args = parser.parse_args()
+
+    locales = args.locale or [DEFAULT_FONT_SUBSET_LOCALE]
+    unicodes = _unicodes_for_locales(locales)
+    wanted_weights = set(FONT_SUBSET_BASE_WEIGHTS) | qss_font_weights() | set(args.weight)
+    print(f"Locales: {', '.join(locales)} ({len(unicodes)} code points); weights: {sorted(wanted_weights)}")
+
+    if SUBSET_FONT_ROOT.exists():
+        shutil.rmtree(SUBSET_FONT_ROOT)
+
+    full_manifest = build_font_manifest(DEFAULT_FONT_ROOT)
+    subsets: List[Path] = []
+    for family in BUNDLED_FONTS:
+        files = full_manifest.get(family, [])
+        kept = select_files(files, wanted_weights)
+        for relative in kept:
+            source = DEFAULT_FONT_ROOT / relative
+            target = SUBSET_FONT_ROOT / relative
+            subset_font(source, target, unicodes)
+            subsets.append(target)
+        family_size = sum((DEFAULT_FONT_ROOT / relative).stat().st_size for relative in files)
+        subset_size = sum((SUBSET_FONT_ROOT / relative).stat().st_size for relative in kept)
+        print(
+            f"  {family}: {len(files)} -> {len(kept)} files, "
+            f"{family_size / 1024:.0f} KiB -> {subset_size / 1024:.0f} KiB"
+        )
+    manifest_path = write_font_manifest(SUBSET_FONT_ROOT)
+
+    total_before = sum(path.stat().st_size for files in full_manifest.values() for path in (DEFAULT_FONT_ROOT / f for f in files))
+    total_after = sum(path.stat().st_size for path in subsets)
+    print(f"Size: {total_before / 1024:.0f} KiB -> {total_after / 1024:.0f} KiB ({100 * (1 - total_after / total_before):.0f}% smaller)")
+
+    if not args.no_timing:
+        all_originals = [DEFAULT_FONT_ROOT / f for files in full_manifest.values() for f in files]
+        before = time_registration(all_originals)
+        after = time_registration(subsets)
+        if before and after:
+            before_ms = sum(before.values()) * 1000
+            after_ms = sum(after.values()) * 1000
+            print(f"Qt registration: {before_ms:.1f} ms -> {after_ms:.1f} ms (all families)")
+    print(f"Wrote {manifest_path}")
@@ -1,5 +1,28 @@
-"""Lightweight UI helper widgets used by the LunaQt2 window."""
+"""Lightweight UI helper widgets used by the LunaQt2 window.
 
-from .sidebars import NotebookSidebarWidget, SettingsSidebarWidget
+Exports resolve lazily so importing :mod:`ui` does not pull in Qt widget
+modules until a widget class is actually used.
+"""
 
-__all__ = ["NotebookSidebarWidget", "SettingsSidebarWidget"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "LunaQtWindow": ".main_window",
+    "NotebookSidebarWidget": ".sidebars",
+    "SettingsSidebarWidget": ".sidebars",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = ["LunaQtWindow", "NotebookSidebarWidget", "SettingsSidebarWidget"]
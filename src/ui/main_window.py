@@ -0,0 +1,810 @@
+"""Main LunaQt2 window hosting the virtualized notebook cell list."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import replace
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterable, Iterator, Sequence
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QByteArray, Qt, QTimer, Signal
+    from PySide6.QtGui import QAction, QActionGroup, QIcon, QKeySequence
+    from PySide6.QtWidgets import (
+        QApplication,
+        QHBoxLayout,
+        QLabel,
+        QMainWindow,
+        QPushButton,
+        QStatusBar,
+        QToolBar,
+        QVBoxLayout,
+        QWidget,
+    )
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to run LunaQt2.") from exc
+
+from constants import (
+    CELL_INSERT_CHUNK_SIZE,
+    CELL_RENDERERS,
+    DEFAULT_CELL_RENDERER,
+    DEFAULT_SIDEBAR_WIDTH,
+    DEFERRED_BUILD_SLICE_MS,
+    FONT_PRELOAD_INTERVAL_MS,
+    FONT_SIZE_STEP as UI_FONT_SIZE_STEP,
+    MAX_SIDEBAR_WIDTH,
+    MAX_UI_FONT_POINT_SIZE,
+    MIN_SIDEBAR_WIDTH,
+    MIN_UI_FONT_POINT_SIZE,
+    PRELOAD_FONTS_WHEN_IDLE,
+    SESSION_SAVE_DELAY_MS,
+    SIDEBAR_EVICT_AFTER_MS,
+    clamp_ui_font_point_size,
+)
+from cells import CellData, CellRecord, NotebookDocument, load_cell_type
+from style_loader import apply_global_style, build_notebook_qss
+from theme import Metrics, NotebookTheme, StylePreferences, Theme, registered_theme_modes
+from utils.asset_bundle import load_pixmap
+from utils.diagnostics import record_font_registry, record_style
+from utils.font_loader import FontRegistry, get_font_registry
+from utils.session import SessionSnapshot, save_session
+from utils.tracing import instant, span, traced
+
+from .notebook.cell_delegate import CellDelegate
+from .notebook.cell_gutter import CellGutter
+from .notebook.cell_model import NotebookCellModel
+from .notebook.cell_row import CellRow
+from .notebook.cell_state import CellStatePalette
+from .notebook.cell_view import NotebookView
+from .notebook.row_pool import RowPool
+from .notebook.selection import CellSelection
+from .sidebars.panel_registry import SidebarPanelRegistry, SidebarPanelSpec
+
+QPushButtonType = Any
+
+NOTEBOOKS_SIDEBAR = "NotebooksDock"
+SETTINGS_SIDEBAR = "SettingsDock"
+
+SAMPLE_CELLS: tuple[CellData, ...] = (
+    CellData(
+        "text",
+        "Notebook Cell",
+        "Cells use the container styling, letting you compose editors, tables, or any widget inside.",
+    ),
+    CellData(
+        "text",
+        "Selection Support",
+        "Click the body to focus a cell. Click the gutter again to clear selection and reset the border.",
+    ),
+    CellData(
+        "text",
+        "Custom Content",
+        "Swap these labels for your own widgets; LunaQt2 just showcases layout and styling hooks.",
+    ),
+    CellData(
+        "code",
+        "Code Cell",
+        "def circle_area(radius):\n    return 3.14159 * radius ** 2",
+    ),
+)
+
+
+def _load_sidebar_widgets():  # pragma: no cover - import helper
+    """Import the sidebar panels on first use; they are not needed for the first frame."""
+    return import_module(".sidebars", __package__)
+
+
+class LunaQtWindow(QMainWindow):
+    """Main LunaQt2 window that lights up the different style modules.
+
+    Construction is staged: ``__init__`` builds the chrome and the cell list,
+    whose view only creates widgets for the visible cells, and the View menu
+    entries are built in idle slices after the first frame has been painted.
+    Sidebar docks and panels are created by the panel registry the first time
+    they are shown.
+    """
+
+    first_frame_shown = Signal(float)
+    # (inserted, total) after each step of an insert_cells() batch.
+    cell_insert_progress = Signal(int, int)
+
+    @traced()
+    def __init__(
+        self,
+        app: Any,
+        mode,
+        *,
+        ui_font_choices: Sequence[str],
+        style_preferences: StylePreferences | None = None,
+        notebook_theme: NotebookTheme | None = None,
+        font_registry: FontRegistry | None = None,
+        cells: Sequence[CellData] = SAMPLE_CELLS,
+        startup_started_ns: int | None = None,
+        session: SessionSnapshot | None = None,
+        session_path: Path | None = None,
+        cell_renderer: str = DEFAULT_CELL_RENDERER,
+    ) -> None:
+        super().__init__()
+        if cell_renderer not in CELL_RENDERERS:
+            raise ValueError(f"Unknown cell renderer {cell_renderer!r}; expected one of {CELL_RENDERERS}.")
+        self._cell_renderer = cell_renderer
+        self._session_path = session_path
+        self._last_saved_session = session
+        self._session_timer: QTimer | None = None
+        self._startup_started_ns = startup_started_ns or time.perf_counter_ns()
+        self._time_to_first_frame_ms: float | None = None
+        self._deferred_stages: deque[tuple[str, Iterator[None]]] = deque()
+        self._deferred_timer: QTimer | None = None
+        self._app = app
+        self._font_registry = font_registry or get_font_registry()
+        self._font_preload_timer: QTimer | None = None
+        self._mode = mode
+        self._notebook_theme = notebook_theme or NotebookTheme()
+        self._available_ui_fonts = list(ui_font_choices)
+        if not self._available_ui_fonts:
+            raise ValueError("At least one UI font choice must be provided.")
+        base_preferences = style_preferences or StylePreferences()
+        normalized_size = clamp_ui_font_point_size(base_preferences.ui_font_size)
+        if base_preferences.ui_font_size != normalized_size:
+            base_preferences = replace(base_preferences, ui_font_size=normalized_size)
+        if base_preferences.ui_font_family not in self._available_ui_fonts:
+            base_preferences = replace(base_preferences, ui_font_family=self._available_ui_fonts[0])
+        self._style_preferences = base_preferences
+        self._font_registry.ensure_family(base_preferences.ui_font_family)
+        self._theme_group = QActionGroup(self)
+        self._theme_group.setExclusive(True)
+        self._theme_actions: dict[str, Any] = {}
+        self._notebook_theme_group = QActionGroup(self)
+        self._notebook_theme_group.setExclusive(True)
+        self._notebook_theme_actions: dict[str | None, Any] = {}
+        self._document = NotebookDocument(cells)
+        self._cell_model = NotebookCellModel(self._document, self)
+        self._cell_list: NotebookView | None = None
+        self._cell_delegate: CellDelegate | None = None
+        self._cell_state_palette: CellStatePalette | None = None
+        self._row_pool: RowPool | None = None
+        self._selection = CellSelection(self._document)
+        selected_cell = session.selected_cell if session is not None else None
+        if selected_cell is not None and 0 <= selected_cell < len(cells):
+            self._selection.select(selected_cell)
+        self._selection.add_listener(self._handle_selection_changed)
+        # Cell-type plugins are imported only for the types this notebook contains.
+        self._cell_modules: tuple[ModuleType, ...] = tuple(
+            dict.fromkeys(load_cell_type(cell_type) for cell_type in dict.fromkeys(cell.cell_type for cell in cells))
+        )
+        self._view_menu: Any = None
+        self._view_menu_built = False
+        self._sidebars = SidebarPanelRegistry(
+            self,
+            width_for=self._normalize_sidebar_width,
+            evict_after_ms=SIDEBAR_EVICT_AFTER_MS,
+        )
+        self._sidebars.register(SidebarPanelSpec(NOTEBOOKS_SIDEBAR, "Notebooks", self._create_notebooks_panel))
+        self._sidebars.register(SidebarPanelSpec(SETTINGS_SIDEBAR, "Settings", self._create_settings_panel))
+        self._sidebar_buttons: dict[str, QPushButtonType] = {}
+        self._move_up_button: QPushButtonType | None = None
+        self._move_down_button: QPushButtonType | None = None
+
+        self.setWindowTitle("LunaQt2")
+        window_icon = load_pixmap("icons/icon.png")
+        if window_icon is not None and not window_icon.isNull():
+            self.setWindowIcon(QIcon(window_icon))
+        self.resize(900, 600)
+
+        self._build_menubar()
+        self._build_toolbar()
+        self._build_central()
+        self._build_statusbar()
+        if session is not None:
+            self._restore_layout(session)
+        self._apply_current_style()
+
+        self._defer_stage("view menu", self._build_view_menu_stage())
+
+    def _restore_layout(self, session: SessionSnapshot) -> None:
+        """Apply geometry and sidebar layout from the previous session before the first show."""
+        if session.geometry:
+            self.restoreGeometry(QByteArray.fromBase64(session.geometry.encode("ascii")))
+        registered = {spec.object_name for spec in self._sidebars.specs()}
+        for object_name, width in session.sidebar_widths.items():
+            if object_name in registered:
+                self._sidebars.set_width(object_name, width)
+        button = self._sidebar_buttons.get(session.visible_sidebar or "")
+        if button is not None:
+            button.setChecked(True)
+
+    def capture_session(self) -> SessionSnapshot:
+        """Return the state to restore on the next launch."""
+        notebook_mode = self._notebook_theme.mode
+        return SessionSnapshot(
+            mode=self._mode.value,
+            notebook_mode=notebook_mode.value if notebook_mode is not None else None,
+            ui_font_size=self._style_preferences.ui_font_size,
+            ui_font_family=self._style_preferences.ui_font_family,
+            geometry=bytes(self.saveGeometry().toBase64()).decode("ascii"),
+            visible_sidebar=self._sidebars.visible_sidebar(),
+            sidebar_widths={
+                spec.object_name: width
+                for spec in self._sidebars.specs()
+                if (width := self._sidebars.width(spec.object_name)) is not None
+            },
+            selected_cell=self._selected_cell_index(),
+        )
+
+    def _schedule_session_save(self) -> None:
+        """Coalesce changes into one snapshot write after ``SESSION_SAVE_DELAY_MS``."""
+        if self._session_path is None:
+            return
+        if self._session_timer is None:
+            self._session_timer = QTimer(self)
+            self._session_timer.setSingleShot(True)
+            self._session_timer.setInterval(SESSION_SAVE_DELAY_MS)
+            self._session_timer.timeout.connect(self.save_session)
+        self._session_timer.start()
+
+    @traced()
+    def save_session(self) -> None:
+        if self._session_path is None:
+            return
+        if self._session_timer is not None:
+            self._session_timer.stop()
+        snapshot = self.capture_session()
+        if snapshot == self._last_saved_session:
+            return
+        try:
+            save_session(snapshot, self._session_path)
+        except OSError:
+            return
+        self._last_saved_session = snapshot
+
+    def resizeEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        super().resizeEvent(event)
+        self._schedule_session_save()
+
+    def moveEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        super().moveEvent(event)
+        self._schedule_session_save()
+
+    def closeEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        self.save_session()
+        super().closeEvent(event)
+
+    @property
+    def time_to_first_frame_ms(self) -> float | None:
+        """Milliseconds from ``startup_started_ns`` to the first paint, once painted."""
+        return self._time_to_first_frame_ms
+
+    def paintEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        super().paintEvent(event)
+        if self._time_to_first_frame_ms is not None:
+            return
+        self._time_to_first_frame_ms = (time.perf_counter_ns() - self._startup_started_ns) / 1e6
+        instant("first frame", time_to_first_frame_ms=round(self._time_to_first_frame_ms, 3))
+        self.first_frame_shown.emit(self._time_to_first_frame_ms)
+        self._start_deferred_build()
+
+    def _defer_stage(self, name: str, steps: Iterator[None]) -> None:
+        self._deferred_stages.append((name, steps))
+
+    def _start_deferred_build(self) -> None:
+        if self._deferred_timer is not None or not self._deferred_stages:
+            return
+        timer = QTimer(self)
+        timer.setInterval(0)
+        timer.timeout.connect(self._run_deferred_slice)
+        timer.start()
+        self._deferred_timer = timer
+
+    def _run_deferred_slice(self) -> None:
+        """Run deferred construction steps until the slice budget is used up."""
+        deadline = time.perf_counter() + DEFERRED_BUILD_SLICE_MS / 1000
+        with span("deferred build slice"):
+            while self._deferred_stages and time.perf_counter() < deadline:
+                self._run_deferred_step()
+        if not self._deferred_stages and self._deferred_timer is not None:
+            self._deferred_timer.stop()
+            self._deferred_timer.deleteLater()
+            self._deferred_timer = None
+            instant("deferred build complete")
+
+    def _run_deferred_step(self) -> None:
+        _name, steps = self._deferred_stages[0]
+        try:
+            next(steps)
+        except StopIteration:
+            self._deferred_stages.popleft()
+
+    def finish_staged_build(self) -> None:
+        """Build everything still pending right away (e.g. before it is needed)."""
+        while self._deferred_stages:
+            self._run_deferred_step()
+
+    @traced()
+    def _build_menubar(self) -> None:
+        menu_bar = self.menuBar()
+        menu_bar.setObjectName("MainMenuBar")
+
+        file_menu = menu_bar.addMenu("File")
+        file_menu.setProperty("menuRole", "primary")
+        file_menu.addAction("New")
+        file_menu.addAction("Save")
+        file_menu.addAction("Save As…")
+
+        edit_menu = menu_bar.addMenu("Edit")
+        edit_menu.setProperty("menuRole", "primary")
+        edit_menu.addAction("Move Cell Up", QKeySequence("Alt+Up"), self._on_move_cell_up_clicked)
+        edit_menu.addAction("Move Cell Down", QKeySequence("Alt+Down"), self._on_move_cell_down_clicked)
+        edit_menu.addSeparator()
+        edit_menu.addAction("Delete Cell")
+        edit_menu.addAction("Delete Notebook")
+
+        view_menu = menu_bar.addMenu("View")
+        view_menu.setProperty("menuRole", "primary")
+        view_menu.aboutToShow.connect(self._ensure_view_menu)
+        self._view_menu = view_menu
+
+        self._install_cell_action_buttons(menu_bar)
+        self._install_sidebar_corner_buttons(menu_bar)
+
+    def _build_view_menu_stage(self) -> Iterator[None]:
+        self._ensure_view_menu()
+        yield
+
+    @traced()
+    def _ensure_view_menu(self) -> None:
+        """Populate the View menu; runs after the first frame or when it is opened."""
+        if self._view_menu_built or self._view_menu is None:
+            return
+        self._view_menu_built = True
+        view_menu = self._view_menu
+
+        for mode_spec in registered_theme_modes():
+            mode_value = mode_spec.mode
+            action = QAction(mode_spec.label, self)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, m=mode_value: self._switch_theme(m) if checked else None)
+            view_menu.addAction(action)
+            self._theme_group.addAction(action)
+            self._theme_actions[mode_value.value] = action
+
+        # Ensure the action that matches the current theme is checked.
+        self._theme_actions[self._mode.value].setChecked(True)
+
+        self._build_notebook_theme_menu(view_menu)
+
+    def _build_notebook_theme_menu(self, view_menu) -> None:
+        """Add a submenu that lets the notebook use a theme distinct from the chrome."""
+        view_menu.addSeparator()
+        notebook_menu = view_menu.addMenu("Notebook Theme")
+        notebook_menu.setProperty("menuRole", "primary")
+
+        choices: list[tuple[str, Any]] = [("Follow App Theme", None)]
+        choices.extend((mode_spec.label, mode_spec.mode) for mode_spec in registered_theme_modes())
+        for label, mode_value in choices:
+            action = QAction(label, self)
+            action.setCheckable(True)
+            action.triggered.connect(
+                lambda checked, m=mode_value: self._switch_notebook_mode(m) if checked else None
+            )
+            notebook_menu.addAction(action)
+            self._notebook_theme_group.addAction(action)
+            key = mode_value.value if mode_value is not None else None
+            self._notebook_theme_actions[key] = action
+
+        current_mode = self._notebook_theme.mode
+        current_key = current_mode.value if current_mode is not None else None
+        self._notebook_theme_actions[current_key].setChecked(True)
+
+    def _install_cell_action_buttons(self, menu_bar) -> None:
+        """Store button references to be added to corner widget."""
+        move_up_btn = QPushButton("Move cell up ↑")
+        move_up_btn.setProperty("btnType", "menubar")
+        move_up_btn.setToolTip("Move Cell Up")
+        #move_up_btn.setFixedWidth(32)
+        move_up_btn.clicked.connect(self._on_move_cell_up_clicked)
+        
+        move_down_btn = QPushButton("Move cell down ↓")
+        move_down_btn.setProperty("btnType", "menubar")
+        move_down_btn.setToolTip("Move Cell Down")
+        #move_down_btn.setFixedWidth(32)
+        move_down_btn.clicked.connect(self._on_move_cell_down_clicked)
+        
+        self._move_up_button = move_up_btn
+        self._move_down_button = move_down_btn
+
+    def _install_sidebar_corner_buttons(self, menu_bar) -> None: # The buttons Settings, Notebooks and so on
+        corner = QWidget(menu_bar)
+        corner.setProperty("widgetRole", "menubar-corner")
+        layout = QHBoxLayout(corner)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+
+        # Add cell action buttons first
+        if hasattr(self, '_move_up_button') and hasattr(self, '_move_down_button'):
+            layout.addWidget(self._move_up_button)
+            layout.addWidget(self._move_down_button)
+
+        for spec in self._sidebars.specs():
+            button = QPushButton(spec.title, corner)
+            button.setCheckable(True)
+            button.setProperty("btnType", "menubar")
+            button.toggled.connect(
+                lambda checked, name=spec.object_name, btn=button: (
+                    self._toggle_sidebar(name, checked),
+                    self._refresh_button_style(btn),
+                )
+            )
+            layout.addWidget(button)
+            self._sidebar_buttons[spec.object_name] = button
+
+        layout.addStretch(1)
+        menu_bar.setCornerWidget(corner, Qt.Corner.TopRightCorner)
+
+    @traced()
+    def _build_toolbar(self) -> None:
+        toolbar = QToolBar("Main Toolbar")
+        toolbar.setObjectName("PrimaryToolBar")
+        toolbar.setMovable(False)
+        primary_btn = QPushButton("Primary")
+        primary_btn.setProperty("btnType", "primary")
+
+        toolbar_btn = QPushButton("Toolbar")
+        toolbar_btn.setProperty("btnType", "toolbar")
+
+        warn_btn = QPushButton("Warn")
+        warn_btn.setProperty("btnType", "warning")
+
+        toolbar.addWidget(primary_btn)
+        toolbar.addWidget(toolbar_btn)
+        toolbar.addWidget(warn_btn)
+
+        self.addToolBar(toolbar)
+
+    @traced()
+    def _build_central(self) -> None:
+        central = QWidget()
+        layout = QVBoxLayout(central)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        if self._cell_renderer == "delegate":
+            delegate = CellDelegate(self._resolved_notebook_theme(self._current_metrics()))
+            delegate.preload(self._cell_modules)
+            self._cell_delegate = delegate
+            cell_list = NotebookView(delegate=delegate)
+            delegate.setParent(cell_list)
+        else:
+            self._row_pool = RowPool(self._create_cell_row)
+            cell_list = NotebookView(
+                row_factory=self._row_pool.acquire,
+                row_release=self._row_pool.release,
+                gutter=CellGutter(self._resolved_notebook_theme(self._current_metrics())),
+            )
+        cell_list.cell_pressed.connect(self._handle_cell_pressed)
+        cell_list.gutter_pressed.connect(self._handle_gutter_pressed)
+        cell_list.setProperty("cellType", "list")
+        cell_list.set_model(self._cell_model)
+        cell_list.set_selection(self._selection)
+        self._cell_list = cell_list
+        layout.addWidget(cell_list)
+
+        self.setCentralWidget(central)
+
+    def _create_cell_row(self, row: int, cell: CellData) -> CellRow:
+        """Row factory for the cell list; called only for rows scrolled into view."""
+        cell_row = CellRow(
+            cell=cell,
+            cell_module=load_cell_type(cell.cell_type),
+            state_palette=self._current_cell_state_palette(),
+        )
+        return cell_row
+
+    def _current_cell_state_palette(self) -> CellStatePalette:
+        if self._cell_state_palette is None:
+            self._cell_state_palette = CellStatePalette.from_theme(
+                self._resolved_notebook_theme(self._current_metrics())
+            )
+        return self._cell_state_palette
+
+    @traced()
+    def _build_statusbar(self) -> None:
+        status = QStatusBar()
+        status.setObjectName("MainStatusBar")
+        status.showMessage("Ready")
+
+        warning_label = QLabel("Unsaved changes")
+        warning_label.setProperty("statusRole", "warning")
+        status.addPermanentWidget(warning_label)
+
+        self.setStatusBar(status)
+
+    def _create_notebooks_panel(self, parent: QWidget) -> QWidget:
+        return _load_sidebar_widgets().NotebookSidebarWidget(parent)
+
+    def _create_settings_panel(self, parent: QWidget) -> QWidget:
+        settings_panel = _load_sidebar_widgets().SettingsSidebarWidget(
+            parent,
+            ui_font_size=self._style_preferences.ui_font_size,
+            ui_font_family=self._style_preferences.ui_font_family,
+            ui_font_choices=list(self._available_ui_fonts),
+            min_font_size=MIN_UI_FONT_POINT_SIZE,
+            max_font_size=MAX_UI_FONT_POINT_SIZE,
+            step=UI_FONT_SIZE_STEP,
+        )
+        settings_panel.ui_font_size_changed.connect(self._handle_ui_font_size_changed)
+        settings_panel.ui_font_family_changed.connect(self._handle_ui_font_family_changed)
+        return settings_panel
+
+    def _normalize_sidebar_width(self, desired: int | None) -> int:
+        width = desired or DEFAULT_SIDEBAR_WIDTH
+        width = max(width, MIN_SIDEBAR_WIDTH)
+        if MAX_SIDEBAR_WIDTH:
+            width = min(width, MAX_SIDEBAR_WIDTH)
+        return width
+
+    def _refresh_button_style(self, button: QPushButtonType) -> None:
+        """Force Qt to reapply button styling after state change."""
+        button.style().unpolish(button)
+        button.style().polish(button)
+        button.update()
+
+    @traced()
+    def _toggle_sidebar(self, object_name: str, checked: bool) -> None:
+        """Show one sidebar at a time; panels are created on first show."""
+        self._schedule_session_save()
+        if not checked:
+            self._sidebars.hide(object_name)
+            return
+        for other_name, button in self._sidebar_buttons.items():
+            if other_name != object_name:
+                button.setChecked(False)
+        self._sidebars.show(object_name)
+
+    def _current_metrics(self) -> Metrics:
+        return self._style_preferences.build_metrics()
+
+    @traced()
+    def _apply_current_style(self) -> None:
+        metrics = self._current_metrics()
+        apply_global_style(self._app, mode=self._mode, metrics=metrics)
+        record_style(self._mode, metrics)
+        self._apply_notebook_style(metrics)
+        if self._cell_list is not None:
+            self._cell_list.invalidate_heights()
+
+    def _resolved_notebook_theme(self, metrics: Metrics) -> Theme:
+        return self._notebook_theme.resolve(self._mode, metrics=metrics)
+
+    def _apply_notebook_style(self, metrics: Metrics) -> None:
+        """Scope the notebook theme to the cell list root; empty when it follows the chrome."""
+        if self._cell_list is None:
+            return
+        theme = self._resolved_notebook_theme(metrics)
+        if self._cell_delegate is not None:
+            if self._cell_delegate.set_theme(theme):
+                self._cell_list.invalidate_heights()
+            self._cell_list.viewport().update()
+        else:
+            if self._cell_list.gutter().set_theme(theme):
+                self._cell_list.invalidate_heights()
+            state_palette = CellStatePalette.from_theme(theme)
+            if state_palette != self._cell_state_palette:
+                self._cell_state_palette = state_palette
+                for _row, cell_row in self._cell_list.row_widgets():
+                    cell_row.set_state_palette(state_palette)
+                if self._row_pool is not None:
+                    self._row_pool.clear()
+        scoped_qss = build_notebook_qss(
+            self._notebook_theme,
+            self._mode,
+            metrics=metrics,
+            cell_modules=self._cell_modules,
+        )
+        if self._cell_list.styleSheet() != scoped_qss:
+            self._cell_list.setStyleSheet(scoped_qss)
+            self._cell_list.invalidate_heights()
+
+    def set_notebook_theme(self, notebook_theme: NotebookTheme) -> None:
+        """Give the notebook its own mode/accent independent of the app chrome."""
+        if notebook_theme == self._notebook_theme:
+            return
+        self._notebook_theme = notebook_theme
+        self._apply_notebook_style(self._current_metrics())
+        self._schedule_session_save()
+
+    def _switch_notebook_mode(self, mode) -> None:
+        self.set_notebook_theme(replace(self._notebook_theme, mode=mode))
+
+    @property
+    def document(self) -> NotebookDocument:
+        return self._document
+
+    @property
+    def row_pool(self) -> RowPool | None:
+        """Recycled cell rows (``widgets`` renderer only)."""
+        return self._row_pool
+
+    @property
+    def theme_mode(self):
+        return self._mode
+
+    def set_theme_mode(self, mode) -> None:
+        """Switch the chrome theme and keep the View menu check in sync."""
+        action = self._theme_actions.get(mode.value)
+        if action is not None:
+            action.setChecked(True)
+        self._switch_theme(mode)
+
+    def bring_to_front(self) -> None:
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
+    def open_paths(self, paths: Sequence[str]) -> None:
+        """Placeholder: notebooks cannot be loaded yet, so only report the request."""
+        if paths:
+            self.statusBar().showMessage(f"Open requested: {', '.join(paths)}")
+
+    @traced()
+    def _switch_theme(self, mode) -> None:
+        if mode == self._mode:
+            return
+        self._mode = mode
+        self._apply_current_style()
+        self._schedule_session_save()
+
+    @property
+    def selection(self) -> CellSelection:
+        return self._selection
+
+    def _handle_cell_pressed(self, row: int) -> None:
+        """Plain click selects ``row``; shift extends from the anchor, ctrl toggles."""
+        modifiers = QApplication.keyboardModifiers()
+        self._selection.click(
+            row,
+            extend=bool(modifiers & Qt.KeyboardModifier.ShiftModifier),
+            toggle=bool(modifiers & Qt.KeyboardModifier.ControlModifier),
+        )
+
+    def _handle_selection_changed(self, _changed: list[range]) -> None:
+        self._schedule_session_save()
+
+    def _selected_cell_index(self) -> int | None:
+        current = self._selection.current
+        return current if current is not None and self._selection.is_selected(current) else None
+
+    def _handle_gutter_pressed(self, row: int) -> None:
+        """Clicking the gutter of a selected cell clears the selection."""
+        if self._selection.is_selected(row):
+            self._selection.clear()
+        else:
+            self._handle_cell_pressed(row)
+
+    @traced()
+    def _handle_ui_font_size_changed(self, point_size: int) -> None:
+        clamped_size = clamp_ui_font_point_size(point_size)
+        if clamped_size == self._style_preferences.ui_font_size:
+            return
+        self._style_preferences = replace(self._style_preferences, ui_font_size=clamped_size)
+        self._apply_current_style()
+        self._schedule_session_save()
+
+    @traced()
+    def _handle_ui_font_family_changed(self, font_family: str) -> None:
+        normalized_family = font_family.strip()
+        if not normalized_family:
+            return
+        if normalized_family not in self._available_ui_fonts:
+            return
+        if normalized_family == self._style_preferences.ui_font_family:
+            return
+        self._font_registry.ensure_family(normalized_family)
+        self._style_preferences = replace(
+            self._style_preferences,
+            ui_font_family=normalized_family,
+        )
+        self._apply_current_style()
+        self._schedule_session_save()
+
+    def start_idle_font_preload(self) -> None:
+        """Register the remaining bundled font families, one per timer tick."""
+        if not PRELOAD_FONTS_WHEN_IDLE or self._font_preload_timer is not None:
+            return
+        if not self._font_registry.pending_families():
+            return
+        timer = QTimer(self)
+        timer.setInterval(FONT_PRELOAD_INTERVAL_MS)
+        timer.timeout.connect(self._preload_next_font_family)
+        timer.start()
+        self._font_preload_timer = timer
+
+    def _preload_next_font_family(self) -> None:
+        if self._font_registry.register_next_pending() is not None:
+            return
+        record_font_registry(self._font_registry)
+        if self._font_preload_timer is not None:
+            self._font_preload_timer.stop()
+            self._font_preload_timer.deleteLater()
+            self._font_preload_timer = None
+
+    def _on_move_cell_up_clicked(self) -> None:
+        self.move_selected_cells(-1)
+
+    def _on_move_cell_down_clicked(self) -> None:
+        self.move_selected_cells(1)
+
+    @traced()
+    def move_selected_cells(self, offset: int) -> None:
+        """Move the selected cells ``offset`` rows (negative is up); each selected block is one model move."""
+        ranges = self._selection.ranges()
+        if not ranges:
+            self.statusBar().showMessage("Select a cell to move")
+            return
+        self._document.move_ranges(ranges, offset)
+        current = self._selection.current
+        if current is not None and self._cell_list is not None:
+            self._cell_list.scroll_to_row(current)
+        self._schedule_session_save()
+
+    def insert_cells(self, position: int, cells: Sequence[CellRecord | CellData]) -> None:
+        """Insert ``cells`` in front of ``position`` as one batch.
+
+        Up to ``CELL_INSERT_CHUNK_SIZE`` cells go in at once. Larger batches
+        (a paste or an import) are inserted a chunk per step in the idle
+        slices used for staged construction, so the window stays responsive;
+        the cell list holds its layout until the last chunk is in and then
+        lays out and repaints once. Progress is reported through
+        :attr:`cell_insert_progress` and the status bar.
+        """
+        if not cells:
+            return
+        self._ensure_cell_modules(cell.cell_type for cell in cells)
+        if len(cells) <= CELL_INSERT_CHUNK_SIZE:
+            with span("insert cells", count=len(cells)):
+                self._document.insert(position, cells)
+            self.cell_insert_progress.emit(len(cells), len(cells))
+            return
+        self._defer_stage("insert cells", self._insert_cells_stage(position, cells))
+        if self._time_to_first_frame_ms is not None:
+            self._start_deferred_build()
+
+    def _insert_cells_stage(self, position: int, cells: Sequence[CellRecord | CellData]) -> Iterator[None]:
+        total = len(cells)
+        document = self._document
+        cell_list = self._cell_list
+        cell_list.suspend_layout()
+        try:
+            last_id: str | None = None
+            for start in range(0, total, CELL_INSERT_CHUNK_SIZE):
+                # Follow the previous chunk, wherever edits made meanwhile have moved it.
+                if last_id is not None:
+                    position = document.index_of(last_id) + 1 if last_id in document else min(position, len(document))
+                chunk_ids = document.insert(position, cells[start:start + CELL_INSERT_CHUNK_SIZE])
+                last_id = chunk_ids[-1]
+                position += len(chunk_ids)
+                done = min(start + CELL_INSERT_CHUNK_SIZE, total)
+                self.cell_insert_progress.emit(done, total)
+                self.statusBar().showMessage(f"Inserting cells… {done} of {total}")
+                yield
+        finally:
+            cell_list.resume_layout()
+        self.statusBar().showMessage(f"Inserted {total} cells", 3000)
+
+    def _ensure_cell_modules(self, cell_types: Iterable[str]) -> None:
+        """Load the plugins of cell types new to this notebook, with their styles."""
+        new_modules = tuple(
+            module
+            for module in dict.fromkeys(load_cell_type(cell_type) for cell_type in dict.fromkeys(cell_types))
+            if module not in self._cell_modules
+        )
+        if not new_modules:
+            return
+        self._cell_modules += new_modules
+        if self._cell_delegate is not None:
+            self._cell_delegate.preload(new_modules)
+        self._apply_notebook_style(self._current_metrics())
+
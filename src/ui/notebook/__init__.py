@@ -0,0 +1,59 @@
+"""Virtualized notebook cell list: model, view and row widgets.
+
+Exports resolve lazily so importing :mod:`ui.notebook` does not pull in Qt.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "CellDataRole": ".cell_model",
+    "CellDelegate": ".cell_delegate",
+    "CellGutter": ".cell_gutter",
+    "CellIdRole": ".cell_model",
+    "CellRow": ".cell_row",
+    "CellSelection": ".selection",
+    "CellState": ".cell_state",
+    "CellStatePalette": ".cell_state",
+    "HeightIndex": ".height_index",
+    "NotebookCellModel": ".cell_model",
+    "NotebookView": ".cell_view",
+    "RowPool": ".row_pool",
+    "RowPoolStats": ".row_pool",
+    "TextFormat": ".text_layout",
+    "TextLayout": ".text_layout",
+    "TextLayoutCache": ".text_layout",
+    "TextLayoutCacheStats": ".text_layout",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "CellDataRole",
+    "CellDelegate",
+    "CellGutter",
+    "CellIdRole",
+    "CellRow",
+    "CellSelection",
+    "CellState",
+    "CellStatePalette",
+    "HeightIndex",
+    "NotebookCellModel",
+    "NotebookView",
+    "RowPool",
+    "RowPoolStats",
+    "TextFormat",
+    "TextLayout",
+    "TextLayoutCache",
+    "TextLayoutCacheStats",
+]
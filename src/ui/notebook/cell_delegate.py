@@ -0,0 +1,248 @@
+"""Delegate that paints whole notebook cells without per-cell widgets.
+
+Colours come from the resolved :class:`Theme`, sizes from
+:class:`CellContainerTokens` and :class:`CellGutterTokens`, and the body look
+from each cell type's optional ``body_style(theme)``. Everything is resolved
+once per theme into a :class:`CellPaintStyle`; selection, focus and hover are
+read from ``option.state`` at paint time and drawn with the
+:class:`CellStatePalette` the widget rows use, so state changes only repaint.
+Bodies are laid out through a :class:`TextLayoutCache`, shared by measuring
+and painting, so resizing back to a width seen before lays out nothing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Iterable
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QModelIndex, QPoint, QRect, QSize, Qt
+    from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+    from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from cells import CellBodyStyle, CellData, load_cell_type
+from theme import CellContainerTokens, CellGutterTokens, Theme, cell_container_tokens, cell_gutter_tokens
+
+from .cell_model import CellDataRole
+from .cell_state import CellState, CellStatePalette
+from .text_layout import TextFormat, TextLayout, TextLayoutCache
+
+# Same spacing CellRow uses between the gutter and the container, and between
+# the header and the body.
+ROW_SPACING = 5
+GUTTER_MARGIN = 5
+CONTENT_SPACING = 5
+HEADER_LETTER_SPACING_PERCENT = 108  # QSS: letter-spacing: 0.08em
+
+REGION_GUTTER = "gutter"
+REGION_CELL = "cell"
+
+
+def qt_font(family_list: str, point_size: int) -> QFont:
+    """Build a QFont from a CSS-style family list such as ``"Inter", sans-serif``."""
+    font = QFont()
+    families = [family.strip().strip("'\"") for family in family_list.split(",")]
+    font.setFamilies([family for family in families if family])
+    font.setPointSize(point_size)
+    return font
+
+
+@dataclass(frozen=True, slots=True)
+class _BodyPaint:
+    text_format: TextFormat
+    background: QColor | None
+    padding: int
+    radius: int
+
+
+@dataclass(frozen=True, slots=True)
+class CellPaintStyle:
+    """Everything the delegate needs to paint, resolved once per theme."""
+
+    theme: Theme
+    container: CellContainerTokens
+    gutter: CellGutterTokens
+    states: CellStatePalette
+    cell_background: QColor
+    gutter_background: QColor
+    gutter_text: QColor
+    header_text: QColor
+    body_text: QColor
+    header_font: QFont
+    header_metrics: QFontMetrics
+    gutter_font: QFont
+    gutter_width: int
+
+    @classmethod
+    def from_theme(cls, theme: Theme) -> "CellPaintStyle":
+        metrics = theme.metrics
+        gutter = cell_gutter_tokens(metrics)
+        header_font = qt_font(metrics.font_family, metrics.font_size_small)
+        header_font.setCapitalization(QFont.Capitalization.AllUppercase)
+        header_font.setLetterSpacing(QFont.SpacingType.PercentageSpacing, HEADER_LETTER_SPACING_PERCENT)
+        return cls(
+            theme=theme,
+            container=cell_container_tokens(metrics),
+            gutter=gutter,
+            states=CellStatePalette.from_theme(theme),
+            cell_background=QColor(theme.bg.cell),
+            gutter_background=QColor(theme.bg.cell_gutter),
+            gutter_text=QColor(theme.text.secondary),
+            header_text=QColor(theme.text.secondary),
+            body_text=QColor(theme.text.primary),
+            header_font=header_font,
+            header_metrics=QFontMetrics(header_font),
+            gutter_font=qt_font(metrics.font_family, metrics.font_size_small),
+            gutter_width=gutter.label_min_width + 2 * GUTTER_MARGIN,
+        )
+
+    def paint_gutter(self, painter: QPainter, rect: QRect, number: int, state: CellState) -> None:
+        """Paint one cell's gutter: background, state edge and the right-aligned number."""
+        gutter = self.gutter
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.gutter_background)
+        painter.drawRoundedRect(rect, gutter.border_radius, gutter.border_radius)
+        self.states.paint_gutter_edge(painter, rect, state)
+        painter.setFont(self.gutter_font)
+        painter.setPen(self.gutter_text)
+        label = rect.adjusted(GUTTER_MARGIN, 0, -GUTTER_MARGIN, 0)
+        painter.drawText(label, int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter), f"{number:02d}")
+
+
+class CellDelegate(QStyledItemDelegate):
+    """Paints the gutter number, container, header and body of a cell."""
+
+    def __init__(self, theme: Theme, parent=None, *, text_layouts: TextLayoutCache | None = None) -> None:
+        super().__init__(parent)
+        self._style = CellPaintStyle.from_theme(theme)
+        self._body_paints: dict[str, _BodyPaint] = {}
+        self._text_layouts = text_layouts if text_layouts is not None else TextLayoutCache()
+
+    @property
+    def text_layouts(self) -> TextLayoutCache:
+        return self._text_layouts
+
+    @property
+    def paint_style(self) -> CellPaintStyle:
+        return self._style
+
+    def set_theme(self, theme: Theme) -> bool:
+        """Switch to ``theme``; returns True when sizes may have changed."""
+        if theme == self._style.theme:
+            return False
+        self._style = CellPaintStyle.from_theme(theme)
+        self._body_paints.clear()
+        # Layouts for the old fonts would only be evicted one by one.
+        self._text_layouts.clear()
+        return True
+
+    def preload(self, cell_modules: Iterable[ModuleType]) -> None:
+        """Resolve body styles for the notebook's cell types ahead of painting."""
+        for module in cell_modules:
+            self._body_paint(module.CELL_TYPE)
+
+    def _body_paint(self, cell_type: str) -> _BodyPaint:
+        body_paint = self._body_paints.get(cell_type)
+        if body_paint is None:
+            module = load_cell_type(cell_type)
+            body_style_for = getattr(module, "body_style", None)
+            body_style = body_style_for(self._style.theme) if body_style_for is not None else CellBodyStyle()
+            metrics = self._style.theme.metrics
+            font = qt_font(body_style.font_family or metrics.font_family, metrics.cell_body_font_size)
+            flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+            flags |= Qt.TextFlag.TextWordWrap if body_style.wrap else Qt.TextFlag.TextExpandTabs
+            body_paint = _BodyPaint(
+                text_format=TextFormat.create(font, int(flags)),
+                background=QColor(body_style.background) if body_style.background else None,
+                padding=body_style.padding,
+                radius=body_style.radius,
+            )
+            self._body_paints[cell_type] = body_paint
+        return body_paint
+
+    def _container_rect(self, rect: QRect) -> QRect:
+        left = rect.left() + self._style.gutter_width + ROW_SPACING
+        return QRect(left, rect.top(), max(rect.right() - left + 1, 0), rect.height())
+
+    def _gutter_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.left(), rect.top(), self._style.gutter_width, rect.height())
+
+    def _content_inset(self) -> int:
+        container = self._style.container
+        return container.border_width + container.padding
+
+    def _body_layout(self, cell: CellData, body_paint: _BodyPaint, width: int) -> TextLayout:
+        """The body of ``cell`` laid out for a row ``width`` pixels wide."""
+        inset = self._content_inset()
+        text_width = width - self._style.gutter_width - ROW_SPACING - 2 * inset - 2 * body_paint.padding
+        return self._text_layouts.layout(cell.body, body_paint.text_format, text_width)
+
+    def row_height(self, cell: CellData, width: int) -> int:
+        """Height of ``cell`` painted ``width`` pixels wide."""
+        inset = self._content_inset()
+        body_paint = self._body_paint(cell.cell_type)
+        return (
+            2 * inset
+            + self._style.header_metrics.height()
+            + self._style.container.header_margin_bottom
+            + CONTENT_SPACING
+            + self._body_layout(cell, body_paint, width).height
+            + 2 * body_paint.padding
+        )
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        cell = index.data(CellDataRole)
+        width = option.rect.width()
+        return QSize(width, self.row_height(cell, width))
+
+    def hit_test(self, rect: QRect, pos: QPoint) -> str | None:
+        """Return which region of a row painted in ``rect`` contains ``pos``."""
+        if self._gutter_rect(rect).contains(pos):
+            return REGION_GUTTER
+        if self._container_rect(rect).contains(pos):
+            return REGION_CELL
+        return None
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        cell: CellData = index.data(CellDataRole)
+        style = self._style
+        rect = option.rect
+        state = CellState.from_style_state(option.state)
+
+        painter.save()
+        style.paint_gutter(painter, self._gutter_rect(rect), index.row() + 1, state)
+
+        container = self._container_rect(rect)
+        border_width = style.container.border_width
+        border = style.states.container_border(state)
+        painter.setPen(QPen(border, border_width) if border_width else Qt.PenStyle.NoPen)
+        painter.setBrush(style.cell_background)
+        radius = style.container.border_radius
+        painter.drawRoundedRect(container.adjusted(0, 0, -border_width, -border_width), radius, radius)
+
+        inset = self._content_inset()
+        content = container.adjusted(inset, inset, -inset, -inset)
+        header_height = style.header_metrics.height()
+        painter.setFont(style.header_font)
+        painter.setPen(style.header_text)
+        header_rect = QRect(content.left(), content.top(), content.width(), header_height)
+        header = style.header_metrics.elidedText(cell.header, Qt.TextElideMode.ElideRight, content.width())
+        painter.drawText(header_rect, int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter), header)
+
+        body_paint = self._body_paint(cell.cell_type)
+        body_top = header_rect.bottom() + 1 + style.container.header_margin_bottom + CONTENT_SPACING
+        body_rect = QRect(content.left(), body_top, content.width(), content.bottom() - body_top + 1)
+        if body_paint.background is not None:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(body_paint.background)
+            painter.drawRoundedRect(body_rect, body_paint.radius, body_paint.radius)
+        pad = body_paint.padding
+        painter.setPen(style.body_text)
+        self._body_layout(cell, body_paint, rect.width()).draw(painter, body_rect.left() + pad, body_rect.top() + pad)
+        painter.restore()
+
+
+__all__ = ["CellDelegate", "CellPaintStyle", "REGION_CELL", "REGION_GUTTER", "ROW_SPACING", "qt_font"]
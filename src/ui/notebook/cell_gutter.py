@@ -0,0 +1,78 @@
+"""Line-number area shared by every widget row of a :class:`NotebookView`.
+
+Like a code editor's line-number area, one widget runs down the left edge of
+the viewport and paints the gutter of each visible cell at paint time: the
+number is the row's position in the model, so inserting, removing or moving
+cells renumbers nothing, and rows need no gutter widgets of their own. Clicks
+pass through to the view, which reports them as
+:attr:`NotebookView.gutter_pressed`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QRect
+    from PySide6.QtGui import QPainter
+    from PySide6.QtWidgets import QWidget
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from theme import Theme
+
+from .cell_delegate import CellPaintStyle
+
+if TYPE_CHECKING:
+    from .cell_view import NotebookView
+
+
+class CellGutter(QWidget):
+    """Paints gutter backgrounds, selection edges and numbers for the visible rows."""
+
+    def __init__(self, theme: Theme, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._style = CellPaintStyle.from_theme(theme)
+        self._view: NotebookView | None = None
+
+    def attach(self, view: NotebookView) -> None:
+        """Called by :class:`NotebookView`, which positions the gutter and repaints it."""
+        self._view = view
+
+    def paint_style(self) -> CellPaintStyle:
+        return self._style
+
+    def set_theme(self, theme: Theme) -> bool:
+        """Resolve the new theme; returns True when the gutter width changed."""
+        style = CellPaintStyle.from_theme(theme)
+        width_changed = style.gutter_width != self._style.gutter_width
+        self._style = style
+        self.update()
+        return width_changed
+
+    def gutter_width(self) -> int:
+        return self._style.gutter_width
+
+    def row_rect(self, row: int) -> QRect:
+        """Gutter rectangle of ``row`` in this widget's coordinates."""
+        row_rect = self._view.row_rect(row)
+        return QRect(0, row_rect.top() - self.y(), self.width(), row_rect.height())
+
+    def update_row(self, row: int) -> None:
+        if self._view is not None:
+            self.update(self.row_rect(row))
+
+    def paintEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        view = self._view
+        if view is None:
+            return
+        painter = QPainter(self)
+        exposed = event.rect()
+        for row in view.visible_rows():
+            rect = self.row_rect(row)
+            if rect.intersects(exposed):
+                self._style.paint_gutter(painter, rect, row + 1, view.row_state(row))
+        painter.end()
+
+
+__all__ = ["CellGutter"]
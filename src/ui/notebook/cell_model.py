@@ -0,0 +1,103 @@
+"""Qt list model presenting a :class:`NotebookDocument` to the notebook view."""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QAbstractListModel, QModelIndex, QPersistentModelIndex, Qt
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from cells import (
+    CHANGE_INSERT,
+    CHANGE_MOVE,
+    CHANGE_REMOVE,
+    CHANGE_RESET,
+    CHANGE_UPDATE,
+    CellData,
+    CellRecord,
+    DocumentChange,
+    NotebookDocument,
+)
+
+CellDataRole = Qt.ItemDataRole.UserRole + 1
+CellTypeRole = Qt.ItemDataRole.UserRole + 2
+CellIdRole = Qt.ItemDataRole.UserRole + 3
+
+
+class NotebookCellModel(QAbstractListModel):
+    """One row per cell of ``document``; edits made on the document are forwarded as range signals."""
+
+    def __init__(self, document: NotebookDocument | None = None, parent: Any = None) -> None:
+        super().__init__(parent)
+        self._document = document if document is not None else NotebookDocument()
+        self._document.add_listener(self)
+
+    @property
+    def document(self) -> NotebookDocument:
+        return self._document
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._document)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < len(self._document):
+            return None
+        record = self._document[index.row()]
+        if role == CellDataRole:
+            return record
+        if role == Qt.ItemDataRole.DisplayRole:
+            return record.header
+        if role == CellTypeRole:
+            return record.cell_type
+        if role == CellIdRole:
+            return record.id
+        return None
+
+    def cell(self, row: int) -> CellRecord:
+        return self._document[row]
+
+    def cells(self) -> tuple[CellRecord, ...]:
+        return tuple(self._document)
+
+    def row_of(self, cell_id: str) -> int:
+        return self._document.index_of(cell_id)
+
+    def set_cells(self, cells: Iterable[CellRecord | CellData]) -> None:
+        self._document.reset(cells)
+
+    def insert_cells(self, row: int, cells: Sequence[CellRecord | CellData]) -> list[str]:
+        return self._document.insert(row, cells)
+
+    def append_cells(self, cells: Sequence[CellRecord | CellData]) -> list[str]:
+        return self._document.append(cells)
+
+    def remove_cells(self, row: int, count: int = 1) -> list[CellRecord]:
+        return self._document.remove(row, count)
+
+    def document_changing(self, change: DocumentChange) -> None:
+        last = change.first + change.count - 1
+        if change.kind == CHANGE_INSERT:
+            self.beginInsertRows(QModelIndex(), change.first, last)
+        elif change.kind == CHANGE_REMOVE:
+            self.beginRemoveRows(QModelIndex(), change.first, last)
+        elif change.kind == CHANGE_MOVE:
+            self.beginMoveRows(QModelIndex(), change.first, last, QModelIndex(), change.destination)
+        elif change.kind == CHANGE_RESET:
+            self.beginResetModel()
+
+    def document_changed(self, change: DocumentChange) -> None:
+        if change.kind == CHANGE_INSERT:
+            self.endInsertRows()
+        elif change.kind == CHANGE_REMOVE:
+            self.endRemoveRows()
+        elif change.kind == CHANGE_MOVE:
+            self.endMoveRows()
+        elif change.kind == CHANGE_RESET:
+            self.endResetModel()
+        elif change.kind == CHANGE_UPDATE:
+            self.dataChanged.emit(self.index(change.first), self.index(change.first + change.count - 1))
+
+
+__all__ = ["CellDataRole", "CellIdRole", "CellTypeRole", "NotebookCellModel"]
@@ -0,0 +1,125 @@
+"""Widget row for one notebook cell: the styled container.
+
+The numbered gutter next to it is painted for all rows at once by
+:class:`CellGutter`. The stylesheet draws the plain cell; selected, focused
+and hover visuals are painted over it from a shared :class:`CellStatePalette`,
+so changing the state of a row only repaints it.
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtGui import QPainter
+    from PySide6.QtWidgets import QFrame, QHBoxLayout, QVBoxLayout, QWidget
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from cells import CellData
+
+from .cell_state import CellState, CellStatePalette
+
+
+class _CellFrame(QFrame):
+    def __init__(self, row: "CellRow") -> None:
+        super().__init__()
+        self._row = row
+
+    def paintEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        super().paintEvent(event)
+        state = self._row.state()
+        if state:
+            painter = QPainter(self)
+            self._row.state_palette().paint_container_border(painter, self.rect(), state)
+
+
+class CellRow(QWidget):
+    """Row holding the styled cell content."""
+
+    def __init__(
+        self,
+        cell: CellData,
+        cell_module: ModuleType,
+        *,
+        state_palette: CellStatePalette,
+    ) -> None:
+        super().__init__()
+        self._cell = cell
+        self._cell_module = cell_module
+        self._state = CellState.NONE
+        self._state_palette = state_palette
+
+        row_layout = QHBoxLayout(self)
+        row_layout.setContentsMargins(0, 0, 0, 0)  # Margin between cells Left Top Right Bottom
+        row_layout.setSpacing(0)
+
+        self._cell_frame = _CellFrame(self)
+        self._cell_frame.setProperty("cellType", "container")
+        self._cell_frame.setProperty("cellKind", cell_module.CELL_TYPE)
+        cell_layout = QVBoxLayout(self._cell_frame)
+        cell_layout.setContentsMargins(0, 0, 0, 0)  # Cell content margins Left Top Right Bottom
+        cell_layout.setSpacing(5)
+        cell_module.populate_cell(self._cell_frame, cell)
+
+        # Clicks are left unhandled; NotebookView hit-tests them for all rows.
+        row_layout.addWidget(self._cell_frame, 1)
+
+    def enterEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        self._set_flag(CellState.HOVERED, True)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        self._set_flag(CellState.HOVERED, False)
+        super().leaveEvent(event)
+
+    @property
+    def cell_type(self) -> str:
+        return self._cell_module.CELL_TYPE
+
+    def cell(self) -> CellData:
+        return self._cell
+
+    def can_rebind(self) -> bool:
+        return hasattr(self._cell_module, "bind_cell")
+
+    def rebind(self, cell: CellData) -> None:
+        """Show another cell of the same type, reusing the widgets (see :class:`RowPool`)."""
+        self._cell_module.bind_cell(self._cell_frame, cell)
+        self._cell = cell
+        self.set_state(CellState.NONE)
+
+    def state(self) -> CellState:
+        return self._state
+
+    def set_state(self, state: CellState) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        # Only the border ring changes; the labels inside stay put.
+        self._cell_frame.update(self._state_palette.container_border_region(self._cell_frame.rect()))
+
+    def state_palette(self) -> CellStatePalette:
+        return self._state_palette
+
+    def set_state_palette(self, state_palette: CellStatePalette) -> None:
+        if state_palette == self._state_palette:
+            return
+        self._state_palette = state_palette
+        if self._state:
+            self._cell_frame.update()
+
+    def set_selected(self, selected: bool) -> None:
+        self._set_flag(CellState.SELECTED, selected)
+
+    def is_selected(self) -> bool:
+        return bool(self._state & CellState.SELECTED)
+
+    def set_focused(self, focused: bool) -> None:
+        self._set_flag(CellState.FOCUSED, focused)
+
+    def _set_flag(self, flag: CellState, enabled: bool) -> None:
+        self.set_state(self._state | flag if enabled else self._state & ~flag)
+
+
+__all__ = ["CellRow"]
@@ -0,0 +1,109 @@
+"""Selected / focused / hover visuals shared by both cell renderers.
+
+A cell's interactive state is a :class:`CellState` flag. Its look is resolved
+once per theme into a :class:`CellStatePalette` and painted on top of the
+stylesheet-drawn cell, so a state change is a repaint of one row and never a
+``setProperty`` plus ``unpolish``/``polish`` round trip through the style
+sheet engine.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import IntFlag
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QRect, QRectF, Qt
+    from PySide6.QtGui import QColor, QPainter, QPen, QRegion
+    from PySide6.QtWidgets import QStyle
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from theme import Theme, cell_container_tokens, cell_gutter_tokens
+
+
+class CellState(IntFlag):
+    NONE = 0
+    SELECTED = 1
+    FOCUSED = 2  # the selection's current cell
+    HOVERED = 4
+
+    @classmethod
+    def from_style_state(cls, state: QStyle.StateFlag) -> "CellState":
+        """Translate ``QStyleOption.state`` as filled in by :class:`NotebookView`."""
+        result = cls.NONE
+        if state & QStyle.StateFlag.State_Selected:
+            result |= cls.SELECTED
+        if state & QStyle.StateFlag.State_HasFocus:
+            result |= cls.FOCUSED
+        if state & QStyle.StateFlag.State_MouseOver:
+            result |= cls.HOVERED
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class CellStatePalette:
+    """Colours and border geometry for cell states, resolved from one theme."""
+
+    theme: Theme
+    cell_border: QColor
+    focus_border: QColor
+    hover_border: QColor
+    border_width: int
+    border_radius: int
+    gutter_border_width: int
+
+    @classmethod
+    def from_theme(cls, theme: Theme) -> "CellStatePalette":
+        container = cell_container_tokens(theme.metrics)
+        return cls(
+            theme=theme,
+            cell_border=QColor(theme.border.cell),
+            focus_border=QColor(theme.border.cell_in_focus),
+            hover_border=QColor(theme.border.strong),
+            border_width=container.border_width,
+            border_radius=container.border_radius,
+            gutter_border_width=cell_gutter_tokens(theme.metrics).border_width,
+        )
+
+    def container_border(self, state: CellState) -> QColor:
+        if state & (CellState.SELECTED | CellState.FOCUSED):
+            return self.focus_border
+        if state & CellState.HOVERED:
+            return self.hover_border
+        return self.cell_border
+
+    def container_border_region(self, rect: QRect) -> QRegion:
+        """The ring of ``rect`` a state border paints into; children inside it need no repaint."""
+        # Rounded corners pull the stroke at most 0.3 * radius towards the
+        # centre; one more pixel covers antialiasing.
+        ring = self.border_width + int(self.border_radius * 0.3) + 1
+        return QRegion(rect).subtracted(QRegion(rect.adjusted(ring, ring, -ring, -ring)))
+
+    def gutter_edge_rect(self, rect: QRect) -> QRect:
+        width = self.gutter_border_width
+        return QRect(rect.right() - width + 1, rect.top(), width, rect.height())
+
+    def paint_container_border(self, painter: QPainter, rect: QRect, state: CellState) -> None:
+        """Stroke the container border of ``rect`` in the colour for ``state``.
+
+        Does nothing for the plain state, which the stylesheet already draws.
+        """
+        if not state or not self.border_width:
+            return
+        half = self.border_width / 2
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(QPen(self.container_border(state), self.border_width))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        radius = max(self.border_radius - half, 0)
+        painter.drawRoundedRect(QRectF(rect).adjusted(half, half, -half, -half), radius, radius)
+        painter.restore()
+
+    def paint_gutter_edge(self, painter: QPainter, rect: QRect, state: CellState) -> None:
+        """Mark the right edge of a selected cell's gutter."""
+        if state & CellState.SELECTED and self.gutter_border_width:
+            painter.fillRect(self.gutter_edge_rect(rect), self.focus_border)
+
+
+__all__ = ["CellState", "CellStatePalette"]
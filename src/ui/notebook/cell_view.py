@@ -0,0 +1,539 @@
+"""Virtualized notebook view: only the visible cells cost anything.
+
+The view keeps one height per model row in a :class:`HeightIndex`. Rows that
+have never been on screen use an estimate; a row is measured when it is first
+shown, so scrolling cost depends on the viewport height, not on the number of
+cells.
+
+Rows are rendered in one of two ways:
+
+* with a ``delegate`` (:class:`CellDelegate`), cells are painted straight onto
+  the viewport and no per-cell objects exist at all;
+* with a ``row_factory``, a widget is materialised per visible row (plus
+  ``overscan`` pixels) and released once it scrolls away: handed to
+  ``row_release`` (for instance :meth:`RowPool.release`) or deleted. An
+  optional :class:`CellGutter` paints the numbered gutter of all rows, which
+  are then laid out to its right.
+
+Either way, clicks are dispatched in one place: presses that row widgets and
+the gutter leave unhandled reach the viewport, are hit-tested against the
+height index by :meth:`hit_test` and reported through :attr:`cell_pressed` /
+:attr:`gutter_pressed`. Rows install no event filters, so the work per click
+does not grow with the number of cells.
+
+Inserted, removed and moved rows shift the height index and the widgets on
+screen; nothing else is rebuilt. Row widgets show no row number themselves,
+so a widget that changes position stays valid as it is. Edits spread over
+several event-loop passes can hold layout and painting between
+:meth:`suspend_layout` and :meth:`resume_layout`, which then lays out once.
+
+Selection state comes from a :class:`CellSelection`. Only rows whose state
+changed and that are on screen are repainted (or, for row widgets, told
+through their ``set_selected(bool)`` / ``set_focused(bool)``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QModelIndex, QPoint, QRect, Qt, QTimer, Signal
+    from PySide6.QtGui import QPainter
+    from PySide6.QtWidgets import (
+        QAbstractScrollArea,
+        QFrame,
+        QStyle,
+        QStyledItemDelegate,
+        QStyleOptionViewItem,
+        QWidget,
+    )
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from cells import CellData
+from constants import CELL_LIST_MARGIN, CELL_LIST_OVERSCAN_PX, CELL_LIST_SCROLL_STEP, ESTIMATED_CELL_ROW_HEIGHT
+from utils.tracing import span
+
+from .cell_delegate import REGION_CELL, REGION_GUTTER, ROW_SPACING
+from .cell_gutter import CellGutter
+from .cell_model import NotebookCellModel
+from .cell_state import CellState
+from .height_index import HeightIndex
+from .selection import CellSelection
+
+RowFactory = Callable[[int, CellData], QWidget]
+RowRelease = Callable[[QWidget], None]
+
+
+class NotebookView(QAbstractScrollArea):
+    """Scrollable cell list rendering rows through a delegate or a row factory."""
+
+    cell_pressed = Signal(int)
+    gutter_pressed = Signal(int)
+
+    def __init__(
+        self,
+        parent: QWidget | None = None,
+        *,
+        row_factory: RowFactory | None = None,
+        row_release: RowRelease | None = None,
+        delegate: QStyledItemDelegate | None = None,
+        gutter: CellGutter | None = None,
+        estimated_row_height: int = ESTIMATED_CELL_ROW_HEIGHT,
+        overscan: int = CELL_LIST_OVERSCAN_PX,
+    ) -> None:
+        super().__init__(parent)
+        if (row_factory is None) == (delegate is None):
+            raise ValueError("NotebookView needs exactly one of row_factory or delegate.")
+        if gutter is not None and delegate is not None:
+            raise ValueError("A delegate paints its own gutter; pass a CellGutter with row_factory only.")
+        self._row_factory = row_factory
+        self._row_release = row_release
+        self._delegate = delegate
+        self._gutter = gutter
+        self._estimated_row_height = estimated_row_height
+        self._overscan = overscan
+        self._margin = CELL_LIST_MARGIN
+        self._model: NotebookCellModel | None = None
+        self._heights = HeightIndex()
+        self._measured = bytearray()
+        self._measured_width = -1
+        self._rows: dict[int, QWidget] = {}
+        self._first_row = 0
+        self._end_row = 0
+        self._hover_row = -1
+        self._selection: CellSelection | None = None
+        self._laying_out = False
+        self._layout_pending = False
+        self._layout_suspended = 0
+        self._layout_held = False
+
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(CELL_LIST_SCROLL_STEP)
+        if delegate is not None:
+            self.viewport().setMouseTracking(True)
+        if gutter is not None:
+            gutter.setParent(self.viewport())
+            gutter.attach(self)
+            gutter.show()
+
+    def model(self) -> NotebookCellModel | None:
+        return self._model
+
+    def delegate(self) -> QStyledItemDelegate | None:
+        return self._delegate
+
+    def gutter(self) -> CellGutter | None:
+        return self._gutter
+
+    def set_model(self, model: NotebookCellModel | None) -> None:
+        if self._model is not None:
+            for signal, slot in self._model_connections():
+                signal.disconnect(slot)
+        self._model = model
+        if model is not None:
+            for signal, slot in self._model_connections():
+                signal.connect(slot)
+        self._reset_rows()
+
+    def _model_connections(self) -> tuple[tuple[Any, Callable[..., None]], ...]:
+        model = self._model
+        return (
+            (model.modelReset, self._reset_rows),
+            (model.layoutChanged, self._reset_rows),
+            (model.rowsMoved, self._on_rows_moved),
+            (model.rowsInserted, self._on_rows_inserted),
+            (model.rowsRemoved, self._on_rows_removed),
+            (model.dataChanged, self._on_data_changed),
+        )
+
+    def selection(self) -> CellSelection | None:
+        return self._selection
+
+    def set_selection(self, selection: CellSelection | None) -> None:
+        if self._selection is not None:
+            self._selection.remove_listener(self._on_selection_changed)
+        self._selection = selection
+        if selection is not None:
+            selection.add_listener(self._on_selection_changed)
+        for row, widget in self._rows.items():
+            self._apply_selection(row, widget)
+        self.viewport().update()
+
+    def _is_selected(self, row: int) -> bool:
+        return self._selection is not None and self._selection.is_selected(row)
+
+    def _is_current(self, row: int) -> bool:
+        return self._selection is not None and self._selection.current == row
+
+    def row_state(self, row: int) -> CellState:
+        state = CellState.NONE
+        if self._is_selected(row):
+            state |= CellState.SELECTED
+        if self._is_current(row):
+            state |= CellState.FOCUSED
+        if row == self._hover_row:
+            state |= CellState.HOVERED
+        return state
+
+    def _apply_selection(self, row: int, widget: QWidget) -> None:
+        for setter_name, enabled in (("set_selected", self._is_selected(row)), ("set_focused", self._is_current(row))):
+            setter = getattr(widget, setter_name, None)
+            if setter is not None:
+                setter(enabled)
+
+    def _on_selection_changed(self, changed: list[range]) -> None:
+        # Clip to the rows on screen: a shift-click over thousands of cells
+        # still touches only what is visible.
+        for rows in changed:
+            for row in range(max(rows.start, self._first_row), min(rows.stop, self._end_row)):
+                widget = self._rows.get(row)
+                if widget is not None:
+                    self._apply_selection(row, widget)
+                self.update_row(row)
+
+    def update_row(self, row: int) -> None:
+        """Repaint ``row`` if it is on screen (delegate rendering), or its gutter."""
+        if not self._first_row <= row < self._end_row:
+            return
+        if self._delegate is not None:
+            self.viewport().update(self.row_rect(row))
+        elif self._gutter is not None:
+            self._gutter.update_row(row)
+
+    def row_widget(self, row: int) -> QWidget | None:
+        """Return the widget currently showing ``row``, if it is materialised."""
+        return self._rows.get(row)
+
+    def row_of(self, widget: QWidget) -> int:
+        """Return the model row shown by ``widget``, or -1."""
+        for row, candidate in self._rows.items():
+            if candidate is widget:
+                return row
+        return -1
+
+    def row_widgets(self) -> Iterator[tuple[int, QWidget]]:
+        """Yield ``(row, widget)`` for the materialised rows."""
+        return iter(tuple(self._rows.items()))
+
+    def materialized_count(self) -> int:
+        return len(self._rows)
+
+    def visible_rows(self) -> range:
+        return range(self._first_row, self._end_row)
+
+    def row_rect(self, row: int) -> QRect:
+        """Viewport rectangle of ``row`` (it may lie outside the viewport)."""
+        top = self._margin + self._heights.offset_of(row) - self.verticalScrollBar().value()
+        return QRect(self._margin, top, self._row_width(), self._heights[row])
+
+    def row_at(self, pos: QPoint) -> int:
+        """Return the row under viewport position ``pos``, or -1."""
+        content_y = pos.y() + self.verticalScrollBar().value() - self._margin
+        if content_y < 0 or content_y >= self._heights.total():
+            return -1
+        row = self._heights.row_at(content_y)
+        return row if self.row_rect(row).contains(pos) else -1
+
+    def hit_test(self, pos: QPoint) -> tuple[int, str | None]:
+        """Return the row under viewport position ``pos`` and the ``REGION_*`` hit there.
+
+        ``(-1, None)`` off the rows; the region is None between the gutter and the cell.
+        """
+        row = self.row_at(pos)
+        if row < 0:
+            return -1, None
+        rect = self.row_rect(row)
+        if self._delegate is not None:
+            return row, self._delegate.hit_test(rect, pos)
+        x = pos.x() - rect.left()
+        if x >= self._gutter_inset():
+            return row, REGION_CELL
+        if self._gutter is not None and x < self._gutter.gutter_width():
+            return row, REGION_GUTTER
+        return row, None
+
+    def scroll_to_row(self, row: int) -> None:
+        """Scroll just enough to bring ``row`` into view."""
+        if not 0 <= row < len(self._heights):
+            return
+        top = self._margin + self._heights.offset_of(row)
+        bottom = top + self._heights[row]
+        scroll_bar = self.verticalScrollBar()
+        viewport_height = self.viewport().height()
+        if top < scroll_bar.value():
+            scroll_bar.setValue(top)
+        elif bottom > scroll_bar.value() + viewport_height:
+            scroll_bar.setValue(bottom - viewport_height)
+
+    def suspend_layout(self) -> None:
+        """Hold layout and painting until the matching :meth:`resume_layout`; calls nest."""
+        if not self._layout_suspended:
+            self.viewport().setUpdatesEnabled(False)
+        self._layout_suspended += 1
+
+    def resume_layout(self) -> None:
+        self._layout_suspended -= 1
+        if self._layout_suspended:
+            return
+        if self._layout_held:
+            self._layout_held = False
+            self._layout_rows()
+        self.viewport().setUpdatesEnabled(True)
+
+    def invalidate_heights(self) -> None:
+        """Re-measure rows as they are shown again (fonts or styles changed)."""
+        self._measured = bytearray(len(self._heights))
+        self._schedule_layout()
+
+    def resizeEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        super().resizeEvent(event)
+        self._layout_rows()
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:  # pragma: no cover - UI behavior
+        self._layout_rows()
+
+    def paintEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        if self._delegate is None or self._model is None:
+            return
+        painter = QPainter(self.viewport())
+        exposed = event.rect()
+        option = QStyleOptionViewItem()
+        option.initFrom(self.viewport())
+        base_state = option.state & ~(
+            QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_HasFocus | QStyle.StateFlag.State_MouseOver
+        )
+        for row in range(self._first_row, self._end_row):
+            rect = self.row_rect(row)
+            if not rect.intersects(exposed):
+                continue
+            state = base_state
+            if self._is_selected(row):
+                state |= QStyle.StateFlag.State_Selected
+            if self._is_current(row):
+                state |= QStyle.StateFlag.State_HasFocus
+            if row == self._hover_row:
+                state |= QStyle.StateFlag.State_MouseOver
+            option.rect = rect
+            option.state = state
+            self._delegate.paint(painter, option, self._model.index(row, 0))
+        painter.end()
+
+    def mousePressEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+        row, region = self.hit_test(event.position().toPoint())
+        if region == REGION_CELL:
+            self.cell_pressed.emit(row)
+        elif region == REGION_GUTTER:
+            self.gutter_pressed.emit(row)
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        if self._delegate is not None:
+            self._set_hover_row(self.row_at(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event) -> None:  # pragma: no cover - UI behavior
+        self._set_hover_row(-1)
+        super().leaveEvent(event)
+
+    def _set_hover_row(self, row: int) -> None:
+        if row == self._hover_row:
+            return
+        previous, self._hover_row = self._hover_row, row
+        self.update_row(previous)
+        self.update_row(row)
+
+    def _schedule_layout(self) -> None:
+        if self._layout_pending:
+            return
+        self._layout_pending = True
+        QTimer.singleShot(0, self._layout_rows)
+
+    def _reset_rows(self, *_args: Any) -> None:
+        count = self._model.rowCount() if self._model is not None else 0
+        self._release_rows(lambda row: True)
+        self._heights.reset([self._estimated_row_height] * count)
+        self._measured = bytearray(count)
+        self._hover_row = -1
+        self._schedule_layout()
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        self._heights.insert(first, [self._estimated_row_height] * count)
+        self._measured[first:first] = bytes(count)
+        self._shift_rows(lambda row: row + count if row >= first else row)
+        # The pointer is over another cell now; the next mouse move finds it.
+        self._hover_row = -1
+        self._schedule_layout()
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        self._heights.remove(first, count)
+        del self._measured[first:last + 1]
+        self._release_rows(lambda row: first <= row <= last)
+        self._shift_rows(lambda row: row - count if row > last else row)
+        self._hover_row = -1
+        self._schedule_layout()
+
+    def _on_rows_moved(
+        self,
+        parent: QModelIndex,
+        first: int,
+        last: int,
+        destination_parent: QModelIndex,
+        destination: int,
+    ) -> None:
+        """Carry heights and row widgets along; only rows between the block and its destination shift."""
+        count = last - first + 1
+        self._heights.move(first, count, destination)
+        target = destination - count if destination > first else destination
+        measured = self._measured[first:last + 1]
+        del self._measured[first:last + 1]
+        self._measured[target:target] = measured
+
+        def moved(row: int) -> int:
+            if first <= row <= last:
+                return target + row - first
+            if target <= row < first:
+                return row + count
+            if last < row < destination:
+                return row - count
+            return row
+
+        self._shift_rows(moved)
+        self._hover_row = -1
+        self._schedule_layout()
+
+    def _shift_rows(self, new_row_of: Callable[[int], int]) -> None:
+        """Re-key the materialised row widgets; the gutter renumbers them when it repaints.
+
+        Selection state is re-applied when the rows are placed again: the
+        selection may not have caught up with the same edit yet.
+        """
+        self._rows = {new_row_of(row): widget for row, widget in self._rows.items()}
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: Any = ()) -> None:
+        first, last = top_left.row(), bottom_right.row()
+        self._measured[first:last + 1] = bytes(last - first + 1)
+        self._release_rows(lambda row: first <= row <= last)
+        self._schedule_layout()
+
+    def _release_rows(self, predicate: Callable[[int], bool]) -> None:
+        for row in [row for row in self._rows if predicate(row)]:
+            self._discard(self._rows.pop(row))
+
+    def _discard(self, widget: QWidget) -> None:
+        if self._row_release is not None:
+            self._row_release(widget)
+        else:
+            widget.hide()
+            widget.deleteLater()
+
+    def _layout_rows(self) -> None:
+        """Measure and place the rows intersecting the viewport."""
+        self._layout_pending = False
+        if self._layout_suspended:
+            self._layout_held = True
+            return
+        if self._laying_out or self._model is None:
+            return
+        self._laying_out = True
+        try:
+            with span("notebook view layout"):
+                scroll_top = self._place_visible_rows()
+                self._update_scroll_range()
+                if self.verticalScrollBar().value() != scroll_top:
+                    # The range shrank under the old position; place rows again.
+                    self._place_visible_rows()
+        finally:
+            self._laying_out = False
+        if self._delegate is not None:
+            self.viewport().update()
+        elif self._gutter is not None:
+            self._gutter.setGeometry(self._margin, 0, self._gutter.gutter_width(), self.viewport().height())
+            self._gutter.update()
+
+    def _row_width(self) -> int:
+        return max(self.viewport().width() - 2 * self._margin, 0)
+
+    def _gutter_inset(self) -> int:
+        """Horizontal space the shared gutter takes in front of the row widgets."""
+        return self._gutter.gutter_width() + ROW_SPACING if self._gutter is not None else 0
+
+    def _place_visible_rows(self) -> int:
+        margin = self._margin
+        inset = self._gutter_inset()
+        width = self._row_width()
+        if width - inset != self._measured_width:
+            self._measured_width = width - inset
+            self._measured = bytearray(len(self._heights))
+
+        scroll_top = self.verticalScrollBar().value()
+        wanted_top = scroll_top - self._overscan
+        wanted_bottom = scroll_top + self.viewport().height() + self._overscan
+        row_count = len(self._heights)
+        row = max(self._heights.row_at(max(wanted_top - margin, 0)), 0)
+        self._first_row = row
+        y = margin + self._heights.offset_of(row)
+        option = QStyleOptionViewItem()
+        option.rect = QRect(margin, 0, width, 0)
+        if self._rows:
+            # Free rows that are clearly off screen first, so a row_release
+            # pool can hand them straight back for the rows coming into view.
+            first = row
+            last = self._heights.row_at(max(wanted_bottom - margin, 0))
+            self._release_rows(lambda candidate: not first <= candidate <= last)
+
+        placed: dict[int, QWidget] = {}
+        while row < row_count and y < wanted_bottom:
+            widget = None
+            if self._row_factory is not None:
+                widget = self._rows.pop(row, None) or self._create_row(row)
+                placed[row] = widget
+            if not self._measured[row]:
+                if widget is not None:
+                    height = self._measure(widget, width - inset)
+                else:
+                    height = self._delegate.sizeHint(option, self._model.index(row, 0)).height()
+                self._heights.set(row, height)
+                self._measured[row] = 1
+            height = self._heights[row]
+            if widget is not None:
+                self._apply_selection(row, widget)
+                widget.setGeometry(margin + inset, y - scroll_top, width - inset, height)
+                if widget.isHidden():
+                    widget.show()
+            y += height
+            row += 1
+        self._end_row = row
+
+        self._release_rows(lambda _row: True)
+        self._rows = placed
+        return scroll_top
+
+    def _create_row(self, row: int) -> QWidget:
+        widget = self._row_factory(row, self._model.cell(row))
+        if widget.parentWidget() is not self.viewport():
+            widget.setParent(self.viewport())
+        return widget
+
+    @staticmethod
+    def _measure(widget: QWidget, width: int) -> int:
+        widget.ensurePolished()
+        height = widget.heightForWidth(width) if widget.hasHeightForWidth() else -1
+        return max(height if height >= 0 else widget.sizeHint().height(), 1)
+
+    def _update_scroll_range(self) -> None:
+        content_height = self._heights.total() + 2 * self._margin
+        viewport_height = self.viewport().height()
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setPageStep(viewport_height)
+        scroll_bar.setRange(0, max(content_height - viewport_height, 0))
+
+
+__all__ = ["NotebookView", "RowFactory", "RowRelease"]
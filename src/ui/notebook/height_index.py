@@ -0,0 +1,164 @@
+"""Row height bookkeeping for the virtualized notebook view.
+
+Heights live in blocks of up to ``BLOCK_SIZE`` rows with a per-block sum, so
+``row -> offset`` and ``offset -> row`` lookups cost O(n / BLOCK + BLOCK) and
+inserting, removing or resizing rows only touches the blocks involved. Pure
+Python, no Qt.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable
+
+BLOCK_SIZE = 256
+
+
+class HeightIndex:
+    """Sequence of row heights with fast offset lookups in both directions."""
+
+    def __init__(self, heights: Iterable[int] = ()) -> None:
+        self._blocks: list[array] = []
+        self._sums: list[int] = []
+        self._length = 0
+        self._row_starts: list[int] | None = None  # cumulative block lengths
+        self._offset_starts: list[int] | None = None  # cumulative block heights
+        self.reset(heights)
+
+    def reset(self, heights: Iterable[int]) -> None:
+        values = array("i", heights)
+        self._blocks = [values[start:start + BLOCK_SIZE] for start in range(0, len(values), BLOCK_SIZE)]
+        self._sums = [sum(block) for block in self._blocks]
+        self._length = len(values)
+        self._invalidate(structure=True)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, row: int) -> int:
+        block_index, offset = self._locate(row)
+        return self._blocks[block_index][offset]
+
+    def total(self) -> int:
+        return self._starts_by_offset()[-1]
+
+    def set(self, row: int, height: int) -> None:
+        block_index, offset = self._locate(row)
+        block = self._blocks[block_index]
+        delta = height - block[offset]
+        if delta:
+            block[offset] = height
+            self._sums[block_index] += delta
+            self._offset_starts = None
+
+    def offset_of(self, row: int) -> int:
+        """Return the y offset of ``row``; ``len(self)`` yields the total height."""
+
+        if row >= self._length:
+            return self.total()
+        block_index, offset = self._locate(row)
+        return self._starts_by_offset()[block_index] + sum(self._blocks[block_index][:offset])
+
+    def row_at(self, y: int) -> int:
+        """Return the row covering offset ``y`` clamped to the valid rows, or -1 if empty."""
+
+        if self._length == 0:
+            return -1
+        starts = self._starts_by_offset()
+        block_index = min(max(bisect_right(starts, y) - 1, 0), len(self._blocks) - 1)
+        remaining = y - starts[block_index]
+        row = self._starts_by_row()[block_index]
+        for height in self._blocks[block_index]:
+            if remaining < height:
+                return row
+            remaining -= height
+            row += 1
+        return min(row, self._length - 1)
+
+    def insert(self, row: int, heights: Iterable[int]) -> None:
+        values = array("i", heights)
+        if not values:
+            return
+        if not self._blocks:
+            self.reset(values)
+            return
+        if row >= self._length:
+            block_index, offset = len(self._blocks) - 1, len(self._blocks[-1])
+        else:
+            block_index, offset = self._locate(row)
+        block = self._blocks[block_index]
+        self._replace_blocks(block_index, 1, block[:offset] + values + block[offset:])
+        self._length += len(values)
+        self._invalidate(structure=True)
+
+    def remove(self, row: int, count: int = 1) -> list[int]:
+        """Remove ``count`` rows starting at ``row`` and return their heights."""
+
+        if count <= 0:
+            return []
+        if row < 0 or row + count > self._length:
+            raise IndexError(row)
+        removed: list[int] = []
+        block_index, offset = self._locate(row)
+        while len(removed) < count:
+            block = self._blocks[block_index]
+            take = min(count - len(removed), len(block) - offset)
+            chunk = block[offset:offset + take]
+            removed.extend(chunk)
+            del block[offset:offset + take]
+            self._sums[block_index] -= sum(chunk)
+            if block:
+                block_index += 1
+            else:
+                del self._blocks[block_index]
+                del self._sums[block_index]
+            offset = 0
+        self._length -= count
+        # Keep repeated small edits (moves, single removals) from leaving a
+        # trail of tiny blocks behind.
+        if block_index < len(self._blocks) and len(self._blocks[block_index]) < BLOCK_SIZE // 2:
+            first = block_index - 1 if block_index > 0 else block_index
+            if first + 1 < len(self._blocks):
+                self._replace_blocks(first, 2, self._blocks[first] + self._blocks[first + 1])
+        self._invalidate(structure=True)
+        return removed
+
+    def move(self, first: int, count: int, destination: int) -> None:
+        """Move ``count`` rows starting at ``first`` in front of ``destination`` (counted before the move)."""
+        heights = self.remove(first, count)
+        self.insert(destination - count if destination > first else destination, heights)
+
+    def _replace_blocks(self, block_index: int, block_count: int, values: array) -> None:
+        """Replace ``block_count`` blocks with ``values`` split into near-equal blocks."""
+        parts = max(-(-len(values) // BLOCK_SIZE), 1)
+        size = -(-len(values) // parts)
+        blocks = [values[start:start + size] for start in range(0, len(values), size)] or [values]
+        self._blocks[block_index:block_index + block_count] = blocks
+        self._sums[block_index:block_index + block_count] = [sum(block) for block in blocks]
+
+    def _invalidate(self, *, structure: bool = False) -> None:
+        self._offset_starts = None
+        if structure:
+            self._row_starts = None
+
+    def _starts_by_row(self) -> list[int]:
+        if self._row_starts is None:
+            self._row_starts = [0, *accumulate(len(block) for block in self._blocks)]
+        return self._row_starts
+
+    def _starts_by_offset(self) -> list[int]:
+        if self._offset_starts is None:
+            self._offset_starts = [0, *accumulate(self._sums)]
+        return self._offset_starts
+
+    def _locate(self, row: int) -> tuple[int, int]:
+        if not 0 <= row < self._length:
+            raise IndexError(row)
+        starts = self._starts_by_row()
+        block_index = bisect_right(starts, row) - 1
+        return block_index, row - starts[block_index]
+
+
+__all__ = ["BLOCK_SIZE", "HeightIndex"]
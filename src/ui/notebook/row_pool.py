@@ -0,0 +1,85 @@
+"""Recycling pool for :class:`CellRow` widgets.
+
+Building a row costs several QObjects plus a stylesheet polish of each.
+Rows that scroll away, are deleted or belong to a notebook that was swapped
+out are parked here instead, hidden but still parented, laid out and
+polished, and handed back rebound to another cell of the same type. The pool
+is bounded; rows beyond ``max_size`` are deleted as before.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from cells import CellData, load_cell_type
+from constants import CELL_ROW_POOL_SIZE
+
+from .cell_row import CellRow
+
+
+@dataclass(frozen=True, slots=True)
+class RowPoolStats:
+    size: int
+    created: int
+    reused: int
+    discarded: int
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of acquired rows that were recycled rather than built."""
+        acquired = self.created + self.reused
+        return self.reused / acquired if acquired else 0.0
+
+
+class RowPool:
+    """Hands out cell rows, rebinding parked ones before building new ones.
+
+    ``acquire`` and ``release`` match :class:`NotebookView`'s ``row_factory``
+    and ``row_release`` hooks.
+    """
+
+    def __init__(self, factory: Callable[[int, CellData], CellRow], *, max_size: int = CELL_ROW_POOL_SIZE) -> None:
+        self._factory = factory
+        self._max_size = max_size
+        self._free: dict[str, list[CellRow]] = {}
+        self._size = 0
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    def acquire(self, row: int, cell: CellData) -> CellRow:
+        # Rows are parked under their plugin's CELL_TYPE; unknown types resolve to the fallback plugin.
+        parked = self._free.get(load_cell_type(cell.cell_type).CELL_TYPE)
+        if parked:
+            cell_row = parked.pop()
+            self._size -= 1
+            cell_row.rebind(cell)
+            self._reused += 1
+            return cell_row
+        self._created += 1
+        return self._factory(row, cell)
+
+    def release(self, cell_row: CellRow) -> None:
+        cell_row.hide()
+        if self._size >= self._max_size or not cell_row.can_rebind():
+            cell_row.deleteLater()
+            self._discarded += 1
+            return
+        self._free.setdefault(cell_row.cell_type, []).append(cell_row)
+        self._size += 1
+
+    def clear(self) -> None:
+        """Delete every parked row, e.g. once they carry a stale state palette."""
+        for parked in self._free.values():
+            for cell_row in parked:
+                cell_row.deleteLater()
+            self._discarded += len(parked)
+        self._free.clear()
+        self._size = 0
+
+    def stats(self) -> RowPoolStats:
+        return RowPoolStats(self._size, self._created, self._reused, self._discarded)
+
+
+__all__ = ["RowPool", "RowPoolStats"]
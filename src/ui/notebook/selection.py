@@ -0,0 +1,229 @@
+"""Cell selection: current cell, anchor and a set of selected row ranges.
+
+Selected rows are kept as sorted, disjoint half-open ranges, so a lookup is a
+binary search over the ranges and never a scan over the cells. Every edit
+computes the rows whose state actually changed (selected, or being the
+current cell) and reports only those to the listeners: moving a single
+selection from one cell to another reports two rows, however large the
+notebook is.
+
+The selection follows edits of its :class:`NotebookDocument`: rows inserted
+in front of a selected range shift it, removed rows drop out of it and moved
+rows take their selection state along. Those adjustments are not reported,
+because the view re-lays out the affected rows anyway.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Callable, Iterator
+
+from cells import CHANGE_INSERT, CHANGE_MOVE, CHANGE_REMOVE, CHANGE_RESET, DocumentChange, NotebookDocument
+
+Span = tuple[int, int]
+SelectionListener = Callable[[list[range]], None]
+
+
+def _merged(spans: list[Span]) -> list[Span]:
+    merged: list[Span] = []
+    for start, end in sorted(span for span in spans if span[0] < span[1]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _without(spans: list[Span], start: int, end: int) -> list[Span]:
+    """Return ``spans`` minus the rows ``start <= row < end``."""
+    result: list[Span] = []
+    for span_start, span_end in spans:
+        if span_end <= start or span_start >= end:
+            result.append((span_start, span_end))
+            continue
+        if span_start < start:
+            result.append((span_start, start))
+        if span_end > end:
+            result.append((end, span_end))
+    return result
+
+
+def _flipped(old: list[Span], new: list[Span]) -> list[Span]:
+    """Rows selected in exactly one of ``old`` and ``new``."""
+    # A row is inside a set of disjoint spans when an odd number of their
+    # boundaries lie at or before it, so the boundaries of both sets, taken
+    # pairwise in order, delimit the rows whose state differs.
+    bounds = sorted([bound for span in old for bound in span] + [bound for span in new for bound in span])
+    return [(bounds[index], bounds[index + 1]) for index in range(0, len(bounds), 2) if bounds[index] < bounds[index + 1]]
+
+
+class CellSelection:
+    """Selected rows of a notebook plus the current and anchor rows.
+
+    ``current`` is the cell the user last clicked; ``anchor`` is where a
+    shift-click range starts. Both are ``None`` when nothing was clicked yet.
+    """
+
+    def __init__(self, document: NotebookDocument) -> None:
+        self._document = document
+        self._spans: list[Span] = []
+        self._starts: list[int] = []
+        self._current: int | None = None
+        self._anchor: int | None = None
+        self._listeners: list[SelectionListener] = []
+        document.add_listener(self)
+
+    def add_listener(self, listener: SelectionListener) -> None:
+        """Call ``listener`` with the ranges of rows whose state changed."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: SelectionListener) -> None:
+        self._listeners.remove(listener)
+
+    @property
+    def current(self) -> int | None:
+        return self._current
+
+    @property
+    def anchor(self) -> int | None:
+        return self._anchor
+
+    def ranges(self) -> list[range]:
+        return [range(start, end) for start, end in self._spans]
+
+    def is_selected(self, row: int) -> bool:
+        index = bisect_right(self._starts, row) - 1
+        return index >= 0 and row < self._spans[index][1]
+
+    def selected_rows(self) -> Iterator[int]:
+        for start, end in self._spans:
+            yield from range(start, end)
+
+    def count(self) -> int:
+        return sum(end - start for start, end in self._spans)
+
+    def click(self, row: int, *, extend: bool = False, toggle: bool = False) -> None:
+        """Apply a click on ``row``: shift extends from the anchor, ctrl toggles or adds."""
+        if extend and self._anchor is not None:
+            self.extend_to(row, keep=toggle)
+        elif toggle:
+            self.toggle(row)
+        else:
+            self.select(row)
+
+    def select(self, row: int) -> None:
+        """Select only ``row`` and make it the current and anchor row."""
+        self._check(row)
+        self._replace([(row, row + 1)], current=row, anchor=row)
+
+    def toggle(self, row: int) -> None:
+        """Flip ``row`` without touching the rest of the selection."""
+        self._check(row)
+        if self.is_selected(row):
+            spans = _without(self._spans, row, row + 1)
+        else:
+            spans = _merged(self._spans + [(row, row + 1)])
+        self._replace(spans, current=row, anchor=row)
+
+    def extend_to(self, row: int, *, keep: bool = False) -> None:
+        """Select from the anchor to ``row``; ``keep`` adds to the existing selection."""
+        self._check(row)
+        anchor = row if self._anchor is None else self._anchor
+        span = (min(anchor, row), max(anchor, row) + 1)
+        self._replace(_merged(self._spans + [span]) if keep else [span], current=row, anchor=anchor)
+
+    def clear(self) -> None:
+        self._replace([], current=None, anchor=None)
+
+    def _check(self, row: int) -> None:
+        if not 0 <= row < len(self._document):
+            raise IndexError(row)
+
+    def _replace(self, spans: list[Span], *, current: int | None, anchor: int | None) -> None:
+        changed = _flipped(self._spans, spans)
+        if current != self._current:
+            moved = [(row, row + 1) for row in (self._current, current) if row is not None]
+            changed = _merged(changed + moved)
+        self._set_spans(spans)
+        self._current, self._anchor = current, anchor
+        if changed:
+            for listener in self._listeners:
+                listener([range(start, end) for start, end in changed])
+
+    def _set_spans(self, spans: list[Span]) -> None:
+        self._spans = spans
+        self._starts = [start for start, _end in spans]
+
+    def document_changing(self, change: DocumentChange) -> None:
+        pass
+
+    def document_changed(self, change: DocumentChange) -> None:
+        first, count = change.first, change.count
+        if change.kind == CHANGE_INSERT:
+            self._set_spans(self._inserted(self._spans, first, count, []))
+            self._current, self._anchor = (self._shift_inserted(row, first, count) for row in (self._current, self._anchor))
+        elif change.kind == CHANGE_REMOVE:
+            self._set_spans(self._removed(self._spans, first, count))
+            self._current, self._anchor = (self._shift_removed(row, first, count) for row in (self._current, self._anchor))
+        elif change.kind == CHANGE_MOVE:
+            end = first + count
+            # Rows move in front of ``destination``; after taking the block
+            # out, that is this position.
+            target = change.destination if change.destination < first else change.destination - count
+            carried = [(start - first, stop - first) for start, stop in self._spans if start < end and stop > first]
+            carried = [(max(start, 0), min(stop, count)) for start, stop in carried]
+            spans = self._inserted(self._removed(self._spans, first, count), target, count, carried)
+            self._set_spans(spans)
+            self._current, self._anchor = (
+                self._shift_moved(row, first, count, target) for row in (self._current, self._anchor)
+            )
+        elif change.kind == CHANGE_RESET:
+            self._set_spans([])
+            self._current = self._anchor = None
+
+    @staticmethod
+    def _inserted(spans: list[Span], first: int, count: int, carried: list[Span]) -> list[Span]:
+        """Open a gap of ``count`` rows at ``first``; ``carried`` spans (relative) fill it."""
+        result: list[Span] = []
+        for start, end in spans:
+            if end <= first:
+                result.append((start, end))
+            elif start >= first:
+                result.append((start + count, end + count))
+            else:
+                result.extend(((start, first), (first + count, end + count)))
+        result.extend((first + start, first + end) for start, end in carried)
+        return _merged(result)
+
+    @staticmethod
+    def _removed(spans: list[Span], first: int, count: int) -> list[Span]:
+        end = first + count
+        result = []
+        for span_start, span_end in _without(spans, first, end):
+            if span_start >= end:
+                span_start, span_end = span_start - count, span_end - count
+            result.append((span_start, span_end))
+        return _merged(result)
+
+    @staticmethod
+    def _shift_inserted(row: int | None, first: int, count: int) -> int | None:
+        return row + count if row is not None and row >= first else row
+
+    @staticmethod
+    def _shift_removed(row: int | None, first: int, count: int) -> int | None:
+        if row is None or row < first:
+            return row
+        return None if row < first + count else row - count
+
+    @staticmethod
+    def _shift_moved(row: int | None, first: int, count: int, target: int) -> int | None:
+        if row is None:
+            return None
+        if first <= row < first + count:
+            return target + row - first
+        row = row - count if row >= first + count else row
+        return row + count if row >= target else row
+
+
+__all__ = ["CellSelection", "SelectionListener"]
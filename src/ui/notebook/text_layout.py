@@ -0,0 +1,143 @@
+"""Cached text layouts for the cell bodies the delegate paints.
+
+Laying out a word-wrapped body is the expensive part of measuring and
+painting a cell, and a resize or a dock toggle used to redo it for every cell
+on screen. A :class:`TextLayoutCache` keeps each laid-out body, line breaks,
+height and shaped glyphs, keyed on the text's hash, the font and a width
+bucket. Wrapped text is laid out at the lower edge of its bucket, so it fits
+every width in the bucket but may break lines up to one bucket earlier than a
+layout at the exact width would; widths narrower than one bucket are laid
+out as given. Text that does not wrap ignores the width altogether. Layouts are only built when a cell is measured or painted, which
+the view does for the rows coming on screen.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import QPointF, Qt
+    from PySide6.QtGui import QFont, QFontMetricsF, QPainter, QTextLayout, QTextOption
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the notebook view.") from exc
+
+from constants import TEXT_LAYOUT_CACHE_SIZE, TEXT_LAYOUT_WIDTH_BUCKET
+
+# QPainter::drawText's default: a tab stop every eight 'x' advances.
+TAB_STOP_CHARS = 8
+_UNBOUNDED_WIDTH = float(1 << 20)
+
+
+@dataclass(frozen=True, slots=True)
+class TextFormat:
+    """Font and ``Qt.TextFlag`` layout flags, with the font's cache key resolved once."""
+
+    font: QFont
+    flags: int
+    font_key: str
+    tab_stop: float
+
+    @classmethod
+    def create(cls, font: QFont, flags: int) -> "TextFormat":
+        tab_stop = TAB_STOP_CHARS * QFontMetricsF(font).horizontalAdvance("x")
+        return cls(font=font, flags=flags, font_key=font.key(), tab_stop=tab_stop)
+
+    @property
+    def wraps(self) -> bool:
+        return bool(self.flags & Qt.TextFlag.TextWordWrap)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class TextLayout:
+    """One laid-out text: ``(start, length)`` of every line and the total height."""
+
+    text: str
+    lines: tuple[tuple[int, int], ...]
+    height: int
+    layout: QTextLayout | None
+
+    def draw(self, painter: QPainter, left: int, top: int) -> None:
+        """Draw the text with its top-left corner at ``(left, top)`` in the painter's pen."""
+        if self.layout is not None:
+            self.layout.draw(painter, QPointF(left, top))
+
+
+@dataclass(frozen=True, slots=True)
+class TextLayoutCacheStats:
+    size: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TextLayoutCache:
+    """Bounded LRU of :class:`TextLayout` keyed on (text hash, font, flags, width bucket)."""
+
+    def __init__(self, *, max_size: int = TEXT_LAYOUT_CACHE_SIZE, bucket: int = TEXT_LAYOUT_WIDTH_BUCKET) -> None:
+        self._max_size = max_size
+        self._bucket = max(bucket, 1)
+        self._entries: OrderedDict[tuple[int, str, int, int], TextLayout] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def layout(self, text: str, text_format: TextFormat, width: int) -> TextLayout:
+        """Return ``text`` laid out to fit ``width`` pixels."""
+        layout_width = 0
+        if text_format.wraps:
+            # Below one bucket there is no lower edge to round to; lay out at the real width.
+            layout_width = width // self._bucket * self._bucket if width >= self._bucket else max(width, 1)
+        key = (hash(text), text_format.font_key, text_format.flags, layout_width)
+        cached = self._entries.get(key)
+        if cached is not None and cached.text == text:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached
+        self._misses += 1
+        text_layout = _build(text, text_format, layout_width)
+        if self._max_size > 0:
+            self._entries[key] = text_layout
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return text_layout
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> TextLayoutCacheStats:
+        return TextLayoutCacheStats(len(self._entries), self._hits, self._misses)
+
+
+def _build(text: str, text_format: TextFormat, width: int) -> TextLayout:
+    if not text:
+        return TextLayout(text, (), 0, None)
+    # QTextLayout breaks lines on U+2028, not on newlines; QPainter::drawText converts them the same way.
+    layout = QTextLayout(text.replace("\n", "\u2028"), text_format.font)
+    option = QTextOption()
+    option.setWrapMode(QTextOption.WrapMode.WordWrap if text_format.wraps else QTextOption.WrapMode.NoWrap)
+    option.setTabStopDistance(text_format.tab_stop)
+    layout.setTextOption(option)
+    layout.setCacheEnabled(True)
+    line_width = width if text_format.wraps else _UNBOUNDED_WIDTH
+    lines: list[tuple[int, int]] = []
+    height = 0.0
+    layout.beginLayout()
+    while True:
+        line = layout.createLine()
+        if not line.isValid():
+            break
+        line.setLineWidth(line_width)
+        height += line.leading()
+        line.setPosition(QPointF(0, height))
+        height += line.height()
+        lines.append((line.textStart(), line.textLength()))
+    layout.endLayout()
+    return TextLayout(text, tuple(lines), math.ceil(height), layout)
+
+
+__all__ = ["TextFormat", "TextLayout", "TextLayoutCache", "TextLayoutCacheStats"]
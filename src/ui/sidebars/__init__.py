@@ -1,9 +1,33 @@
-"""Sidebar widget collection."""
+"""Sidebar widget collection.
+
+Each panel module imports Qt at module level, so exports resolve lazily.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "NotebookSidebarWidget": ".notebook_sidebar",
+    "SettingsSidebarWidget": ".settings_sidebar",
+    "SidebarPanelRegistry": ".panel_registry",
+    "SidebarPanelSpec": ".panel_registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .notebook_sidebar import NotebookSidebarWidget
-from .settings_sidebar import SettingsSidebarWidget
 
 __all__ = [
     "NotebookSidebarWidget",
     "SettingsSidebarWidget",
+    "SidebarPanelRegistry",
+    "SidebarPanelSpec",
 ]
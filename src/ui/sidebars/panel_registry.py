@@ -0,0 +1,169 @@
+"""Lazy lifecycle for sidebar panels, keyed by dock objectName.
+
+Registering a panel costs nothing but a spec entry: its dock and widget are
+created the first time it is shown. Panels that stay hidden for longer than
+``evict_after_ms`` are torn down and built again by their factory when shown;
+the dock and its width are kept. Factories must therefore build panels from
+the window's current state rather than from anything the panel held.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtWidgets import QDockWidget, QMainWindow, QWidget
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to use the sidebar widgets.") from exc
+
+from utils.tracing import span
+
+
+@dataclass(frozen=True, slots=True)
+class SidebarPanelSpec:
+    """How to build one sidebar; ``object_name`` is also the dock's objectName."""
+
+    object_name: str
+    title: str
+    factory: Callable[[QWidget], QWidget]
+
+
+@dataclass(slots=True)
+class _PanelSlot:
+    spec: SidebarPanelSpec
+    dock: QDockWidget | None = None
+    panel: QWidget | None = None
+    width: int | None = None
+    hidden_since: float | None = None
+
+
+class SidebarPanelRegistry:
+    """Creates, shows, hides and evicts the window's sidebar panels."""
+
+    def __init__(
+        self,
+        window: QMainWindow,
+        *,
+        width_for: Callable[[int | None], int],
+        evict_after_ms: int | None = None,
+    ) -> None:
+        self._window = window
+        self._width_for = width_for
+        self._evict_after_ms = evict_after_ms
+        self._slots: dict[str, _PanelSlot] = {}
+        self._evict_timer: QTimer | None = None
+
+    def register(self, spec: SidebarPanelSpec) -> None:
+        if spec.object_name in self._slots:
+            raise ValueError(f"Sidebar {spec.object_name!r} is already registered.")
+        self._slots[spec.object_name] = _PanelSlot(spec)
+
+    def specs(self) -> tuple[SidebarPanelSpec, ...]:
+        return tuple(slot.spec for slot in self._slots.values())
+
+    def dock(self, object_name: str) -> QDockWidget | None:
+        return self._slots[object_name].dock
+
+    def panel(self, object_name: str) -> QWidget | None:
+        return self._slots[object_name].panel
+
+    def width(self, object_name: str) -> int | None:
+        """Return the sidebar's current width, or the last one it had while shown."""
+        slot = self._slots[object_name]
+        if slot.dock is not None and slot.dock.isVisible():
+            return slot.dock.width()
+        return slot.width
+
+    def set_width(self, object_name: str, width: int | None) -> None:
+        """Set the width used the next time the sidebar is shown."""
+        self._slots[object_name].width = width
+
+    def visible_sidebar(self) -> str | None:
+        for name in self._slots:
+            if self.is_visible(name):
+                return name
+        return None
+
+    def is_visible(self, object_name: str) -> bool:
+        dock = self._slots[object_name].dock
+        return dock is not None and dock.isVisible()
+
+    def show(self, object_name: str) -> QWidget:
+        """Show a sidebar, building its dock and panel on first use."""
+        slot = self._slots[object_name]
+        if slot.dock is None:
+            slot.dock = self._create_dock(slot.spec)
+        if slot.panel is None:
+            slot.panel = self._create_panel(slot)
+        slot.hidden_since = None
+        slot.dock.show()
+        try:
+            self._window.resizeDocks([slot.dock], [self._width_for(slot.width)], Qt.Orientation.Horizontal)
+        except Exception:
+            pass
+        return slot.panel
+
+    def hide(self, object_name: str) -> None:
+        slot = self._slots[object_name]
+        if slot.dock is None or not slot.dock.isVisible():
+            return
+        slot.width = slot.dock.width()
+        slot.dock.hide()
+        slot.hidden_since = time.monotonic()
+        self._schedule_eviction()
+
+    def evict_hidden(self, *, older_than_ms: int | None = None) -> list[str]:
+        """Tear down panels hidden for at least ``older_than_ms``; returns their names."""
+        threshold_ms = self._evict_after_ms if older_than_ms is None else older_than_ms
+        if threshold_ms is None:
+            return []
+        now = time.monotonic()
+        evicted: list[str] = []
+        for name, slot in self._slots.items():
+            if slot.panel is None or slot.hidden_since is None:
+                continue
+            if (now - slot.hidden_since) * 1000 >= threshold_ms:
+                self._evict(slot)
+                evicted.append(name)
+        return evicted
+
+    def _create_dock(self, spec: SidebarPanelSpec) -> QDockWidget:
+        dock = QDockWidget(spec.title, self._window)
+        dock.setObjectName(spec.object_name)
+        dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
+        dock.setFeatures(QDockWidget.DockWidgetFeature.NoDockWidgetFeatures)
+        self._window.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, dock)
+        return dock
+
+    def _create_panel(self, slot: _PanelSlot) -> QWidget:
+        with span("sidebar panel create", sidebar=slot.spec.object_name):
+            panel = slot.spec.factory(self._window)
+            slot.dock.setWidget(panel)
+        return panel
+
+    def _evict(self, slot: _PanelSlot) -> None:
+        panel = slot.panel
+        slot.panel = None
+        panel.setParent(None)
+        panel.deleteLater()
+
+    def _schedule_eviction(self) -> None:
+        if self._evict_after_ms is None:
+            return
+        if self._evict_timer is None:
+            self._evict_timer = QTimer(self._window)
+            self._evict_timer.setInterval(self._evict_after_ms)
+            self._evict_timer.timeout.connect(self._on_evict_timer)
+        if not self._evict_timer.isActive():
+            self._evict_timer.start()
+
+    def _on_evict_timer(self) -> None:
+        self.evict_hidden()
+        if not any(slot.panel is not None and slot.hidden_since is not None for slot in self._slots.values()):
+            self._evict_timer.stop()
+
+
+__all__ = ["SidebarPanelRegistry", "SidebarPanelSpec"]
@@ -0,0 +1,159 @@
+"""Packed, memory-mapped archive for bundled fonts and icons.
+
+``src/tools/build_asset_bundle.py`` packs the files into one archive::
+
+    magic (8 bytes) | index length (uint32 LE) | index JSON | padding | entries
+
+The index maps an asset name (``fonts/Inter/Inter-Regular.otf``,
+``icons/icon.png``) to ``[offset, length]`` relative to the start of the
+file. Every entry starts on a page boundary, so reading one asset only faults
+in that asset's pages. At runtime the archive is opened once and
+memory-mapped; :meth:`AssetBundle.read` returns zero-copy slices.
+When no archive has been built, callers fall back to the individual files.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+BUNDLE_MAGIC = b"LQASSET1"
+PAGE_SIZE = 4096
+_HEADER = struct.Struct("<8sI")
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_BUNDLE_PATH = SRC_DIR / "assets" / "assets.bundle"
+
+
+class AssetBundleError(ValueError):
+    """Raised when a bundle file is truncated or has an unknown format."""
+
+
+class AssetBundle:
+    """Read-only view of a packed asset archive backed by ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        with open(path, "rb") as handle:
+            self._mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = self._read_index()
+
+    def _read_index(self) -> dict[str, tuple[int, int]]:
+        if len(self._mapping) < _HEADER.size:
+            raise AssetBundleError(f"{self._path} is too small to be an asset bundle.")
+        magic, index_length = _HEADER.unpack_from(self._mapping, 0)
+        if magic != BUNDLE_MAGIC:
+            raise AssetBundleError(f"{self._path} is not an asset bundle.")
+        index_start = _HEADER.size
+        raw_index = self._mapping[index_start:index_start + index_length]
+        index = json.loads(raw_index.decode("utf-8"))
+        return {name: (offset, length) for name, (offset, length) in index.items()}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def names(self) -> tuple[str, ...]:
+        return tuple(self._index)
+
+    def read(self, name: str) -> memoryview:
+        """Return the bytes of ``name`` as a slice of the mapped file."""
+
+        offset, length = self._index[name]
+        return memoryview(self._mapping)[offset:offset + length]
+
+    def close(self) -> None:
+        self._mapping.close()
+
+
+def _align(value: int) -> int:
+    return (value + PAGE_SIZE - 1) // PAGE_SIZE * PAGE_SIZE
+
+
+def write_asset_bundle(out_path: Path, entries: Iterable[tuple[str, Path]]) -> dict[str, tuple[int, int]]:
+    """Pack ``(name, file)`` pairs into ``out_path`` and return the index."""
+
+    files = [(name, path, path.stat().st_size) for name, path in entries]
+
+    # The index stores absolute offsets, so its own size decides where data
+    # starts; iterate until the page-aligned data start stops moving.
+    data_start = PAGE_SIZE
+    while True:
+        index: dict[str, tuple[int, int]] = {}
+        offset = data_start
+        for name, _path, size in files:
+            index[name] = (offset, size)
+            offset = _align(offset + size)
+        encoded_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        required_start = _align(_HEADER.size + len(encoded_index))
+        if required_start <= data_start:
+            break
+        data_start = required_start
+
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_HEADER.pack(BUNDLE_MAGIC, len(encoded_index)))
+        handle.write(encoded_index)
+        for name, path, _size in files:
+            handle.seek(index[name][0])
+            handle.write(path.read_bytes())
+    tmp_path.replace(out_path)
+    return index
+
+
+@lru_cache(maxsize=1)
+def open_default_bundle() -> AssetBundle | None:
+    """Return the application's bundle, or ``None`` if it has not been built."""
+
+    if not DEFAULT_BUNDLE_PATH.is_file():
+        return None
+    try:
+        return AssetBundle(DEFAULT_BUNDLE_PATH)
+    except (OSError, ValueError):
+        return None
+
+
+def read_asset(name: str) -> bytes | memoryview | None:
+    """Return an asset by bundle name, falling back to the file under ``src/assets``/``src``."""
+
+    bundle = open_default_bundle()
+    if bundle is not None and name in bundle:
+        return bundle.read(name)
+    for root in (SRC_DIR / "assets", SRC_DIR):
+        candidate = root / name
+        if candidate.is_file():
+            return candidate.read_bytes()
+    return None
+
+
+def load_pixmap(name: str):
+    """Return a ``QPixmap`` for the named image asset (null if unavailable)."""
+
+    try:
+        from PySide6.QtGui import QPixmap
+    except ModuleNotFoundError:
+        return None
+
+    pixmap = QPixmap()
+    data = read_asset(name)
+    if data is not None:
+        pixmap.loadFromData(bytes(data))
+    return pixmap
+
+
+__all__ = [
+    "AssetBundle",
+    "AssetBundleError",
+    "DEFAULT_BUNDLE_PATH",
+    "load_pixmap",
+    "open_default_bundle",
+    "read_asset",
+    "write_asset_bundle",
+]
@@ -0,0 +1,201 @@
+"""Opt-in diagnostics written from a background thread.
+
+Enabled with ``--diagnostics [DIR]`` or the ``LUNAQT_DIAGNOSTICS`` environment
+variable. While enabled, the rendered QSS, the effective :class:`Metrics`, the
+font registry state, the time to first frame and Qt messages are written under
+the output directory by a single writer thread, so the UI thread only enqueues
+work. While disabled, every ``record_*`` helper returns after one global
+lookup. Qt messages still reach the handler that was installed before, and
+that handler is reinstalled when diagnostics are disabled.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable
+
+DIAGNOSTICS_ENV_VAR = "LUNAQT_DIAGNOSTICS"
+DEFAULT_DIAGNOSTICS_DIR = "diagnostics"
+QSS_DUMP_FILENAME = "qss_runtime_dump.txt"
+METRICS_FILENAME = "metrics.json"
+FONTS_FILENAME = "font_registry.json"
+STARTUP_FILENAME = "startup.json"
+QT_MESSAGES_FILENAME = "qt_messages.log"
+
+_STOP = object()
+
+
+class DiagnosticsWriter:
+    """Owns the output directory and the thread that writes into it.
+
+    Payloads are either strings or zero-argument callables; callables run on
+    the writer thread so expensive rendering stays off the UI thread.
+    """
+
+    def __init__(self, out_dir: Path) -> None:
+        self._out_dir = out_dir
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="diagnostics-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def out_dir(self) -> Path:
+        return self._out_dir
+
+    def write_text(self, filename: str, payload: str | Callable[[], str]) -> None:
+        """Replace ``filename`` with ``payload``."""
+
+        self._queue.put((filename, "w", payload))
+
+    def append_line(self, filename: str, payload: str | Callable[[], str]) -> None:
+        self._queue.put((filename, "a", payload))
+
+    def close(self, timeout: float | None = 2.0) -> None:
+        """Flush queued writes and stop the writer thread."""
+
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        self._out_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            filename, file_mode, payload = item
+            try:
+                text = payload() if callable(payload) else payload
+                if file_mode == "a":
+                    text += "\n"
+                with open(self._out_dir / filename, file_mode, encoding="utf-8") as handle:
+                    handle.write(text)
+            except Exception as exc:  # pragma: no cover - diagnostics must never take the app down
+                with open(self._out_dir / "diagnostics_errors.log", "a", encoding="utf-8") as handle:
+                    handle.write(f"{filename}: {exc!r}\n")
+
+
+_active_writer: DiagnosticsWriter | None = None
+_install_qt_handler: Callable[[Any], Any] | None = None
+_previous_qt_handler: Callable[[Any, Any, str], None] | None = None
+
+
+def diagnostics_dir_from_env() -> str | None:
+    """Return the directory requested via ``LUNAQT_DIAGNOSTICS`` (``1`` means the default)."""
+
+    value = os.environ.get(DIAGNOSTICS_ENV_VAR, "").strip()
+    if not value or value.lower() in {"0", "false", "no", "off"}:
+        return None
+    if value.lower() in {"1", "true", "yes", "on"}:
+        return DEFAULT_DIAGNOSTICS_DIR
+    return value
+
+
+def enable_diagnostics(out_dir: str | Path = DEFAULT_DIAGNOSTICS_DIR) -> DiagnosticsWriter:
+    global _active_writer
+    if _active_writer is None:
+        _active_writer = DiagnosticsWriter(Path(out_dir))
+    return _active_writer
+
+
+def disable_diagnostics() -> None:
+    global _active_writer, _install_qt_handler, _previous_qt_handler
+    install, _install_qt_handler = _install_qt_handler, None
+    if install is not None:
+        install(_previous_qt_handler)
+        _previous_qt_handler = None
+    writer, _active_writer = _active_writer, None
+    if writer is not None:
+        writer.close()
+
+
+def install_qt_message_handler(install: Callable[[Any], Any]) -> None:
+    """Log Qt messages through ``install`` (``qInstallMessageHandler``) until diagnostics are disabled.
+
+    The handler it replaces keeps receiving every message and is put back by
+    :func:`disable_diagnostics`.
+    """
+
+    global _install_qt_handler, _previous_qt_handler
+    if _install_qt_handler is not None:
+        return
+    _previous_qt_handler = install(qt_message_handler)
+    _install_qt_handler = install
+
+
+def active_writer() -> DiagnosticsWriter | None:
+    return _active_writer
+
+
+def record_style(mode: Any, metrics: Any) -> None:
+    """Queue the rendered application QSS and the effective metrics."""
+
+    writer = _active_writer
+    if writer is None:
+        return
+
+    def render_qss() -> str:
+        from style_loader import build_application_qss
+
+        return build_application_qss(mode=mode, metrics=metrics)
+
+    writer.write_text(QSS_DUMP_FILENAME, render_qss)
+    writer.write_text(METRICS_FILENAME, lambda: json.dumps({"mode": str(mode.value), **asdict(metrics)}, indent=2))
+
+
+def record_font_registry(registry: Any) -> None:
+    """Queue a snapshot of which bundled families are registered."""
+
+    writer = _active_writer
+    if writer is None:
+        return
+    snapshot = {
+        "font_root": str(registry.font_root),
+        "registered": [family for family in registry.known_families() if registry.is_registered(family)],
+        "pending": list(registry.pending_families()),
+    }
+    writer.write_text(FONTS_FILENAME, lambda: json.dumps(snapshot, indent=2))
+
+
+def record_first_frame(time_to_first_frame_ms: float) -> None:
+    writer = _active_writer
+    if writer is None:
+        return
+    writer.write_text(STARTUP_FILENAME, json.dumps({"time_to_first_frame_ms": round(time_to_first_frame_ms, 3)}))
+
+
+def qt_message_handler(mode, context, message) -> None:  # pragma: no cover - called by Qt
+    writer = _active_writer
+    if writer is not None:
+        stamp = time.strftime("%H:%M:%S")
+        category = getattr(context, "category", None) or "default"
+        writer.append_line(QT_MESSAGES_FILENAME, f"{stamp} {getattr(mode, 'name', mode)} [{category}] {message}")
+    previous = _previous_qt_handler
+    if previous is not None:
+        previous(mode, context, message)
+    else:
+        # Qt's default handler prints the bare message to stderr.
+        print(message, file=sys.stderr)
+
+
+__all__ = [
+    "DEFAULT_DIAGNOSTICS_DIR",
+    "DIAGNOSTICS_ENV_VAR",
+    "DiagnosticsWriter",
+    "active_writer",
+    "diagnostics_dir_from_env",
+    "disable_diagnostics",
+    "enable_diagnostics",
+    "install_qt_message_handler",
+    "qt_message_handler",
+    "record_first_frame",
+    "record_font_registry",
+    "record_style",
+]
@@ -1,49 +1,207 @@
-"""Utilities for loading fonts bundled with the application."""
+"""Utilities for loading fonts bundled with the application.
+
+Fonts are registered per family through :class:`FontRegistry`. Startup only
+registers the active UI family; other families register when they are first
+requested (or one at a time while the UI is idle). Font files are located via
+``font_manifest.json`` rather than walking the fonts directory, and are read
+from the memory-mapped asset bundle when one has been built. When
+``src/tools/subset_fonts.py`` has produced subsets, those are used instead of
+the full font files.
+"""
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Mapping, Sequence
+
+from assets.fonts.font_lists import BUNDLED_FONT_DIRECTORIES, PREFER_SUBSET_FONTS
+from utils.asset_bundle import AssetBundle, open_default_bundle
+from utils.tracing import span, traced
 
 FONT_EXTENSIONS: Sequence[str] = (".ttf", ".otf")
 IGNORE_DIRECTORIES = {"temp-font-downloads", "__pycache__"}
+MANIFEST_FILENAME = "font_manifest.json"
+BUNDLE_PREFIX = "fonts/"
+DEFAULT_FONT_ROOT = Path(__file__).resolve().parents[1] / "assets" / "fonts"
+SUBSET_FONT_ROOT = DEFAULT_FONT_ROOT / "subsets"
 
 
 def _iter_font_files(root: Path) -> Iterable[Path]:
-    for entry in root.iterdir():
-        if not entry.is_dir() or entry.name in IGNORE_DIRECTORIES or entry.name.startswith('.'):
+    for font_file in sorted(root.iterdir()):
+        if font_file.is_file() and font_file.suffix.lower() in FONT_EXTENSIONS:
+            yield font_file
+
+
+def build_font_manifest(font_root: Path | None = None) -> dict[str, list[str]]:
+    """Return a family -> font files mapping (paths relative to ``font_root``)."""
+
+    root = font_root or DEFAULT_FONT_ROOT
+    manifest: dict[str, list[str]] = {}
+    for family, directory in BUNDLED_FONT_DIRECTORIES.items():
+        family_dir = root / directory
+        if not family_dir.is_dir() or directory in IGNORE_DIRECTORIES:
             continue
-        for font_file in entry.rglob("*"):
-            if font_file.is_file() and font_file.suffix.lower() in FONT_EXTENSIONS:
-                yield font_file
+        manifest[family] = [font_file.relative_to(root).as_posix() for font_file in _iter_font_files(family_dir)]
+    return manifest
+
+
+def write_font_manifest(font_root: Path | None = None) -> Path:
+    """Regenerate ``font_manifest.json`` next to the bundled fonts."""
+
+    root = font_root or DEFAULT_FONT_ROOT
+    manifest_path = root / MANIFEST_FILENAME
+    manifest_path.write_text(json.dumps(build_font_manifest(root), indent=2) + "\n", encoding="utf-8")
+    return manifest_path
+
+
+@lru_cache(maxsize=4)
+def load_font_manifest(font_root: Path | None = None) -> Mapping[str, tuple[str, ...]]:
+    """Return the cached family -> files manifest, scanning only if it is missing."""
+
+    root = font_root or DEFAULT_FONT_ROOT
+    manifest_path = root / MANIFEST_FILENAME
+    try:
+        raw_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        raw_manifest = build_font_manifest(root)
+    return {family: tuple(files) for family, files in raw_manifest.items()}
+
+
+def default_font_root() -> Path:
+    """Return the subset font root if subsets have been built, else the full fonts."""
+
+    if PREFER_SUBSET_FONTS and (SUBSET_FONT_ROOT / MANIFEST_FILENAME).is_file():
+        return SUBSET_FONT_ROOT
+    return DEFAULT_FONT_ROOT
+
+
+def font_bundle_prefix(font_root: Path) -> str:
+    """Return the asset bundle name prefix for files under ``font_root``."""
+
+    try:
+        relative_root = font_root.relative_to(DEFAULT_FONT_ROOT).as_posix()
+    except ValueError:
+        return BUNDLE_PREFIX
+    return BUNDLE_PREFIX if relative_root == "." else f"{BUNDLE_PREFIX}{relative_root}/"
+
+
+class FontRegistry:
+    """Registers bundled font families with Qt's font database on demand."""
+
+    def __init__(self, font_root: Path | None = None, bundle: AssetBundle | None = None) -> None:
+        self._root = font_root or default_font_root()
+        self._manifest = load_font_manifest(self._root)
+        # The packed bundle mirrors the default font root only.
+        self._bundle = bundle if bundle is not None or font_root is not None else open_default_bundle()
+        self._bundle_prefix = font_bundle_prefix(self._root)
+        self._registered: dict[str, list[str]] = {}
 
+    @property
+    def font_root(self) -> Path:
+        return self._root
 
+    def known_families(self) -> tuple[str, ...]:
+        return tuple(self._manifest)
+
+    def is_registered(self, family: str) -> bool:
+        return family in self._registered
+
+    def pending_families(self) -> tuple[str, ...]:
+        return tuple(family for family in self._manifest if family not in self._registered)
+
+    def family_files(self, family: str) -> tuple[Path, ...]:
+        return tuple(self._root / relative for relative in self._manifest.get(family, ()))
+
+    def ensure_family(self, family: str) -> list[str]:
+        """Register ``family`` if needed; returns the Qt family names it provides.
+
+        Unknown families and missing files are ignored so startup stays
+        resilient on systems where a subset of fonts is unavailable.
+        """
+
+        if family in self._registered:
+            return self._registered[family]
+        with span("FontRegistry.ensure_family", family=family):
+            loaded = self._register_files(self._manifest.get(family, ()))
+        self._registered[family] = loaded
+        return loaded
+
+    def register_next_pending(self) -> str | None:
+        """Register one not-yet-registered family (for idle-time preloading)."""
+
+        for family in self._manifest:
+            if family not in self._registered:
+                self.ensure_family(family)
+                return family
+        return None
+
+    def register_all(self) -> list[str]:
+        loaded: list[str] = []
+        for family in self._manifest:
+            loaded.extend(self.ensure_family(family))
+        return loaded
+
+    def _register_files(self, relative_files: Iterable[str]) -> list[str]:
+        try:
+            from PySide6.QtGui import QFontDatabase
+        except ModuleNotFoundError:
+            return []
+
+        loaded_families: list[str] = []
+        for relative in relative_files:
+            font_id = self._register_file(QFontDatabase, relative)
+            if font_id == -1:
+                continue
+            loaded_families.extend(QFontDatabase.applicationFontFamilies(font_id))
+        return loaded_families
+
+    def _register_file(self, font_database, relative: str) -> int:
+        bundle_name = self._bundle_prefix + relative
+        if self._bundle is not None and bundle_name in self._bundle:
+            with span("addApplicationFontFromData", file=relative):
+                return font_database.addApplicationFontFromData(bytes(self._bundle.read(bundle_name)))
+        font_path = self._root / relative
+        if not font_path.is_file():
+            return -1
+        with span("addApplicationFont", file=font_path.name):
+            return font_database.addApplicationFont(str(font_path))
+
+
+_registry: FontRegistry | None = None
+
+
+def get_font_registry() -> FontRegistry:
+    """Return the process-wide registry for the default font root."""
+
+    global _registry
+    if _registry is None:
+        _registry = FontRegistry()
+    return _registry
+
+
+@traced("load_bundled_fonts")
 def load_bundled_fonts(font_root: Path | None = None) -> list[str]:
-    """Register bundled fonts with Qt's font database.
+    """Register every bundled font with Qt's font database.
 
-    Returns a list of font family names that were successfully loaded. Any
-    failures are silently ignored to keep startup resilient on systems where a
-    subset of fonts may be missing.
+    Prefer ``get_font_registry().ensure_family(...)``, which only registers
+    the families that are actually used.
     """
 
-    try:
-        from PySide6.QtGui import QFontDatabase
-    except ModuleNotFoundError:
-        return []
-
-    src_dir = Path(__file__).resolve().parents[1]
-    default_root = src_dir / "assets" / "fonts"
-    root = font_root or default_root
-    if not root.exists():
-        return []
-
-    loaded_families: list[str] = []
-    for font_path in _iter_font_files(root):
-        font_id = QFontDatabase.addApplicationFont(str(font_path))
-        if font_id == -1:
-            continue
-        loaded_families.extend(QFontDatabase.applicationFontFamilies(font_id))
-    return loaded_families
+    registry = get_font_registry() if font_root is None else FontRegistry(font_root)
+    return registry.register_all()
 
 
-__all__ = ["load_bundled_fonts"]
+__all__ = [
+    "BUNDLE_PREFIX",
+    "FontRegistry",
+    "SUBSET_FONT_ROOT",
+    "build_font_manifest",
+    "default_font_root",
+    "font_bundle_prefix",
+    "get_font_registry",
+    "load_bundled_fonts",
+    "load_font_manifest",
+    "write_font_manifest",
+]
@@ -1,6 +1,7 @@
 """UUID generation utilities for cells and notebooks."""
 
 from __future__ import annotations
+import os
 import uuid
 
 
@@ -13,6 +14,29 @@ def generate_cell_id() -> str:
     return str(uuid.uuid4())
 
 
+def generate_cell_ids(count: int) -> list[str]:
+    """Generate ``count`` unique cell IDs at once.
+
+    Draws the random bytes for all IDs in a single ``os.urandom`` call, which
+    is several times faster than calling :func:`generate_cell_id` in a loop
+    when a large notebook is created or imported.
+
+    Returns:
+        UUID4 strings, in the same format as :func:`generate_cell_id`.
+    """
+    raw = os.urandom(16 * count)
+    cell_ids = []
+    for start in range(0, 16 * count, 16):
+        value = bytearray(raw[start:start + 16])
+        value[6] = value[6] & 0x0F | 0x40  # version 4
+        value[8] = value[8] & 0x3F | 0x80  # RFC 4122 variant
+        hex_value = value.hex()
+        cell_ids.append(
+            f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-{hex_value[16:20]}-{hex_value[20:]}"
+        )
+    return cell_ids
+
+
 def generate_notebook_id() -> str:
     """Generate a unique notebook ID.
     
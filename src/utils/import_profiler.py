@@ -0,0 +1,117 @@
+"""Per-module import timing used by the ``--profile-imports`` switch."""
+
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass
+from importlib.abc import Loader, MetaPathFinder
+from typing import Any, TextIO
+
+
+@dataclass(slots=True)
+class ImportRecord:
+    """Timing for a single module import, in microseconds."""
+
+    name: str
+    depth: int
+    self_us: int = 0
+    cumulative_us: int = 0
+
+
+class _TimedLoader(Loader):
+    """Wrap a loader so module creation and execution are timed."""
+
+    def __init__(self, loader: Loader, profiler: "ImportProfiler", name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        self._profiler._enter(self._name)
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(self._name)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """Meta path hook that records self and cumulative time of every import.
+
+    Timings nest like ``python -X importtime``: a module's self time excludes
+    the modules it imports while executing.
+    """
+
+    def __init__(self) -> None:
+        self._records: list[ImportRecord] = []
+        self._stack: list[tuple[ImportRecord, float, float]] = []
+        self._resolving = False
+        self._reported = 0
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if self._resolving:
+            return None
+        self._resolving = True
+        try:
+            spec = self._find_with_remaining_finders(fullname, path, target)
+        finally:
+            self._resolving = False
+        if spec is None or spec.loader is None:
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _find_with_remaining_finders(self, fullname, path, target):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                return spec
+        return None
+
+    def _enter(self, name: str) -> None:
+        record = ImportRecord(name=name, depth=len(self._stack))
+        self._records.append(record)
+        self._stack.append((record, time.perf_counter(), 0.0))
+
+    def _leave(self, name: str) -> None:
+        if not self._stack or self._stack[-1][0].name != name:
+            return
+        record, started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        record.cumulative_us = int(elapsed * 1e6)
+        record.self_us = int((elapsed - children) * 1e6)
+        if self._stack:
+            parent, parent_started, parent_children = self._stack[-1]
+            self._stack[-1] = (parent, parent_started, parent_children + elapsed)
+
+    def report(self, title: str, stream: TextIO | None = None) -> None:
+        """Print the imports recorded since the previous report."""
+
+        stream = stream or sys.stderr
+        records = self._records[self._reported:]
+        self._reported = len(self._records)
+        total_us = sum(record.self_us for record in records)
+        print(f"--- {title}: {len(records)} modules, {total_us / 1000:.1f} ms ---", file=stream)
+        print(f"{'self [us]':>10} | {'cumulative':>10} | module", file=stream)
+        for record in records:
+            indent = "  " * record.depth
+            print(f"{record.self_us:>10} | {record.cumulative_us:>10} | {indent}{record.name}", file=stream)
+
+
+__all__ = ["ImportProfiler", "ImportRecord"]
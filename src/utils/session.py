@@ -0,0 +1,105 @@
+"""Warm-start session snapshot (preferences, theme and window layout).
+
+The snapshot is a small JSON file read by ``main.py`` before any stylesheet
+is built, so the first stylesheet applied already reflects the last session.
+Only the standard library is used; the file is replaced atomically on save.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+SESSION_VERSION = 1
+SESSION_ENV_VAR = "LUNAQT_SESSION_FILE"
+SESSION_FILENAME = "session.json"
+APP_DIRNAME = "LunaQt2"
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """State restored on the next launch; every field is optional."""
+
+    mode: str | None = None
+    notebook_mode: str | None = None
+    ui_font_size: int | None = None
+    ui_font_family: str | None = None
+    geometry: str | None = None  # base64 of QWidget.saveGeometry()
+    visible_sidebar: str | None = None
+    sidebar_widths: dict[str, int] = field(default_factory=dict)
+    selected_cell: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"version": SESSION_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SessionSnapshot | None":
+        """Build a snapshot, dropping fields whose type does not match."""
+        if not isinstance(data, dict) or data.get("version") != SESSION_VERSION:
+            return None
+        values: dict[str, Any] = {}
+        for snapshot_field in fields(cls):
+            value = data.get(snapshot_field.name)
+            if snapshot_field.name == "sidebar_widths":
+                if isinstance(value, dict):
+                    values["sidebar_widths"] = {
+                        str(name): width for name, width in value.items() if isinstance(width, int)
+                    }
+                continue
+            expected = int if snapshot_field.name in {"ui_font_size", "selected_cell"} else str
+            if isinstance(value, expected) and not isinstance(value, bool):
+                values[snapshot_field.name] = value
+        return cls(**values)
+
+
+def default_session_path() -> Path:
+    """Return ``$LUNAQT_SESSION_FILE`` or the per-user config location."""
+
+    override = os.environ.get(SESSION_ENV_VAR)
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = Path(os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming")
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config")
+    return base / APP_DIRNAME / SESSION_FILENAME
+
+
+def load_session(path: Path | None = None) -> SessionSnapshot | None:
+    """Read the snapshot; a missing or unreadable file yields ``None``."""
+
+    session_path = path or default_session_path()
+    try:
+        data = json.loads(session_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return SessionSnapshot.from_dict(data)
+
+
+def save_session(snapshot: SessionSnapshot, path: Path | None = None) -> Path:
+    """Write the snapshot atomically (temp file + ``os.replace``)."""
+
+    session_path = path or default_session_path()
+    session_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = session_path.with_suffix(session_path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(snapshot.to_dict(), handle, separators=(",", ":"))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, session_path)
+    return session_path
+
+
+__all__ = [
+    "SESSION_ENV_VAR",
+    "SessionSnapshot",
+    "default_session_path",
+    "load_session",
+    "save_session",
+]
@@ -0,0 +1,154 @@
+"""Single-instance support: later launches hand their arguments to the running app.
+
+The running instance listens on a ``QLocalServer``. A new launch calls
+:func:`forward_to_running_instance` before importing Qt; on POSIX it talks to
+the server's Unix socket with the standard library, so a forwarded launch
+exits within milliseconds. Windows uses ``QLocalSocket`` on a named pipe.
+
+Messages are one JSON line, ``{"argv": [...], "cwd": "..."}``, answered with
+``ok``. A socket file left behind by a crashed instance refuses connections;
+the server detects that and removes it before listening.
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+SERVER_BASENAME = "lunaqt2"
+FORWARD_TIMEOUT_S = 0.5
+_REPLY_OK = b"ok\n"
+
+
+def instance_server_name() -> str:
+    """Return the per-user server name (a socket path on POSIX, a pipe name on Windows)."""
+
+    try:
+        user = getpass.getuser()
+    except Exception:  # pragma: no cover - unusual environments without a login name
+        user = "user"
+    name = f"{SERVER_BASENAME}-{user}"
+    if os.name == "nt":
+        return name
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return str(Path(runtime_dir) / f"{name}.sock")
+
+
+def _encode_request(argv: Sequence[str]) -> bytes:
+    return json.dumps({"argv": list(argv), "cwd": os.getcwd()}).encode("utf-8") + b"\n"
+
+
+def forward_to_running_instance(argv: Sequence[str], *, timeout: float = FORWARD_TIMEOUT_S) -> bool:
+    """Send ``argv`` to a running instance; returns False if none answered."""
+
+    server_name = instance_server_name()
+    if os.name == "nt":
+        return _forward_with_qt(server_name, _encode_request(argv), timeout)
+    if not os.path.exists(server_name):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(server_name)
+            client.sendall(_encode_request(argv))
+            reply = client.recv(len(_REPLY_OK))
+        except OSError:
+            return False
+    return reply == _REPLY_OK
+
+
+def _forward_with_qt(server_name: str, payload: bytes, timeout: float) -> bool:  # pragma: no cover - Windows
+    try:
+        from PySide6.QtNetwork import QLocalSocket
+    except ModuleNotFoundError:
+        return False
+    client = QLocalSocket()
+    client.connectToServer(server_name)
+    timeout_ms = int(timeout * 1000)
+    if not client.waitForConnected(timeout_ms):
+        return False
+    client.write(payload)
+    if not client.waitForBytesWritten(timeout_ms) or not client.waitForReadyRead(timeout_ms):
+        return False
+    reply = bytes(client.readAll())
+    client.disconnectFromServer()
+    return reply == _REPLY_OK
+
+
+def _server_is_alive(server_name: str) -> bool:
+    from PySide6.QtNetwork import QLocalSocket
+
+    probe = QLocalSocket()
+    probe.connectToServer(server_name)
+    alive = probe.waitForConnected(int(FORWARD_TIMEOUT_S * 1000))
+    if alive:
+        probe.disconnectFromServer()
+    return alive
+
+
+def start_instance_server(on_request: Callable[[list[str], str], None], parent: Any = None) -> Any:
+    """Listen for forwarded launches; returns the ``QLocalServer`` or None.
+
+    ``on_request(argv, cwd)`` runs on the GUI thread for every forwarded
+    launch. None is returned when another live instance already owns the name.
+    """
+
+    try:
+        from PySide6.QtNetwork import QLocalServer
+    except ModuleNotFoundError:
+        return None
+
+    server_name = instance_server_name()
+    server = QLocalServer(parent)
+    server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+    if not server.listen(server_name):
+        if _server_is_alive(server_name):
+            return None
+        # Left behind by an instance that did not shut down cleanly.
+        QLocalServer.removeServer(server_name)
+        if not server.listen(server_name):
+            return None
+
+    def accept() -> None:
+        while server.hasPendingConnections():
+            _serve_connection(server.nextPendingConnection(), on_request)
+
+    server.newConnection.connect(accept)
+    return server
+
+
+def _serve_connection(connection: Any, on_request: Callable[[list[str], str], None]) -> None:
+    buffer = bytearray()
+
+    def read() -> None:
+        buffer.extend(bytes(connection.readAll()))
+        if not buffer.endswith(b"\n"):
+            return
+        try:
+            request = json.loads(buffer.decode("utf-8"))
+            argv = [str(arg) for arg in request.get("argv", [])]
+            cwd = str(request.get("cwd") or os.getcwd())
+        except (ValueError, AttributeError):
+            connection.disconnectFromServer()
+            return
+        connection.write(_REPLY_OK)
+        connection.flush()
+        connection.disconnectFromServer()
+        on_request(argv, cwd)
+
+    connection.readyRead.connect(read)
+    connection.disconnected.connect(connection.deleteLater)
+    if connection.bytesAvailable():
+        read()
+
+
+__all__ = [
+    "forward_to_running_instance",
+    "instance_server_name",
+    "start_instance_server",
+]
@@ -0,0 +1,189 @@
+"""Lightweight span tracing with Chrome trace (Perfetto) JSON export.
+
+Tracing is off until :func:`enable_tracing` is called. While disabled,
+:func:`span` returns a shared no-op context manager and :func:`traced`
+wrappers forward straight to the wrapped function, so instrumented code
+costs one global lookup per call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+DEFAULT_CAPACITY = 65536
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, args: dict[str, Any] | None) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._tracer._record(self._name, self._start_ns, time.perf_counter_ns(), self._args)
+
+
+class Tracer:
+    """Collects completed spans in a bounded ring buffer.
+
+    The oldest spans are dropped once ``capacity`` is reached, so a tracer can
+    stay enabled for a whole session without growing without bound.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._events: deque[tuple[str, int, int | None, int, dict[str, Any] | None]] = deque(maxlen=capacity)
+        self._thread_names: dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(self, name: str, args: dict[str, Any] | None = None) -> _Span:
+        return _Span(self, name, args)
+
+    def instant(self, name: str, args: dict[str, Any] | None = None) -> None:
+        self._record(name, time.perf_counter_ns(), None, args)
+
+    def _record(self, name: str, start_ns: int, end_ns: int | None, args: dict[str, Any] | None) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._events.append((name, start_ns, end_ns, thread_id, args))
+
+    def chrome_trace_events(self) -> list[dict[str, Any]]:
+        """Return the buffered spans as Chrome trace event dictionaries."""
+
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in self._thread_names.items()
+        ]
+        for name, start_ns, end_ns, thread_id, args in list(self._events):
+            event: dict[str, Any] = {
+                "name": name,
+                "pid": pid,
+                "tid": thread_id,
+                "ts": (start_ns - self._origin_ns) / 1000,
+            }
+            if end_ns is None:
+                event["ph"] = "i"
+                event["s"] = "t"
+            else:
+                event["ph"] = "X"
+                event["dur"] = (end_ns - start_ns) / 1000
+            if args:
+                event["args"] = args
+            events.append(event)
+        return events
+
+    def export_chrome_trace(self, path: str | Path) -> int:
+        """Write a Chrome trace JSON file and return the number of spans written."""
+
+        events = self.chrome_trace_events()
+        payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(payload), encoding="utf-8")
+        return len(self._events)
+
+
+_active_tracer: Tracer | None = None
+
+
+def enable_tracing(capacity: int = DEFAULT_CAPACITY) -> Tracer:
+    """Start recording spans process-wide and return the active tracer."""
+
+    global _active_tracer
+    if _active_tracer is None:
+        _active_tracer = Tracer(capacity)
+    return _active_tracer
+
+
+def disable_tracing() -> None:
+    global _active_tracer
+    _active_tracer = None
+
+
+def active_tracer() -> Tracer | None:
+    return _active_tracer
+
+
+def span(name: str, **args: Any) -> _Span | _NullSpan:
+    """Return a context manager that records ``name`` while tracing is enabled."""
+
+    tracer = _active_tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, args or None)
+
+
+def instant(name: str, **args: Any) -> None:
+    """Record a zero-duration marker (e.g. "first frame")."""
+
+    tracer = _active_tracer
+    if tracer is not None:
+        tracer.instant(name, args or None)
+
+
+def traced(name: str | None = None) -> Callable[[_F], _F]:
+    """Decorate a function so each call is recorded as a span."""
+
+    def decorator(func: _F) -> _F:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _active_tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def export_chrome_trace(path: str | Path) -> int:
+    """Export the active tracer's spans; returns 0 when tracing is disabled."""
+
+    tracer = _active_tracer
+    if tracer is None:
+        return 0
+    return tracer.export_chrome_trace(path)
+
+
+__all__ = [
+    "Tracer",
+    "active_tracer",
+    "disable_tracing",
+    "enable_tracing",
+    "export_chrome_trace",
+    "instant",
+    "span",
+    "traced",
+]
@@ -42,11 +42,6 @@ def get_qss(
             border-radius: {spacing.border_radius}px;
             padding: {spacing.padding}px;
         }}
-
-        {CELL_SELECTOR}[state="focused"],
-        {CELL_SELECTOR}[state="selected"] {{
-            border-color: {border.cell_in_focus};
-        }}
         """
     ).strip()
 
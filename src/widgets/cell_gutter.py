@@ -20,7 +20,6 @@ def get_qss(
     metrics = theme.metrics
     spacing = cell_gutter_tokens(metrics)
     bg = theme.bg
-    border = theme.border
     text = theme.text
 
     gutter = dedent(
@@ -32,11 +31,6 @@ def get_qss(
             padding: 0 {spacing.padding_horizontal}px;
             color: {text.muted};
         }}
-
-        {GUTTER_SELECTOR}[state="focused"],
-        {GUTTER_SELECTOR}[state="selected"] {{
-            border-color: {border.cell_in_focus};
-        }}
         """
     ).strip()
 